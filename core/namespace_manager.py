@@ -19,6 +19,10 @@ class NamespaceManager:
                             Dict[int, Dict[str, Set[str] | str]]] = {}
         self.default_ns_prefixes: Dict[Tuple[str, str],
                                        Dict[int, Dict[str, Set[str] | str]]] = {}
+        # Готовые пункты комбобокса: (family, lang, подпись «Авто», есть ли info)
+        self._ns_items_cache: Dict[tuple, list] = {}
+        # Кортежи префиксов (локальные + английские): (family, lang, frozenset(ns_ids))
+        self._policy_prefix_cache: Dict[tuple, Tuple[str, ...]] = {}
 
     def _t(self, key: str) -> str:
         return translate_runtime(key, '')
@@ -238,6 +242,8 @@ class NamespaceManager:
 
         if prefixes_by_id:
             self.ns_cache[key] = prefixes_by_id
+            self._ns_items_cache.clear()
+            self._policy_prefix_cache.clear()
             # Save disk cache
             try:
                 to_dump = {
@@ -259,6 +265,8 @@ class NamespaceManager:
         preset = self.default_ns_prefixes.get((family or '', lang or ''))
         if isinstance(preset, dict) and preset:
             self.ns_cache[key] = preset
+            self._ns_items_cache.clear()
+            self._policy_prefix_cache.clear()
             debug(
                 f"NS fallback preset used: {family}/{lang} → {len(preset)} namespaces")
             return preset
@@ -283,9 +291,10 @@ class NamespaceManager:
             allp = d.get('all') or set()
             if isinstance(allp, set):
                 prefixes |= allp
+        if not prefixes:
+            return False
         t = (title or '').lstrip('\ufeff')
-        lower = t.casefold()
-        return any(lower.startswith(p) for p in prefixes)
+        return t.casefold().startswith(tuple(prefixes))
 
     def _has_en_prefix(self, title: str, ns_id: int) -> bool:
         """Check if title has English namespace prefix."""
@@ -297,15 +306,38 @@ class NamespaceManager:
             candidates.add(base.casefold() if base.endswith(':')
                            else (base + ':').casefold())
         candidates |= set(EN_PREFIX_ALIASES.get(ns_id, set()))
-        return any(lower.startswith(p) for p in candidates) if candidates else False
+        return lower.startswith(tuple(candidates)) if candidates else False
+
+    def policy_prefixes(self, family: str, lang: str, ns_ids: Set[int]) -> Tuple[str, ...]:
+        """All casefolded prefixes (local and English) for *ns_ids*, cached per project."""
+        key = (family, lang, frozenset(ns_ids))
+        cached = self._policy_prefix_cache.get(key)
+        if cached is not None:
+            return cached
+        info = self._load_ns_info(family, lang)
+        prefixes: Set[str] = set()
+        for i in ns_ids:
+            d = info.get(i) or {}
+            allp = d.get('all') or set()
+            if isinstance(allp, set):
+                prefixes |= allp
+            base = (DEFAULT_EN_NS.get(i) or '').strip()
+            if base:
+                prefixes.add(base.casefold() if base.endswith(':')
+                              else (base + ':').casefold())
+            prefixes |= set(EN_PREFIX_ALIASES.get(i, set()))
+        result = tuple(prefixes)
+        # Без загруженных данных не кэшируем: следующая попытка может получить локальные префиксы
+        if (family, lang) in self.ns_cache:
+            self._policy_prefix_cache[key] = result
+        return result
 
     def has_prefix_by_policy(self, family: str, lang: str, title: str, ns_ids: Set[int]) -> bool:
         """Check if title has prefix according to policy (local or English)."""
-        # First check local prefixes
-        if self.title_has_ns_prefix(family, lang, title, ns_ids):
-            return True
-        # Then English prefixes
-        return any(self._has_en_prefix(title, ns) for ns in ns_ids)
+        prefixes = self.policy_prefixes(family, lang, ns_ids)
+        if not prefixes:
+            return False
+        return (title or '').lstrip('\ufeff').casefold().startswith(prefixes)
 
     def strip_ns_prefix(self, family: str, lang: str, title: str, ns_id: int) -> str:
         """
@@ -455,14 +487,6 @@ class NamespaceManager:
         except Exception:
             pass
 
-        try:
-            combo.clear()
-        except Exception:
-            pass
-
-        combo.addItem(self._t('ui.auto'), 'auto')
-        combo.addItem(self._t('ui.no_namespace_root'), 0)
-
         # Предпочитаем кэш, чтобы не дергать сеть лишний раз
         info = None
         if not force_load:
@@ -471,31 +495,45 @@ class NamespaceManager:
         if info is None and force_load:
             info = self._load_ns_info(family or 'wikipedia', lang or 'ru')
 
-        if info:
-            ns_ids = sorted(info.keys())
-            # debug(f"Получено {len(info)} пространств имён: {ns_ids}")  # Убираем спам
-        else:
-            ns_ids = self._common_ns_ids()
-            # debug(f"Используются общие пространства имён: {ns_ids}")  # Убираем спам
-
-        added_count = 0
-        for ns_id in ns_ids:
-            if ns_id == 0:
-                continue
-            label = f"{self._primary_label_for_ns(family, lang, ns_id)} [{ns_id}]"
-            combo.addItem(label, ns_id)
-            added_count += 1
-
-        # debug(f"Добавлено {added_count} элементов в комбобокс")  # Убираем спам
-
-        # Восстанавливаем ранее выбранное значение
+        auto_label = self._t('ui.auto')
+        items_key = (family, lang, auto_label, bool(info))
+        items = self._ns_items_cache.get(items_key)
+        if items is None:
+            if info:
+                ns_ids = sorted(info.keys())
+            else:
+                ns_ids = self._common_ns_ids()
+            items = [(auto_label, 'auto'), (self._t('ui.no_namespace_root'), 0)]
+            items.extend(
+                (f"{self._primary_label_for_ns(family, lang, ns_id)} [{ns_id}]", ns_id)
+                for ns_id in ns_ids if ns_id != 0
+            )
+            self._ns_items_cache[items_key] = items
+
+        # Перезаполняем одним проходом: без сигналов и перерисовки на каждый addItem
+        prev_index = combo.currentIndex()
+        was_blocked = combo.blockSignals(True)
+        combo.setUpdatesEnabled(False)
+        try:
+            combo.clear()
+            for label, data in items:
+                combo.addItem(label, data)
+        finally:
+            combo.setUpdatesEnabled(True)
+            combo.blockSignals(was_blocked)
+
+        # Восстанавливаем ранее выбранное значение (сигнал уйдёт связанным комбобоксам)
+        restored = False
         if saved_data is not None:
             try:
                 idx = combo.findData(saved_data)
                 if idx != -1:
                     combo.setCurrentIndex(idx)
+                    restored = True
             except Exception:
                 pass
+        if not restored and prev_index != combo.currentIndex() and not was_blocked:
+            combo.currentIndexChanged.emit(combo.currentIndex())
 
         self._adjust_combo_popup_width(combo)
 
@@ -575,6 +613,21 @@ def normalize_title_by_selection(title: str, family: str, lang: str, selection:
     return get_namespace_manager().normalize_title_by_selection(title, family, lang, selection)
 
 
+def resolve_ns_selection(selection: str | int | None) -> int | None:
+    """Разобрать выбор NS из комбобокса один раз: None для «Авто» (и некорректных значений), иначе ID."""
+    if selection is None or isinstance(selection, bool):
+        return None
+    if isinstance(selection, int):
+        return selection
+    text = str(selection).strip()
+    if not text or text.lower() == 'auto':
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        return None
+
+
 def _common_ns_ids() -> list[int]:
     return get_namespace_manager()._common_ns_ids()
 
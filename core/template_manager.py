@@ -4,6 +4,7 @@ Template management module for handling template rules and caching.
 import os
 import json
 import re
+import tempfile
 import mwparserfromhell
 from typing import Dict, List, Tuple, Any, Optional
 from threading import Event
@@ -11,6 +12,26 @@ from threading import Event
 from ..constants import TEMPLATE_RULES_FILE
 
 
+def write_rules_json(path: str, data: Any) -> None:
+    """Атомарно записать JSON правил: временный файл рядом + os.replace.
+
+    При сбое посреди записи на диске остаётся прежняя версия файла.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix='.template_rules.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 class TemplateManager:
     """Manages template rules, caching, and template parameter processing."""
     
@@ -279,9 +300,7 @@ class TemplateManager:
                     }
                 except Exception:
                     continue
-            file_data = by_project
-            with open(self._rules_file_path, 'w', encoding='utf-8') as f:
-                json.dump(file_data, f, ensure_ascii=False, indent=2)
+            write_rules_json(self._rules_file_path, by_project)
             try:
                 self._rules_mtime = os.path.getmtime(self._rules_file_path)
             except Exception:
@@ -8,7 +8,6 @@ from PySide6.QtWidgets import (
     QPushButton, QCheckBox
 )
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
 import webbrowser
 
 from ...core.localization import translate_key
@@ -29,6 +29,7 @@ from .widgets.ui_helpers import add_info_button as ui_add_info_button
 from .widgets.ui_helpers import force_on_top as ui_force_on_top
 from .widgets.ui_helpers import bring_to_front_sequence as ui_bring_to_front_sequence
 from .widgets.ui_helpers import install_localized_context_menu
+from .widgets.ui_helpers import AuthData
 from .widgets.ui_helpers import show_help_dialog as ui_show_help_dialog
 
 _DEFAULT_SESSION_PROJECT = 'wikipedia / ru'
@@ -3192,6 +3193,15 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
 
+    def get_auth(self) -> AuthData:
+        """Текущие данные авторизации для запуска воркеров."""
+        return AuthData(
+            self.current_user,
+            self.current_password,
+            self.current_lang or 'ru',
+            self.current_family or 'wikipedia',
+        )
+
     def _on_login_success(self, username: str, password: str, lang: str, family: str):
         """Обработка успешной авторизации"""
         self.current_user = username
@@ -865,8 +865,11 @@ class AuthTab(QWidget):
             f'color: {text_color};'
         )
         css_def = ''
+        css = css_ok if ok else css_def
         for w in (self.user_edit, self.pass_edit):
-            w.setStyleSheet(css_ok if ok else css_def)
+            # Повторная установка того же CSS заставляет Qt заново разбирать и применять стиль
+            if w.styleSheet() != css:
+                w.setStyleSheet(css)
         self.user_edit.setReadOnly(ok)
         self.pass_edit.setReadOnly(ok)
         self.lang_combo.setEnabled(not ok)
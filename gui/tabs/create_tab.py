@@ -27,8 +27,8 @@ from ..widgets.shared_panels import TsvPreviewPanel
 from ..widgets.ui_helpers import (
     add_info_button, pick_file,
     open_from_edit, log_message, set_start_stop_ratio,
-    tsv_preview_from_path, init_progress, inc_progress,
-    is_default_summary, count_non_empty_titles
+    tsv_preview_from_path, TSV_PREVIEW_MAX_ROWS, init_progress, inc_progress,
+    is_default_summary, count_non_empty_titles, get_auth_data
 )
 
 
@@ -282,7 +282,7 @@ class CreateTab(QWidget):
             return
 
         try:
-            left, right, count = tsv_preview_from_path(path)
+            left, right, count = tsv_preview_from_path(path, TSV_PREVIEW_MAX_ROWS)
         except Exception as e:
             QMessageBox.critical(
                 self, self._t('ui.error'), self._fmt('ui.failed_read_tsv', error=e))
@@ -323,10 +323,7 @@ class CreateTab(QWidget):
             return
 
         # Получаем данные из родительского окна (будет реализовано в main_window)
-        user = getattr(self.parent_window, 'current_user', None)
-        pwd = getattr(self.parent_window, 'current_password', None)
-        lang = getattr(self.parent_window, 'current_lang', 'ru')
-        fam = getattr(self.parent_window, 'current_family', 'wikipedia')
+        user, pwd, lang, fam = get_auth_data(self.parent_window)
 
         if not user or not pwd:
             QMessageBox.warning(self, self._t('ui.error'), self._t('ui.you_need_to_sign_in'))
@@ -18,8 +18,8 @@ from ...core.localization import translate_key
 from ...workers.parse_worker import ParseWorker
 from ..widgets.shared_panels import CategorySourcePanel
 from ..widgets.ui_helpers import (
-    add_info_button, pick_save, open_from_edit, log_message,
-    set_start_stop_ratio, create_log_wrap
+    add_info_button, pick_save, open_from_edit, open_path_detached,
+    log_message, set_start_stop_ratio, create_log_wrap
 )
 
 
@@ -36,6 +36,9 @@ class ParseTab(QWidget):
         self.current_user = None
         self.current_lang = None
         self.current_family = None
+        self._cached_family = None
+        self.language_changed.connect(self._invalidate_family_cache)
+        self.family_changed.connect(self._invalidate_family_cache)
         self.setup_ui()
 
     def _ui_lang(self) -> str:
@@ -111,7 +114,7 @@ class ParseTab(QWidget):
         except Exception:
             pass
         btn_browse_out.clicked.connect(
-            lambda: pick_save(self, self.out_path, '.tsv'))
+            lambda: pick_save(self, self.out_path, '.tsv', ('.tsv.gz',)))
         save_layout.addWidget(btn_browse_out)
 
         btn_open_out = QPushButton(self._t('ui.open'))
@@ -182,7 +185,19 @@ class ParseTab(QWidget):
         return self.source_panel.get_current_language()
 
     def get_current_family(self) -> str:
-        return self.source_panel.get_current_family()
+        if self._cached_family is None:
+            self._cached_family = self.source_panel.get_current_family()
+        return self._cached_family
+
+    def _invalidate_family_cache(self, *_args):
+        self._cached_family = None
+
+    def update_language(self, lang: str):
+        # Смена языка может переопределить current_family из комбобокса авторизации
+        self.language_changed.emit(lang)
+
+    def update_family(self, family: str):
+        self.family_changed.emit(family)
 
     def _processed_label(self) -> str:
         return self._t('ui.processed_short')
@@ -215,25 +230,28 @@ class ParseTab(QWidget):
         lang = self.get_current_language()
         fam = self.get_current_family()
 
-        self.parse_bar.setMaximum(len(titles))
-        self.parse_bar.setValue(0)
+        total = len(titles)
+        self.parse_bar.setUpdatesEnabled(False)
         try:
-            self.parse_bar.setFormat(f'{self._processed_label()} 0/{len(titles)}')
+            self.parse_bar.setMaximum(total)
+            self.parse_bar.setValue(0)
+            self.parse_bar.setFormat(f'{self._processed_label()} 0/{total}')
         except Exception:
             pass
+        finally:
+            self.parse_bar.setUpdatesEnabled(True)
         self.parse_btn.setEnabled(False)
 
         ns_sel = self.ns_combo_parse.currentData()
         log_message(
             self.parse_log,
-            self._fmt('log.parse.run_started', pages=len(titles), lang=lang, family=fam, ns=ns_sel),
+            self._fmt('log.parse.run_started', pages=total, lang=lang, family=fam, ns=ns_sel),
             debug,
         )
-        self.worker = ParseWorker(
-            titles, self.out_path.text(), ns_sel, lang, fam)
+        # Сжатие gzip ParseWorker выбирает сам — по расширению .gz
+        self.worker = ParseWorker(titles, self.out_path.text(), ns_sel, lang, fam)
         self.worker.item_processed.connect(self._inc_parse_prog)
-        self.worker.progress.connect(
-            lambda message: log_message(self.parse_log, message, debug))
+        self.worker.progress.connect(self._on_parse_progress)
         self.worker.finished.connect(self._on_parse_finished)
 
         try:
@@ -265,7 +283,7 @@ class ParseTab(QWidget):
             def _open_result():
                 try:
                     if out_path and os.path.isfile(out_path):
-                        os.startfile(out_path)
+                        open_path_detached(out_path)
                     else:
                         QMessageBox.information(
                             self,
@@ -310,6 +328,9 @@ class ParseTab(QWidget):
         except Exception:
             pass
 
+    def _on_parse_progress(self, message: str):
+        log_message(self.parse_log, message, debug)
+
     def _inc_parse_prog(self):
         val = self.parse_bar.value() + 1
         self.parse_bar.setValue(val)
@@ -322,11 +343,13 @@ class ParseTab(QWidget):
         self.current_user = username
         self.current_lang = lang
         self.current_family = family
+        self._invalidate_family_cache()
 
     def clear_auth_data(self):
         self.current_user = None
         self.current_lang = None
         self.current_family = None
+        self._invalidate_family_cache()
 
     def pick_file(self, line_edit, filter_str: str):
         from ..widgets.ui_helpers import pick_file
@@ -28,8 +28,9 @@ from ...workers.redundant_category_worker import RedundantCategoryWorker
 from ..widgets.shared_panels import CategorySourcePanel, TsvPreviewPanel
 from ..widgets.ui_helpers import (
     add_info_button, pick_file, open_from_edit, create_log_wrap,
-    make_clear_button, tsv_preview_from_path, init_progress, inc_progress,
-    log_message, set_start_stop_ratio, is_default_summary, check_tsv_format
+    make_clear_button, tsv_preview_from_path, TSV_PREVIEW_MAX_ROWS, init_progress, inc_progress,
+    log_message, set_start_stop_ratio, is_default_summary, check_tsv_format,
+    get_auth_data
 )
 
 
@@ -409,7 +410,7 @@ class RedundantCategoriesTab(QWidget):
             return
 
         try:
-            left, right, count = tsv_preview_from_path(path)
+            left, right, count = tsv_preview_from_path(path, TSV_PREVIEW_MAX_ROWS)
         except Exception as exc:
             QMessageBox.critical(
                 self,
@@ -464,10 +465,7 @@ class RedundantCategoriesTab(QWidget):
             )
             return
 
-        user = getattr(self.parent_window, 'current_user', None)
-        pwd = getattr(self.parent_window, 'current_password', None)
-        lang = getattr(self.parent_window, 'current_lang', 'ru')
-        fam = getattr(self.parent_window, 'current_family', 'wikipedia')
+        user, pwd, lang, fam = get_auth_data(self.parent_window)
 
         if not user or not pwd:
             QMessageBox.warning(
@@ -11,30 +11,30 @@
 - Настройку всех параметров переименования
 """
 
+import collections
 import os
-from datetime import datetime
+import re
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
     QComboBox, QPushButton, QToolButton, QSizePolicy, QProgressBar,
     QMessageBox, QCheckBox, QGroupBox
 )
-from PySide6.QtCore import Qt, Signal, QUrl, QEvent, QTimer
+from PySide6.QtCore import Qt, Signal, QUrl, QEvent, QTimer, QRegularExpression
 from PySide6.QtGui import QDesktopServices
 from PySide6.QtWidgets import QHeaderView
 
 from ...constants import PREFIX_TOOLTIP
 from ...core.localization import translate_key
-from ...utils import debug
-from ...workers.rename_worker import RenameWorker
-from ...core.template_manager import TemplateManager
-from ...core.pywikibot_config import apply_pwb_config, _dist_configs_dir
+from ...core.namespace_manager import resolve_ns_selection
+from ...utils import debug, resolve_project_family, resolve_project_language
 from ..widgets.ui_helpers import (
     add_info_button, pick_file, 
     open_from_edit, set_start_stop_ratio,
-    init_log_tree, log_tree_parse_and_add, log_tree_add, log_tree_add_event
+    init_log_tree, log_tree_parse_and_add, log_tree_add, log_tree_add_event,
+    log_tree_begin_batch, log_tree_end_batch,
+    log_timestamp, get_auth_data, ProgressCoalescer
 )
-from ..dialogs.template_review_dialog import TemplateReviewDialog
 
 
 class RenameTab(QWidget):
@@ -50,6 +50,8 @@ class RenameTab(QWidget):
         
         # Инициализация worker'а
         self.mrworker = None
+        # Путь к файлу правил (вычисляется один раз, сбрасывается при смене воркера)
+        self._rules_path_cache = None
         
         # Кэш template rules для UI
         self._template_auto_cache_ui = {}
@@ -62,6 +64,13 @@ class RenameTab(QWidget):
         self._rename_log_cols_user_resized = False
         self._rename_log_cols_auto_applying = False
         self._rename_log_col_ratios = (0.52, 0.28, 0.20)
+
+        # Очередь строк лога: сбрасывается в дерево пачкой по таймеру
+        self._log_queue = collections.deque()
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_log_queue)
         
         # Создание UI
         self.setup_ui()
@@ -71,22 +80,16 @@ class RenameTab(QWidget):
         ui_lang = getattr(self.parent_window, '_ui_lang', 'ru') if self.parent_window is not None else 'ru'
         # Основной layout
         v = QVBoxLayout(self)
-        try:
-            v.setContentsMargins(0, 0, 0, 0)
-            v.setSpacing(6)
-        except Exception:
-            pass
+        v.setContentsMargins(0, 0, 0, 0)
+        v.setSpacing(6)
         
         # Текст справки
         rename_help = translate_key('help.rename.main', ui_lang, '')
         
         # Строка выбора файла и настроек
         h = QHBoxLayout()
-        try:
-            h.setContentsMargins(0, 0, 0, 0)
-            h.setSpacing(6)
-        except Exception:
-            pass
+        h.setContentsMargins(0, 0, 0, 0)
+        h.setSpacing(6)
         
         # Поле файла с кнопкой
         self.rename_file_edit = QLineEdit('categories.tsv')
@@ -99,12 +102,9 @@ class RenameTab(QWidget):
         btn_browse_rename = QToolButton()
         btn_browse_rename.setText('…')
         btn_browse_rename.setAutoRaise(False)
-        try:
-            btn_browse_rename.setFixedSize(27, 27)
-            btn_browse_rename.setCursor(Qt.PointingHandCursor)
-            btn_browse_rename.setToolTip(self._t('ui.choose_file', 'Choose file'))
-        except Exception:
-            pass
+        btn_browse_rename.setFixedSize(27, 27)
+        btn_browse_rename.setCursor(Qt.PointingHandCursor)
+        btn_browse_rename.setToolTip(self._t('ui.choose_file', 'Choose file'))
         btn_browse_rename.clicked.connect(lambda: pick_file(self, self.rename_file_edit, '*.tsv'))
         h.addWidget(btn_browse_rename)
         
@@ -121,6 +121,9 @@ class RenameTab(QWidget):
         
         self.rename_ns_combo = QComboBox()
         self.rename_ns_combo.setEditable(False)
+        self.rename_ns_combo.setSizeAdjustPolicy(QComboBox.AdjustToContents)
+        # Древовидный лог вкладки читает выбранное NS через _ns_combo
+        self._ns_combo = self.rename_ns_combo
         # Заполнение будет происходить при установке языка/семейства
         h.addWidget(self.rename_ns_combo)
         
@@ -149,10 +152,7 @@ class RenameTab(QWidget):
         )
         self.phase1_enabled_cb = QCheckBox(phase1_main_label)
         self.phase1_enabled_cb.setChecked(True)
-        try:
-            self.phase1_enabled_cb.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
-        except Exception:
-            pass
+        self.phase1_enabled_cb.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
         row_p1.addWidget(self.phase1_enabled_cb)
         self.phase1_mode_hint = QLabel(phase1_mode_label)
         self.phase1_mode_hint.setObjectName('mutedParenText')
@@ -164,24 +164,15 @@ class RenameTab(QWidget):
             pass
         row_p1.addWidget(self.phase1_mode_hint)
         add_info_button(self, row_p1, phase1_help, inline=True)
-        try:
-            row_p1.addStretch(1)
-        except Exception:
-            pass
+        row_p1.addStretch(1)
         
         # Опция: переименовывать саму категорию
         row_move_cat = QHBoxLayout()
         self.move_members_cb = QCheckBox(self._t('ui.rename_pages'))
         self.move_members_cb.setChecked(True)
-        try:
-            self.move_members_cb.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
-        except Exception:
-            pass
+        self.move_members_cb.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
         row_move_cat.addWidget(self.move_members_cb)
-        try:
-            row_move_cat.addStretch(1)
-        except Exception:
-            pass
+        row_move_cat.addStretch(1)
         
         # Вторая опция: параметры шаблонов
         row_p2 = QHBoxLayout()
@@ -197,10 +188,7 @@ class RenameTab(QWidget):
         )
         self.find_in_templates_cb = QCheckBox(phase2_main_label)
         self.find_in_templates_cb.setChecked(True)
-        try:
-            self.find_in_templates_cb.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
-        except Exception:
-            pass
+        self.find_in_templates_cb.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
         row_p2.addWidget(self.find_in_templates_cb)
         self.phase2_mode_hint = QLabel(phase2_mode_label)
         self.phase2_mode_hint.setObjectName('mutedParenText')
@@ -212,10 +200,7 @@ class RenameTab(QWidget):
             pass
         row_p2.addWidget(self.phase2_mode_hint)
         add_info_button(self, row_p2, phase2_help, inline=True)
-        try:
-            row_p2.addStretch(1)
-        except Exception:
-            pass
+        row_p2.addStretch(1)
 
         # Опция: Локативы
         row_loc = QHBoxLayout()
@@ -231,10 +216,7 @@ class RenameTab(QWidget):
         )
         self.locatives_cb = QCheckBox(locative_main_label)
         self.locatives_cb.setChecked(False)
-        try:
-            self.locatives_cb.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
-        except Exception:
-            pass
+        self.locatives_cb.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
         row_loc.addWidget(self.locatives_cb)
         self.locatives_mode_hint = QLabel(locative_mode_label)
         self.locatives_mode_hint.setObjectName('mutedParenText')
@@ -246,10 +228,7 @@ class RenameTab(QWidget):
             pass
         row_loc.addWidget(self.locatives_mode_hint)
         add_info_button(self, row_loc, locative_help, inline=True)
-        try:
-            row_loc.addStretch(1)
-        except Exception:
-            pass
+        row_loc.addStretch(1)
         
         # Кнопки правил (будут прикреплены к правому заголовку)
         btn_show_rules = QPushButton(self._t('ui.show_replacement_rules'))
@@ -261,17 +240,11 @@ class RenameTab(QWidget):
         
         # Чекбоксы перенаправлений
         self.leave_cat_redirect_cb = QCheckBox(self._t('ui.leave_category_redirects'))
-        try:
-            self.leave_cat_redirect_cb.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Preferred)
-        except Exception:
-            pass
+        self.leave_cat_redirect_cb.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Preferred)
         self.leave_cat_redirect_cb.setChecked(False)
         
         self.leave_other_redirect_cb = QCheckBox(self._t('ui.leave_other_redirects'))
-        try:
-            self.leave_other_redirect_cb.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Preferred)
-        except Exception:
-            pass
+        self.leave_other_redirect_cb.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Preferred)
         self.leave_other_redirect_cb.setChecked(True)
         
         # Управление доступностью перенаправлений по галке «Переименовывать страницы»
@@ -283,66 +256,39 @@ class RenameTab(QWidget):
         except Exception:
             pass
         
-        # Утилита-обёртка для QHBoxLayout
-        def _wrap(layout_obj):
-            try:
-                w = QWidget()
-                lay = QHBoxLayout(w)
-                lay.setContentsMargins(0, 0, 0, 0)
-                lay.setSpacing(0)
-                lay.addLayout(layout_obj)
-                return w
-            except Exception:
-                return QWidget()
-
         # Рамка «Переименование»
         rename_opts_group = QGroupBox(self._t('ui.rename'))
         rename_opts_layout = QVBoxLayout(rename_opts_group)
-        try:
-            rename_opts_layout.setContentsMargins(10, 8, 10, 8)
-            rename_opts_layout.setSpacing(2)
-        except Exception:
-            pass
-        rename_opts_layout.addWidget(_wrap(row_move_cat))
+        rename_opts_layout.setContentsMargins(10, 8, 10, 8)
+        rename_opts_layout.setSpacing(2)
+        rename_opts_layout.addLayout(row_move_cat)
         row_redirect_cat = QHBoxLayout()
         row_redirect_cat.addWidget(self.leave_cat_redirect_cb)
         row_redirect_cat.addStretch(1)
         row_redirect_other = QHBoxLayout()
         row_redirect_other.addWidget(self.leave_other_redirect_cb)
         row_redirect_other.addStretch(1)
-        rename_opts_layout.addWidget(_wrap(row_redirect_cat))
-        rename_opts_layout.addWidget(_wrap(row_redirect_other))
+        rename_opts_layout.addLayout(row_redirect_cat)
+        rename_opts_layout.addLayout(row_redirect_other)
 
         # Рамка «Перенос содержимого категорий»
         transfer_opts_group = QGroupBox(self._t('ui.transfer_category_content'))
         transfer_opts_layout = QVBoxLayout(transfer_opts_group)
-        try:
-            transfer_opts_layout.setContentsMargins(10, 8, 10, 8)
-            transfer_opts_layout.setSpacing(2)
-        except Exception:
-            pass
+        transfer_opts_layout.setContentsMargins(10, 8, 10, 8)
+        transfer_opts_layout.setSpacing(2)
         transfer_body = QHBoxLayout()
-        try:
-            transfer_body.setContentsMargins(0, 0, 0, 0)
-            transfer_body.setSpacing(8)
-        except Exception:
-            pass
+        transfer_body.setContentsMargins(0, 0, 0, 0)
+        transfer_body.setSpacing(8)
         transfer_opts_col = QVBoxLayout()
-        try:
-            transfer_opts_col.setContentsMargins(0, 0, 0, 0)
-            transfer_opts_col.setSpacing(2)
-        except Exception:
-            pass
-        transfer_opts_col.addWidget(_wrap(row_p1))
-        transfer_opts_col.addWidget(_wrap(row_p2))
-        transfer_opts_col.addWidget(_wrap(row_loc))
+        transfer_opts_col.setContentsMargins(0, 0, 0, 0)
+        transfer_opts_col.setSpacing(2)
+        transfer_opts_col.addLayout(row_p1)
+        transfer_opts_col.addLayout(row_p2)
+        transfer_opts_col.addLayout(row_loc)
         transfer_opts_col.addStretch(1)
         rules_col = QVBoxLayout()
-        try:
-            rules_col.setContentsMargins(0, 0, 0, 0)
-            rules_col.setSpacing(4)
-        except Exception:
-            pass
+        rules_col.setContentsMargins(0, 0, 0, 0)
+        rules_col.setSpacing(4)
         rules_col.addWidget(btn_show_rules)
         rules_col.addWidget(btn_clear_rules)
         rules_col.addStretch(1)
@@ -352,63 +298,49 @@ class RenameTab(QWidget):
 
         # Две рамки в одну строку
         opts_row = QHBoxLayout()
-        try:
-            opts_row.setContentsMargins(0, 0, 0, 0)
-            opts_row.setSpacing(12)
-        except Exception:
-            pass
+        opts_row.setContentsMargins(0, 0, 0, 0)
+        opts_row.setSpacing(12)
         opts_row.addWidget(rename_opts_group, 4)
         opts_row.addWidget(transfer_opts_group, 5)
         v.addLayout(opts_row)
 
         # Комментарий к правке — перенесён вниз (между фильтром и прогрессом)
         self.rename_comment_edit = QLineEdit()
-        try:
-            self.rename_comment_edit.setPlaceholderText(self._t('ui.rename_comment_placeholder'))
-        except Exception:
-            pass
+        self.rename_comment_edit.setPlaceholderText(self._t('ui.rename_comment_placeholder'))
 
         # Постоянно видимые шкалы прогресса (создаём сейчас, добавим в нижний ряд)
         # Левая: общий прогресс по TSV
         self.rename_outer_label = QLabel(
             translate_key('ui.processed_counter_initial', ui_lang, 'Processed 0/0')
         )
-        try:
-            self.rename_outer_label.setVisible(False)
-        except Exception:
-            pass
+        self.rename_outer_label.setVisible(False)
         self.rename_outer_bar = QProgressBar()
-        try:
-            self.rename_outer_bar.setMaximum(1)
-            self.rename_outer_bar.setValue(0)
-            self.rename_outer_bar.setTextVisible(True)
-            self.rename_outer_bar.setFormat(
-                translate_key('ui.processed_counter_initial', ui_lang, 'Processed 0/0')
-            )
-            self.rename_outer_bar.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-            self.rename_outer_bar.setMinimumWidth(60)
-        except Exception:
-            pass
+        self.rename_outer_bar.setMaximum(1)
+        self.rename_outer_bar.setValue(0)
+        self.rename_outer_bar.setTextVisible(True)
+        self.rename_outer_bar.setFormat(
+            translate_key('ui.processed_counter_initial', ui_lang, 'Processed 0/0')
+        )
+        self.rename_outer_bar.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        self.rename_outer_bar.setMinimumWidth(60)
         # Правая: прогресс переноса участников текущей категории
         self.rename_inner_label = QLabel(
             translate_key('ui.moved_counter_initial', ui_lang, 'Moved 0/0')
         )
-        try:
-            self.rename_inner_label.setVisible(False)
-        except Exception:
-            pass
+        self.rename_inner_label.setVisible(False)
         self.rename_inner_bar = QProgressBar()
-        try:
-            self.rename_inner_bar.setMaximum(1)
-            self.rename_inner_bar.setValue(0)
-            self.rename_inner_bar.setTextVisible(True)
-            self.rename_inner_bar.setFormat(
-                translate_key('ui.moved_counter_initial', ui_lang, 'Moved 0/0')
-            )
-            self.rename_inner_bar.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-            self.rename_inner_bar.setMinimumWidth(60)
-        except Exception:
-            pass
+        self.rename_inner_bar.setMaximum(1)
+        self.rename_inner_bar.setValue(0)
+        self.rename_inner_bar.setTextVisible(True)
+        self.rename_inner_bar.setFormat(
+            translate_key('ui.moved_counter_initial', ui_lang, 'Moved 0/0')
+        )
+        self.rename_inner_bar.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        self.rename_inner_bar.setMinimumWidth(60)
+        self._outer_label_fmt = '{}'
+        self._inner_label_fmt = '{}'
+        self._outer_progress = ProgressCoalescer(self.rename_outer_bar, self._render_outer_progress)
+        self._inner_progress = ProgressCoalescer(self.rename_inner_bar, self._render_inner_progress)
 
         # Поле фильтра перенесем ниже — перед комментарием (см. ниже)
         
@@ -444,10 +376,7 @@ class RenameTab(QWidget):
         filter_row = QHBoxLayout()
         filter_row.addWidget(QLabel(self._t('ui.filter_category_content_by_titles')))
         self.title_regex_edit = QLineEdit()
-        try:
-            self.title_regex_edit.setPlaceholderText(self._t('ui.specify_a_regex_for_titles_to_exclude_from'))
-        except Exception:
-            pass
+        self.title_regex_edit.setPlaceholderText(self._t('ui.specify_a_regex_for_titles_to_exclude_from'))
         filter_row.addWidget(self.title_regex_edit, 1)
         add_info_button(self, filter_row, regex_help, inline=True)
         v.addLayout(filter_row)
@@ -458,10 +387,13 @@ class RenameTab(QWidget):
 
         # Валидация регулярного выражения по вводу
         self._title_regex_valid = True
-        try:
-            self.title_regex_edit.textChanged.connect(self._on_title_regex_changed)
-        except Exception:
-            pass
+        self._title_regex_compiled = None
+        # Проверка запускается после паузы в наборе, а не на каждое нажатие клавиши
+        self._regex_debounce = QTimer(self)
+        self._regex_debounce.setSingleShot(True)
+        self._regex_debounce.setInterval(150)
+        self._regex_debounce.timeout.connect(self._on_title_regex_changed)
+        self.title_regex_edit.textChanged.connect(lambda _=None: self._regex_debounce.start())
 
         # Кнопки управления
         self.rename_btn = QPushButton(self._t('ui.start_rename'))
@@ -472,34 +404,22 @@ class RenameTab(QWidget):
         self.rename_stop_btn.clicked.connect(self.stop_rename)
         
         row_run = QHBoxLayout()
-        try:
-            row_run.setContentsMargins(0, 0, 0, 0)
-            row_run.setSpacing(6)
-        except Exception:
-            pass
+        row_run.setContentsMargins(0, 0, 0, 0)
+        row_run.setSpacing(6)
         # Группа прогресса, растягивается до кнопки «Начать»
         progress_wrap = QWidget()
         progress_layout = QHBoxLayout(progress_wrap)
-        try:
-            progress_layout.setContentsMargins(0, 0, 0, 0)
-            progress_layout.setSpacing(6)
-        except Exception:
-            pass
+        progress_layout.setContentsMargins(0, 0, 0, 0)
+        progress_layout.setSpacing(6)
         progress_layout.addWidget(self.rename_outer_label)
         progress_layout.addWidget(self.rename_outer_bar)
-        try:
-            progress_layout.setStretchFactor(self.rename_outer_label, 0)
-            progress_layout.setStretchFactor(self.rename_outer_bar, 1)
-        except Exception:
-            pass
+        progress_layout.setStretchFactor(self.rename_outer_label, 0)
+        progress_layout.setStretchFactor(self.rename_outer_bar, 1)
         progress_layout.addSpacing(12)
         progress_layout.addWidget(self.rename_inner_label)
         progress_layout.addWidget(self.rename_inner_bar)
-        try:
-            progress_layout.setStretchFactor(self.rename_inner_label, 0)
-            progress_layout.setStretchFactor(self.rename_inner_bar, 1)
-        except Exception:
-            pass
+        progress_layout.setStretchFactor(self.rename_inner_label, 0)
+        progress_layout.setStretchFactor(self.rename_inner_bar, 1)
         row_run.addWidget(progress_wrap, 1)
         row_run.addWidget(self.rename_btn)
         row_run.addWidget(self.rename_stop_btn)
@@ -832,26 +752,29 @@ class RenameTab(QWidget):
         if not text:
             # Пусто — считается валидным (фильтр выключен)
             self._title_regex_valid = True
+            self._title_regex_compiled = None
             try:
                 self.title_regex_edit.setStyleSheet('')
                 self.title_regex_edit.setToolTip('')
             except Exception:
                 pass
             return
-        try:
-            import re as _re
-            _re.compile(text)
+        # Подсветка по вводу — через QRegularExpression (PCRE2), без компиляции re;
+        # итоговый re.compile для воркера выполняется в start_rename
+        qre = QRegularExpression(text)
+        if qre.isValid():
             self._title_regex_valid = True
             try:
                 self.title_regex_edit.setStyleSheet('')
                 self.title_regex_edit.setToolTip('')
             except Exception:
                 pass
-        except Exception as e:
+        else:
             self._title_regex_valid = False
+            self._title_regex_compiled = None
             try:
                 self.title_regex_edit.setStyleSheet('background-color:#fdecea')
-                self.title_regex_edit.setToolTip(self._fmt('ui.regex_error', error=e))
+                self.title_regex_edit.setToolTip(self._fmt('ui.regex_error', error=qre.errorString()))
             except Exception:
                 pass
         
@@ -916,8 +839,8 @@ class RenameTab(QWidget):
                 path = self._resolve_rules_path()
                 if path:
                     try:
-                        with open(path, 'w', encoding='utf-8') as f:
-                            f.write('{}')
+                        from ...core.template_manager import write_rules_json
+                        write_rules_json(path, {})
                         cleared = True or cleared
                     except Exception:
                         pass
@@ -930,25 +853,31 @@ class RenameTab(QWidget):
 
     def _resolve_rules_path(self) -> str:
         """Единая точка получения пути к файлу правил шаблонов."""
+        if self._rules_path_cache:
+            return self._rules_path_cache
+        path = None
         try:
             # 1) Через активный TemplateManager воркера
             w = getattr(self, 'mrworker', None)
             if w and hasattr(w, 'template_manager') and w.template_manager:
-                p = w.template_manager.get_rules_file_path()
-                if p:
-                    return p
-        except Exception:
-            pass
-        # 2) Вычислить путь по политике TemplateManager
-        try:
-            return TemplateManager.resolve_rules_file_path()
+                path = w.template_manager.get_rules_file_path()
         except Exception:
-            # 3) Жёсткий фолбэк: рядом с GUI модулем
+            path = None
+        if not path:
+            # 2) Вычислить путь по политике TemplateManager
             try:
-                base = _dist_configs_dir()
+                from ...core.template_manager import TemplateManager
+                path = TemplateManager.resolve_rules_file_path()
             except Exception:
-                base = os.path.join(os.path.dirname(__file__), 'configs')
-            return os.path.join(base, 'template_rules.json')
+                # 3) Жёсткий фолбэк: рядом с GUI модулем
+                try:
+                    from ...core.pywikibot_config import _dist_configs_dir
+                    base = _dist_configs_dir()
+                except Exception:
+                    base = os.path.join(os.path.dirname(__file__), 'configs')
+                path = os.path.join(base, 'template_rules.json')
+        self._rules_path_cache = path
+        return path
     
     def start_rename(self):
         """Запускает процесс переименования"""
@@ -964,10 +893,7 @@ class RenameTab(QWidget):
             return
         
         # Получаем данные из родительского окна (будет реализовано в main_window)
-        user = getattr(self.parent_window, 'current_user', None)
-        pwd = getattr(self.parent_window, 'current_password', None)
-        lang = getattr(self.parent_window, 'current_lang', 'ru')
-        fam = getattr(self.parent_window, 'current_family', 'wikipedia')
+        user, pwd, lang, fam = get_auth_data(self.parent_window)
         
         debug(self._fmt('log.rename_tab.auth_data_received', user=user, password='***' if pwd else None, lang=lang, family=fam))
         
@@ -985,23 +911,28 @@ class RenameTab(QWidget):
             ns_sel_preview = self.rename_ns_combo.currentData()
         except Exception:
             ns_sel_preview = 'auto'
-        try:
-            is_auto = isinstance(ns_sel_preview, str) and (ns_sel_preview or '').strip().lower() == 'auto'
-        except Exception:
-            is_auto = True
+        is_auto = resolve_ns_selection(ns_sel_preview) is None
 
         if is_auto:
             try:
-                import csv as _csv
                 plain_rows = 0
                 checked = 0
-                with open(self.rename_file_edit.text(), newline='', encoding='utf-8-sig') as _f:
-                    _reader = _csv.reader(_f, delimiter='\t')
-                    for _row in _reader:
+                # Для эвристики хватает начала файла: отображаем его в память
+                # и декодируем только первые 32 КБ, разбивая строки по табуляции
+                import mmap
+                with open(self.rename_file_edit.text(), 'rb') as _f, \
+                        mmap.mmap(_f.fileno(), 0, access=mmap.ACCESS_READ) as _mm:
+                    _head = _mm[:32768]
+                    _lines = _head.decode('utf-8-sig', 'replace').splitlines()
+                    if len(_head) < len(_mm) and _lines:
+                        # Последняя строка среза может быть обрезана
+                        _lines.pop()
+                    for _line in _lines:
+                        _row = _line.split('\t', 2)
                         if len(_row) < 2:
                             continue
-                        _old = (_row[0] or '').strip()
-                        _new = (_row[1] or '').strip()
+                        _old = _row[0].strip()
+                        _new = _row[1].strip()
                         if not _old and not _new:
                             continue
                         checked += 1
@@ -1013,33 +944,27 @@ class RenameTab(QWidget):
                     # Информируем в лог
                     try:
                         info_msg = self._t('ui.rename_plain_titles_info')
-                        log_tree_add(self.rename_log_tree, datetime.now().strftime('%H:%M:%S'), None, info_msg, 'manual', 'info', None, None, True)
+                        self._enqueue_log(log_tree_add, log_timestamp(), None, info_msg, 'manual', 'info', None, None, True)
                     except Exception:
                         pass
                     msg = self._t('ui.rename_plain_titles_confirm')
-                    res = QMessageBox.question(
-                        self,
-                        self._t('ui.confirm_launch'),
-                        msg,
-                        QMessageBox.Yes | QMessageBox.No,
-                        QMessageBox.No,
-                    )
-                    if res != QMessageBox.Yes:
+                    self._flush_log_queue()
+                    if not self._confirm_launch(msg):
                         try:
-                            log_tree_add(self.rename_log_tree, datetime.now().strftime('%H:%M:%S'), None, self._t('ui.rename_plain_titles_cancelled'), 'manual', 'info', None, None, True)
+                            self._enqueue_log(log_tree_add, log_timestamp(), None, self._t('ui.rename_plain_titles_cancelled'), 'manual', 'info', None, None, True)
                         except Exception:
                             pass
                         return
                     else:
                         try:
-                            log_tree_add(self.rename_log_tree, datetime.now().strftime('%H:%M:%S'), None, self._t('ui.rename_plain_titles_confirmed'), 'manual', 'info', None, None, True)
+                            self._enqueue_log(log_tree_add, log_timestamp(), None, self._t('ui.rename_plain_titles_confirmed'), 'manual', 'info', None, None, True)
                         except Exception:
                             pass
             except Exception:
                 # Любые ошибки эвристики не должны мешать запуску
                 pass
 
-        apply_pwb_config(lang, fam)
+        from ...workers.rename_worker import RenameWorker
 
         # Блокируем кнопки и очищаем лог
         self.rename_btn.setEnabled(False)
@@ -1063,14 +988,18 @@ class RenameTab(QWidget):
         # Валидация регулярного выражения фильтра
         title_regex = (self.title_regex_edit.text() or '').strip()
         if title_regex:
-            try:
-                import re as _re
-                _re.compile(title_regex)
-            except Exception as e:
-                QMessageBox.warning(self, self._t('ui.error', 'Error'), self._fmt('ui.invalid_title_filter_regex', error=e))
-                return
+            compiled = getattr(self, '_title_regex_compiled', None)
+            if compiled is None or compiled.pattern != title_regex:
+                try:
+                    compiled = re.compile(title_regex)
+                except Exception as e:
+                    QMessageBox.warning(self, self._t('ui.error', 'Error'), self._fmt('ui.invalid_title_filter_regex', error=e))
+                    return
+                self._title_regex_compiled = compiled
+            title_regex = compiled
 
         # Создаем и запускаем worker
+        self._rules_path_cache = None
         self.mrworker = RenameWorker(
             self.rename_file_edit.text(),
             user, pwd, lang, fam,
@@ -1086,26 +1015,19 @@ class RenameTab(QWidget):
             self.locatives_cb.isChecked()
         )
         
-        # Подключаем сигналы
-        self.mrworker.progress.connect(lambda m: log_tree_parse_and_add(self.rename_log_tree, m))
-        # Подключаем структурированные события
-        try:
-            self.mrworker.log_event.connect(lambda e: log_tree_add_event(self.rename_log_tree, e))
-        except Exception:
-            pass
+        # Подключаем сигналы. Частые сигналы — явно через очередь GUI-потока:
+        # у лямбд нет объекта-получателя, по которому Qt выбрал бы тип соединения
+        queued = Qt.QueuedConnection
+        self.mrworker.progress.connect(lambda m: self._enqueue_log(log_tree_parse_and_add, m), queued)
+        # Основной поток лога приходит пачками (строки и структурированные события)
+        self.mrworker.logs_batch.connect(self._on_logs_batch, queued)
         # Прогресс по файлу TSV
-        try:
-            self.mrworker.tsv_progress_init.connect(self._rename_outer_init)
-            self.mrworker.tsv_progress_inc.connect(self._rename_outer_inc)
-        except Exception:
-            pass
+        self.mrworker.tsv_progress_init.connect(self._rename_outer_init)
+        self.mrworker.tsv_progress_inc.connect(self._rename_outer_inc, queued)
         # Прогресс по участникам категории
-        try:
-            self.mrworker.inner_progress_init.connect(self._rename_inner_init)
-            self.mrworker.inner_progress_inc.connect(self._rename_inner_inc)
-            self.mrworker.inner_progress_reset.connect(self._rename_inner_reset)
-        except Exception:
-            pass
+        self.mrworker.inner_progress_init.connect(self._rename_inner_init)
+        self.mrworker.inner_progress_inc.connect(self._rename_inner_inc, queued)
+        self.mrworker.inner_progress_reset.connect(self._rename_inner_reset)
         self.mrworker.finished.connect(self._on_rename_finished)
         
         # Подключаем template review диалоги
@@ -1113,21 +1035,64 @@ class RenameTab(QWidget):
         
         self.mrworker.start()
     
+    def _confirm_launch(self, text: str) -> bool:
+        """Вопрос «Да/Нет» перед запуском; диалог создаётся один раз и переиспользуется."""
+        box = getattr(self, '_confirm_box', None)
+        if box is None:
+            box = QMessageBox(self)
+            box.setIcon(QMessageBox.Question)
+            box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+            self._confirm_box = box
+        # Заголовок и текст обновляются при каждом показе: язык UI мог смениться
+        box.setWindowTitle(self._t('ui.confirm_launch'))
+        box.setText(text)
+        box.setDefaultButton(QMessageBox.No)
+        box.exec()
+        return box.standardButton(box.clickedButton()) == QMessageBox.Yes
+
+    def _enqueue_log(self, fn, *args):
+        """Поставить строку лога в очередь; дерево обновится при ближайшем сбросе."""
+        self._log_queue.append((fn, args))
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _on_logs_batch(self, batch):
+        """Принять пачку записей от воркера и добавить её в дерево за один проход."""
+        for kind, payload in batch:
+            if kind == 'event':
+                self._log_queue.append((log_tree_add_event, (payload,)))
+            else:
+                self._log_queue.append((log_tree_parse_and_add, (payload,)))
+        self._flush_log_queue()
+
+    def _flush_log_queue(self):
+        """Добавить накопленные строки в дерево лога одной пачкой."""
+        self._log_flush_timer.stop()
+        queue = self._log_queue
+        if not queue:
+            return
+        tree = self.rename_log_tree
+        was_blocked = tree.blockSignals(True)
+        log_tree_begin_batch(tree)
+        try:
+            while queue:
+                fn, args = queue.popleft()
+                try:
+                    fn(tree, *args)
+                except Exception:
+                    pass
+        finally:
+            log_tree_end_batch(tree)
+            tree.blockSignals(was_blocked)
+
     def stop_rename(self):
         """Останавливает процесс переименования"""
         w = getattr(self, 'mrworker', None)
         if w and hasattr(w, 'isRunning') and w.isRunning():
-            try:
-                # Сначала мягкая остановка
-                w.request_stop()
-                # Если поток ещё активен — ждём недолго и жёстко завершаем
-                if not w.wait(1200):
-                    w.graceful_stop(5000)
-            except Exception:
-                try:
-                    w.graceful_stop(5000)
-                except Exception:
-                    pass
+            # Только сигнал остановки: воркер проверяет _stop_event в ожиданиях и циклах,
+            # а UI обновится по finished — без блокировки потока GUI на wait()
+            w.request_stop()
+            self.rename_stop_btn.setEnabled(False)
     
     def _on_rename_finished(self):
         """Обработчик завершения процесса переименования"""
@@ -1144,6 +1109,8 @@ class RenameTab(QWidget):
             pass
         self.rename_btn.setEnabled(True)
         self.rename_stop_btn.setEnabled(False)
+        self._outer_progress.flush()
+        self._inner_progress.flush()
         if stopped:
             msg = self._t('ui.stopped', 'Stopped!')
         elif worker and getattr(worker, 'failed', False):
@@ -1156,9 +1123,10 @@ class RenameTab(QWidget):
             msg = self._t('ui.rename_completed')
         try:
             # Служебное системное сообщение: статус ℹ️, без иконки объекта
-            log_tree_add(self.rename_log_tree, datetime.now().strftime('%H:%M:%S'), None, msg, 'manual', 'info', None, None, True)
+            self._enqueue_log(log_tree_add, log_timestamp(), None, msg, 'manual', 'info', None, None, True)
         except Exception:
             pass
+        self._flush_log_queue()
         # Прогресс-бары остаются видимыми по требованию UX
         try:
             self.rename_outer_bar.setVisible(True)
@@ -1168,72 +1136,64 @@ class RenameTab(QWidget):
         except Exception:
             pass
 
+    def _render_outer_progress(self, val: int, maximum: int):
+        # Шаблон подписи собирается в _rename_outer_init, здесь только подстановка
+        text = self._outer_label_fmt.format(val)
+        self.rename_outer_bar.setFormat(text)
+        self.rename_outer_label.setText(text)
+
+    def _render_inner_progress(self, val: int, maximum: int):
+        text = self._inner_label_fmt.format(val)
+        self.rename_inner_bar.setFormat(text)
+        self.rename_inner_label.setText(text)
+
     def _rename_outer_init(self, total: int):
         try:
+            self._outer_progress.reset()
             self.rename_outer_bar.setVisible(True)
             self.rename_outer_label.setVisible(False)
-            self.rename_outer_bar.setMaximum(max(1, int(total)))
+            maximum = max(1, int(total))
+            self._outer_label_fmt = f"{self._processed_label()} {{}}/{maximum}"
+            self.rename_outer_bar.setMaximum(maximum)
             self.rename_outer_bar.setValue(0)
-            self.rename_outer_bar.setFormat(f"{self._processed_label()} 0/{max(1, int(total))}")
-            try:
-                self.rename_outer_label.setText(f"{self._processed_label()} 0/{max(1, int(total))}")
-            except Exception:
-                pass
+            self._render_outer_progress(0, maximum)
         except Exception:
             pass
 
     def _rename_outer_inc(self):
-        try:
-            val = self.rename_outer_bar.value() + 1
-            self.rename_outer_bar.setValue(val)
-            self.rename_outer_bar.setFormat(f"{self._processed_label()} {val}/{self.rename_outer_bar.maximum()}")
-            try:
-                self.rename_outer_label.setText(f"{self._processed_label()} {val}/{self.rename_outer_bar.maximum()}")
-            except Exception:
-                pass
-        except Exception:
-            pass
+        # Перерисовка не чаще раза в 100 мс (см. ProgressCoalescer)
+        self._outer_progress.inc()
 
     def _rename_inner_init(self, total: int):
         try:
+            self._inner_progress.reset()
             self.rename_inner_bar.setVisible(True)
             self.rename_inner_label.setVisible(False)
-            self.rename_inner_bar.setMaximum(max(1, int(total)))
+            maximum = max(1, int(total))
+            self._inner_label_fmt = f"{self._moved_label()} {{}}/{maximum}"
+            self.rename_inner_bar.setMaximum(maximum)
             self.rename_inner_bar.setValue(0)
-            self.rename_inner_bar.setFormat(f"{self._moved_label()} 0/{max(1, int(total))}")
-            try:
-                self.rename_inner_label.setText(f"{self._moved_label()} 0/{max(1, int(total))}")
-            except Exception:
-                pass
+            self._render_inner_progress(0, maximum)
         except Exception:
             pass
 
     def _rename_inner_inc(self):
-        try:
-            val = self.rename_inner_bar.value() + 1
-            self.rename_inner_bar.setValue(val)
-            self.rename_inner_bar.setFormat(f"{self._moved_label()} {val}/{self.rename_inner_bar.maximum()}")
-            try:
-                self.rename_inner_label.setText(f"{self._moved_label()} {val}/{self.rename_inner_bar.maximum()}")
-            except Exception:
-                pass
-        except Exception:
-            pass
+        self._inner_progress.inc()
 
     def _rename_inner_reset(self):
         try:
+            self._inner_progress.reset()
             self.rename_inner_bar.setMaximum(1)
             self.rename_inner_bar.setValue(0)
             self.rename_inner_bar.setFormat(f"{self._moved_label()} 0/0")
-            try:
-                self.rename_inner_label.setText('')
-            except Exception:
-                pass
+            self.rename_inner_label.setText('')
         except Exception:
             pass
     
     def _on_review_request(self, payload):
         """Обработчик запроса на проверку изменений в шаблоне"""
+        # Перед модальным диалогом показываем всё, что уже накопилось в логе
+        self._flush_log_queue()
         try:
             debug(self._fmt('log.rename_tab.review_request_received', payload=payload))
             
@@ -1262,6 +1222,7 @@ class RenameTab(QWidget):
                 pass
 
             # Показываем диалог проверки шаблона
+            from ..dialogs.template_review_dialog import TemplateReviewDialog
             dialog = TemplateReviewDialog(self, payload)
             result = dialog.exec()
             
@@ -1324,7 +1285,7 @@ class RenameTab(QWidget):
             try:
                 # Логируем как ошибку, но продолжаем
                 msg = self._fmt('log.rename_tab.template_review_dialog_continue', error=e)
-                log_tree_add(self.rename_log_tree, datetime.now().strftime('%H:%M:%S'), None, msg, 'manual', 'error', None, None, True)
+                self._enqueue_log(log_tree_add, log_timestamp(), None, msg, 'manual', 'error', None, None, True)
             except Exception:
                 pass
             response_data = {
@@ -1340,10 +1301,7 @@ class RenameTab(QWidget):
         """Обновляет язык интерфейса и настройки"""
         # Обновляем комбобокс пространств имен
         if self.parent_window:
-            family = getattr(self.parent_window, 'current_family', None) or (
-                getattr(getattr(self.parent_window, 'auth_tab', None), 'family_combo', None).currentText()
-                if getattr(getattr(self.parent_window, 'auth_tab', None), 'family_combo', None) else 'wikipedia'
-            )
+            family = resolve_project_family(self.parent_window)
             try:
                 nm = getattr(self.parent_window, 'namespace_manager', None)
                 if nm:
@@ -1354,10 +1312,7 @@ class RenameTab(QWidget):
     def update_family(self, family: str):
         """Обновляет семейство проектов"""
         if self.parent_window:
-            lang = getattr(self.parent_window, 'current_lang', None) or (
-                getattr(getattr(self.parent_window, 'auth_tab', None), 'lang_combo', None).currentText()
-                if getattr(getattr(self.parent_window, 'auth_tab', None), 'lang_combo', None) else 'ru'
-            )
+            lang = resolve_project_language(self.parent_window)
             try:
                 nm = getattr(self.parent_window, 'namespace_manager', None)
                 if nm:
@@ -15,20 +15,19 @@ from PySide6.QtWidgets import (
     QComboBox, QPushButton, QToolButton, QTextEdit, QCheckBox, QProgressBar,
     QMessageBox, QSizePolicy
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QFont
 
 from ...constants import PREFIX_TOOLTIP
 from ...core.localization import translate_key
-from ...utils import debug, default_summary, resolve_project_language
+from ...utils import debug, default_summary, resolve_project_family, resolve_project_language
 from ...workers.replace_worker import ReplaceWorker
-from ...core.pywikibot_config import apply_pwb_config
 from ..widgets.shared_panels import TsvPreviewPanel
 from ..widgets.ui_helpers import (
     add_info_button, pick_file,
     open_from_edit, log_message, set_start_stop_ratio,
-    tsv_preview_from_path, init_progress, inc_progress,
-    count_non_empty_titles, is_default_summary
+    tsv_preview_from_path, TSV_PREVIEW_MAX_ROWS, init_progress, inc_progress,
+    is_default_summary, get_auth_data
 )
 
 
@@ -46,6 +45,12 @@ class ReplaceTab(QWidget):
         # Инициализация worker'а
         self.rworker = None
 
+        # Буфер строк лога: сбрасываем пачкой раз в 200 мс, а не на каждый сигнал
+        self._log_buffer = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setInterval(200)
+        self._log_flush_timer.timeout.connect(self._flush_log_buffer)
+
         # Данные авторизации
         self.current_user = None
         self.current_lang = None
@@ -290,7 +295,7 @@ class ReplaceTab(QWidget):
             return
 
         try:
-            left, right, count = tsv_preview_from_path(path)
+            left, right, count = tsv_preview_from_path(path, TSV_PREVIEW_MAX_ROWS)
         except Exception as e:
             QMessageBox.critical(
                 self, self._t('ui.error'), self._fmt('ui.failed_read_tsv', error=e))
@@ -311,19 +316,16 @@ class ReplaceTab(QWidget):
             QMessageBox.warning(self, self._t('ui.error'), self._t('ui.specify_tsv'))
             return
 
-        # Подсчитываем количество страниц для замены
+        # Дешёвая проверка доступности файла до очистки лога и запуска;
+        # сами строки считает worker (ошибки чтения по ходу — в _on_replace_finished)
         try:
-            page_count = count_non_empty_titles(self.rep_file_edit.text())
+            with open(self.rep_file_edit.text(), encoding='utf-8-sig'):
+                pass
         except Exception as e:
             QMessageBox.critical(
                 self, self._t('ui.error'), self._fmt('ui.failed_read_tsv', error=e))
             return
 
-        if page_count == 0:
-            QMessageBox.warning(
-                self, self._t('ui.error'), self._t('ui.replace.no_pages_in_file'))
-            return
-
         # Получаем данные авторизации от родительского окна
         if not self.parent_window:
             QMessageBox.warning(
@@ -331,17 +333,12 @@ class ReplaceTab(QWidget):
             return
 
         # Получаем данные из родительского окна (будет реализовано в main_window)
-        user = getattr(self.parent_window, 'current_user', None)
-        pwd = getattr(self.parent_window, 'current_password', None)
-        lang = getattr(self.parent_window, 'current_lang', 'ru')
-        fam = getattr(self.parent_window, 'current_family', 'wikipedia')
+        user, pwd, lang, fam = get_auth_data(self.parent_window)
 
         if not user or not pwd:
             QMessageBox.warning(self, self._t('ui.error'), self._t('ui.you_need_to_sign_in'))
             return
 
-        apply_pwb_config(lang, fam)
-
         summary = self.summary_edit.text().strip()
 
         minor = self.minor_checkbox.isChecked()
@@ -350,8 +347,8 @@ class ReplaceTab(QWidget):
         self.replace_btn.setEnabled(False)
         self.replace_stop_btn.setEnabled(True)
         self.rep_log.clear()
-        # Настраиваем прогресс-бар
-        init_progress(self.replace_label, self.replace_bar, page_count)
+        # Пока worker считает строки TSV, шкала в неопределённом режиме
+        self.replace_bar.setRange(0, 0)
 
         ns_sel = self.rep_ns_combo.currentData()
 
@@ -359,6 +356,22 @@ class ReplaceTab(QWidget):
         self.rworker = ReplaceWorker(
             self.rep_file_edit.text(), user, pwd, lang, fam, ns_sel, summary, minor
         )
+        # Сигналы worker'а — явно через очередь GUI-потока (у лямбды нет объекта-получателя)
+        self.rworker.pages_counted.connect(
+            lambda count: self._on_pages_counted(count, lang, fam, ns_sel, minor), Qt.QueuedConnection
+        )
+        self.rworker.item_processed.connect(self._inc_replace_progress, Qt.QueuedConnection)
+        self.rworker.progress.connect(self._buffer_log, Qt.QueuedConnection)
+        self.rworker.finished.connect(self._on_replace_finished)
+        self._log_flush_timer.start()
+        self.rworker.start()
+
+    def _on_pages_counted(self, page_count: int, lang: str, fam: str, ns_sel, minor: bool):
+        """Продолжение запуска после подсчёта страниц в потоке worker'а."""
+        if page_count == 0:
+            # Worker сразу завершится; предупреждение — в _on_replace_finished
+            return
+        init_progress(self.replace_label, self.replace_bar, page_count)
         log_message(
             self.rep_log,
             self._fmt(
@@ -370,12 +383,6 @@ class ReplaceTab(QWidget):
                 minor=minor,
             ),
         )
-        self.rworker.item_processed.connect(
-            lambda: inc_progress(self.replace_label, self.replace_bar)
-        )
-        self.rworker.progress.connect(lambda m: log_message(self.rep_log, m))
-        self.rworker.finished.connect(self._on_replace_finished)
-        self.rworker.start()
 
     def stop_replace(self):
         """Останавливает процесс замены"""
@@ -383,9 +390,38 @@ class ReplaceTab(QWidget):
         if w and w.isRunning():
             w.request_stop()
 
+    def _inc_replace_progress(self):
+        inc_progress(self.replace_label, self.replace_bar)
+
+    def _buffer_log(self, msg: str):
+        self._log_buffer.append(msg)
+
+    def _flush_log_buffer(self):
+        """Передаёт накопленные строки в лог (перерисовку сводит log_message)."""
+        if not self._log_buffer:
+            return
+        batch, self._log_buffer = self._log_buffer, []
+        for msg in batch:
+            log_message(self.rep_log, msg)
+
     def _on_replace_finished(self):
         """Обработчик завершения процесса замены"""
+        self._log_flush_timer.stop()
+        self._flush_log_buffer()
         worker = getattr(self, 'rworker', None)
+        page_count = getattr(worker, 'page_count', None) if worker is not None else None
+        if worker is not None and (page_count == 0 or (page_count is None and getattr(worker, 'failed', False))):
+            # TSV не прочитан или пуст: замены не было — возвращаем кнопки и шкалу
+            # и сообщаем диалогом, без итоговых строк в логе
+            self._restore_replace_controls()
+            if page_count == 0:
+                QMessageBox.warning(
+                    self, self._t('ui.error'), self._t('ui.replace.no_pages_in_file'))
+            else:
+                QMessageBox.critical(
+                    self, self._t('ui.error'),
+                    self._fmt('ui.failed_read_tsv', error=getattr(worker, 'failure_message', '')))
+            return
         stopped = bool(worker and getattr(worker, '_stop', False))
         stats = {}
         try:
@@ -433,28 +469,14 @@ class ReplaceTab(QWidget):
         else:
             message = self._t('log.replace.finished')
         log_message(self.rep_log, message)
+        self._restore_replace_controls()
+
+    def _restore_replace_controls(self):
         self.preview_btn.setEnabled(True)
         self.replace_btn.setEnabled(True)
         self.replace_stop_btn.setEnabled(False)
         init_progress(self.replace_label, self.replace_bar, 0)
 
-    def _inc_replace_prog(self):
-        """Увеличение значения прогресс-бара перезаписи"""
-        try:
-            val = self.replace_bar.value() + 1
-            self.replace_bar.setValue(val)
-            try:
-                processed = translate_key(
-                    'ui.processed_short',
-                    getattr(self.parent_window, '_ui_lang', 'ru') if self.parent_window is not None else 'ru',
-                    'Processed'        )
-                self.replace_label.setText(
-                    f'{processed} {val}/{self.replace_bar.maximum()}')
-            except Exception:
-                pass
-        except Exception:
-            pass
-
     def update_language(self, lang: str):
         """Обновляет язык интерфейса и настройки"""
         # Обновляем комментарий по умолчанию
@@ -463,11 +485,7 @@ class ReplaceTab(QWidget):
 
         # Обновляем комбобокс пространств имен
         if self.parent_window:
-            family = getattr(self.parent_window, 'current_family', None) or (
-                getattr(getattr(self.parent_window, 'auth_tab', None),
-                        'family_combo', None).currentText()
-                if getattr(getattr(self.parent_window, 'auth_tab', None), 'family_combo', None) else 'wikipedia'
-            )
+            family = resolve_project_family(self.parent_window)
             try:
                 nm = getattr(self.parent_window, 'namespace_manager', None)
                 if nm:
@@ -478,11 +496,7 @@ class ReplaceTab(QWidget):
     def update_family(self, family: str):
         """Обновляет семейство проектов"""
         if self.parent_window:
-            lang = getattr(self.parent_window, 'current_lang', None) or (
-                getattr(getattr(self.parent_window, 'auth_tab', None),
-                        'lang_combo', None).currentText()
-                if getattr(getattr(self.parent_window, 'auth_tab', None), 'lang_combo', None) else 'ru'
-            )
+            lang = resolve_project_language(self.parent_window)
             try:
                 nm = getattr(self.parent_window, 'namespace_manager', None)
                 if nm:
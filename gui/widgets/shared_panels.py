@@ -8,6 +8,7 @@ import webbrowser
 import re
 
 from PySide6.QtCore import Qt
+from PySide6.QtGui import QTextDocument
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QComboBox,
     QPushButton, QToolButton, QTextEdit, QMessageBox, QSpinBox,
@@ -31,6 +32,16 @@ _FETCH_MODE_NON_CATEGORIES_ONLY = 'non_categories_only'
 _FETCH_MODE_BOTH = 'both'
 
 
+def _parse_titles(lines) -> list[str]:
+    """Непустые заголовки из текста или итерируемого набора строк (strip() один раз на строку).
+
+    Файл можно передать как есть — он читается построчно, без копии всего содержимого.
+    """
+    if isinstance(lines, str):
+        lines = lines.splitlines()
+    return [title for title in (line.strip() for line in lines) if title]
+
+
 class CategorySourcePanel(QGroupBox):
     """Универсальная левая панель источника страниц."""
 
@@ -491,20 +502,25 @@ class CategorySourcePanel(QGroupBox):
         in_file = (self.in_path.text() or '').strip()
         if in_file:
             with open(in_file, encoding='utf-8') as file_obj:
-                return [line.strip() for line in file_obj if line.strip()]
-        return [
-            line.strip()
-            for line in self.manual_list.toPlainText().splitlines()
-            if line.strip()
-        ]
+                return _parse_titles(file_obj)
+        # toRawText() пропускает сериализацию toPlainText(): блоки разделены U+2029,
+        # переносы внутри блока (Shift+Enter, <br>) — U+2028; splitlines() понимает оба
+        raw = self.manual_list.document().toRawText().replace('\xa0', ' ')
+        return _parse_titles(raw)
 
     def _build_petscan_url(self, family: str, lang: str, category: str, depth: int = 0) -> str:
         from ...core.namespace_manager import strip_ns_prefix
 
-        base = strip_ns_prefix(family, lang, category, 14)
-        cat_param = urllib.parse.quote_plus(base)
+        bases = [
+            strip_ns_prefix(family, lang, part.strip(), 14)
+            for part in category.split('|')
+            if part.strip()
+        ]
+        cat_param = urllib.parse.quote_plus('\n'.join(bases))
+        # Несколько корней — объединение, как в CategoryFetchWorker (subset = пересечение)
+        combination = 'union' if len(bases) > 1 else 'subset'
         petscan_url = (
-            'https://petscan.wmcloud.org/?combination=subset&interface_language=en&ores_prob_from=&'
+            f'https://petscan.wmcloud.org/?combination={combination}&interface_language=en&ores_prob_from=&'
             'referrer_name=&ores_prob_to=&min_sitelink_count=&wikidata_source_sites=&templates_yes=&'
             'sortby=title&pagepile=&cb_labels_no_l=1&show_disambiguation_pages=both&language=' + lang +
             '&max_sitelink_count=&cb_labels_yes_l=1&outlinks_any=&common_wiki=auto&categories=' + cat_param +
@@ -887,10 +903,14 @@ class CategorySourcePanel(QGroupBox):
         fam = self.get_current_family()
         selected_mode = mode or self._get_selected_fetch_mode()
 
-        try:
-            cat_full = self._resolve_category_title(fam, lang, category)
-        except Exception:
-            cat_full = category
+        roots = [part.strip() for part in category.split('|') if part.strip()]
+        resolved_roots: list[str] = []
+        for root in roots:
+            try:
+                resolved_roots.append(self._resolve_category_title(fam, lang, root))
+            except Exception:
+                resolved_roots.append(root)
+        cat_full = ' | '.join(resolved_roots) or category
 
         depth = self.depth_spin.value()
         self._activate_fetch_stop_button(trigger_button)
@@ -1017,12 +1037,12 @@ class CategorySourcePanel(QGroupBox):
 
         if mode in {'categories_only', 'both'}:
             categories_only = sorted(
-                set(
+                dict.fromkeys(
                     self._fetch_subcats_recursive(
                         api_client, category, lang, fam, depth, 0, set()
                     )
                 ),
-                key=lambda value: value.casefold(),
+                key=str.casefold,
             )
 
         if mode in {'non_categories_only', 'both'}:
@@ -1043,8 +1063,8 @@ class CategorySourcePanel(QGroupBox):
                     )
                 )
             non_categories_only = sorted(
-                set(page_titles),
-                key=lambda value: value.casefold(),
+                dict.fromkeys(page_titles),
+                key=str.casefold,
             )
 
         combined_titles = list(categories_only)
@@ -1325,8 +1345,42 @@ class TsvPreviewPanel(QWidget):
             pass
 
     def set_preview(self, left: list[str], right: list[str]) -> None:
-        self.titles_edit.setPlainText('\n'.join(left))
-        self.content_edit.setPlainText('\n'.join(right))
+        # Без блокировки каждый setPlainText дёргает синхронизацию скроллбаров
+        # и перерисовку второй колонки
+        edits = (self.titles_edit, self.content_edit)
+        bars = [edit.verticalScrollBar() for edit in edits]
+        for edit in edits:
+            edit.setUpdatesEnabled(False)
+        for bar in bars:
+            bar.blockSignals(True)
+        try:
+            self._set_detached_text(self.titles_edit, '\n'.join(left))
+            self._set_detached_text(self.content_edit, '\n'.join(right))
+            for bar in bars:
+                bar.setValue(0)
+        finally:
+            for bar in bars:
+                bar.blockSignals(False)
+            for edit in edits:
+                edit.setUpdatesEnabled(True)
+
+    @staticmethod
+    def _set_detached_text(edit: QTextEdit, text: str) -> None:
+        """Заполняет отдельный документ и подставляет его в edit целиком.
+
+        Текст раскладывается один раз уже при показе, без промежуточной
+        перекладки видимого документа; undo-стек для предпросмотра не нужен.
+        """
+        old_doc = edit.document()
+        # Свой документ от прошлого предпросмотра QTextEdit сам не удаляет
+        stale = old_doc if old_doc.parent() is edit else None
+        doc = QTextDocument(edit)
+        doc.setDefaultFont(old_doc.defaultFont())
+        doc.setUndoRedoEnabled(False)
+        doc.setPlainText(text)
+        edit.setDocument(doc)
+        if stale is not None:
+            stale.deleteLater()
 
     def clear(self) -> None:
         self.titles_edit.clear()
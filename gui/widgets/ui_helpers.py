@@ -11,26 +11,64 @@ import sys
 import html
 import re
 import ctypes
-from datetime import datetime
-from PySide6.QtCore import Qt, QUrl, QTimer
+import functools
+import subprocess
+import time
+import urllib.parse
+from typing import NamedTuple
+from PySide6.QtCore import Qt, QUrl, QTimer, QObject, QEvent
 from PySide6.QtWidgets import (
     QLineEdit, QPushButton, QTextEdit, QToolButton, QHBoxLayout,
     QFileDialog, QMessageBox, QDialog, QVBoxLayout, QTextBrowser,
     QTreeWidget, QTreeWidgetItem, QLabel, QHeaderView, QAbstractItemView,
-    QWidget, QGridLayout
+    QWidget, QGridLayout, QToolTip, QTreeWidgetItemIterator
 )
-from PySide6.QtGui import QKeySequence, QGuiApplication, QShortcut
+from PySide6.QtGui import QKeySequence, QGuiApplication, QShortcut, QBrush, QColor
 from PySide6.QtGui import QAction
 from PySide6.QtGui import QDesktopServices
+from ...constants import DEFAULT_EN_NS
 from ...core.localization import translate_key
 
 
+class AuthData(NamedTuple):
+    """Данные текущей авторизации главного окна."""
+    user: str | None
+    password: str | None
+    lang: str
+    family: str
+
+
+def get_auth_data(parent_window) -> AuthData:
+    """Снимок авторизации окна одним вызовом (с фолбэком на отдельные атрибуты)."""
+    getter = getattr(parent_window, 'get_auth', None)
+    if callable(getter):
+        return getter()
+    return AuthData(
+        getattr(parent_window, 'current_user', None),
+        getattr(parent_window, 'current_password', None),
+        getattr(parent_window, 'current_lang', None) or 'ru',
+        getattr(parent_window, 'current_family', None) or 'wikipedia',
+    )
+
+
+_LOG_TS_CACHE: list = [-1, '']
+
+
+def log_timestamp() -> str:
+    """Текущее время ЧЧ:ММ:СС для логов; строка переиспользуется в пределах секунды."""
+    now = int(time.time())
+    if now != _LOG_TS_CACHE[0]:
+        _LOG_TS_CACHE[0] = now
+        _LOG_TS_CACHE[1] = time.strftime('%H:%M:%S', time.localtime(now))
+    return _LOG_TS_CACHE[1]
+
+
 # Структурированный приём событий из воркера
 def log_tree_add_event(tree: QTreeWidget, event: dict) -> None:
     try:
         if not isinstance(event, dict):
             return
-        ts = datetime.now().strftime('%H:%M:%S')
+        ts = log_timestamp()
         et = (event.get('type') or '').strip()
         status = (event.get('status') or 'info').strip().lower()
         # Нормализуем статус к известным ключам
@@ -167,7 +205,9 @@ def _fmt(widget, key: str, default: str = '', **kwargs) -> str:
         return text
 
 
+@functools.lru_cache(maxsize=None)
 def _locale_tokens(key: str, *defaults: str) -> tuple[str, ...]:
+    """Ключевые слова ru+en для *key* (нижний регистр); словари локалей статичны — кэшируем."""
     tokens: list[str] = []
     for lang in ('ru', 'en'):
         try:
@@ -192,35 +232,54 @@ def _locale_pattern(key: str, *defaults: str) -> str:
 
 
 def _has_locale_token(text: str, key: str, *defaults: str) -> bool:
-    low = (text or '').lower()
+    return _low_has_token((text or '').lower(), key, *defaults)
+
+
+def _low_has_token(low: str, key: str, *defaults: str) -> bool:
+    """Как _has_locale_token, но *low* уже в нижнем регистре (без повторного .lower())."""
     return any(token in low for token in _locale_tokens(key, *defaults))
 
 
-def _status_meta(widget=None) -> dict[str, dict[str, str]]:
-    return {
-        'success': {'emoji': '✅', 'color': '#4f83d1', 'label': _t(widget, 'ui.success', 'Success')},
-        'skipped': {'emoji': '⏭️', 'color': '#6b7280', 'label': _t(widget, 'ui.skipped', 'Skipped')},
-        'error': {'emoji': '❌', 'color': '#ef4444', 'label': _t(widget, 'ui.error', 'Error')},
-        'not_found': {'emoji': '⚠️', 'color': '#f97316', 'label': _t(widget, 'ui.not_found', 'Not found')},
-        'info': {'emoji': 'ℹ️', 'color': '#3b82f6', 'label': _t(widget, 'ui.info', 'Info')},
+@functools.lru_cache(maxsize=4)
+def _log_meta_for_lang(lang: str) -> tuple[dict, dict, dict]:
+    """Словари статусов/режимов/объектов лога для языка UI; общие, только для чтения."""
+    def tr(key: str, default: str) -> str:
+        try:
+            return translate_key(key, lang, default)
+        except Exception:
+            return default
+
+    status = {
+        'success': {'emoji': '✅', 'color': '#4f83d1', 'label': tr('ui.success', 'Success')},
+        'skipped': {'emoji': '⏭️', 'color': '#6b7280', 'label': tr('ui.skipped', 'Skipped')},
+        'error': {'emoji': '❌', 'color': '#ef4444', 'label': tr('ui.error', 'Error')},
+        'not_found': {'emoji': '⚠️', 'color': '#f97316', 'label': tr('ui.not_found', 'Not found')},
+        'info': {'emoji': 'ℹ️', 'color': '#3b82f6', 'label': tr('ui.info', 'Info')},
+    }
+    mode = {
+        'auto': {'emoji': '⚡', 'label': tr('ui.log.mode.auto', 'Auto-approved template parameter replacement')},
+        'manual': {'emoji': '✍️', 'label': tr('ui.log.mode.manual', 'Manual template parameter replacement')},
+        'direct': {'emoji': '📝', 'label': tr('ui.log.mode.direct', 'Direct category link replacement on page')},
+    }
+    obj = {
+        'article': {'emoji': '📄', 'label': tr('ui.log.object.article', 'Article')},
+        'template': {'emoji': '⚛️', 'label': tr('ui.log.object.template', 'Template')},
+        'file': {'emoji': '🖼️', 'label': tr('ui.log.object.file', 'File')},
+        'category': {'emoji': '📁', 'label': tr('ui.log.object.category', 'Category')},
     }
+    return status, mode, obj
+
+
+def _status_meta(widget=None) -> dict[str, dict[str, str]]:
+    return _log_meta_for_lang(_ui_lang(widget))[0]
 
 
 def _mode_meta(widget=None) -> dict[str, dict[str, str]]:
-    return {
-        'auto': {'emoji': '⚡', 'label': _t(widget, 'ui.log.mode.auto', 'Auto-approved template parameter replacement')},
-        'manual': {'emoji': '✍️', 'label': _t(widget, 'ui.log.mode.manual', 'Manual template parameter replacement')},
-        'direct': {'emoji': '📝', 'label': _t(widget, 'ui.log.mode.direct', 'Direct category link replacement on page')},
-    }
+    return _log_meta_for_lang(_ui_lang(widget))[1]
 
 
 def _obj_meta(widget=None) -> dict[str, dict[str, str]]:
-    return {
-        'article': {'emoji': '📄', 'label': _t(widget, 'ui.log.object.article', 'Article')},
-        'template': {'emoji': '⚛️', 'label': _t(widget, 'ui.log.object.template', 'Template')},
-        'file': {'emoji': '🖼️', 'label': _t(widget, 'ui.log.object.file', 'File')},
-        'category': {'emoji': '📁', 'label': _t(widget, 'ui.log.object.category', 'Category')},
-    }
+    return _log_meta_for_lang(_ui_lang(widget))[2]
 
 
 def _context_action_key(raw_text: str) -> str | None:
@@ -286,12 +345,36 @@ def install_localized_context_menu(widget):
         pass
 
 
-def show_help_dialog(parent_widget, text: str, title: str = ''):
-    """Показывает справку в выделяемом текстовом блоке (как у кнопок `?`)."""
+def show_help_dialog(parent_widget, text: str, title: str = '', cache_owner=None):
+    """Показывает справку в выделяемом текстовом блоке (как у кнопок `?`).
+
+    Если задан *cache_owner*, собранный диалог сохраняется на нём и
+    переиспользуется, пока не сменятся текст, заголовок или тема.
+    """
     raw = text or ''
     try:
+        shown_title = _ui_translate(parent_widget, title or _t(parent_widget, 'ui.help', 'Help'))
+        shown_text = _ui_translate(parent_widget, raw)
+        try:
+            host = parent_widget.window() if parent_widget is not None else None
+            theme_mode = str(getattr(host, '_theme_mode', '')).lower()
+        except Exception:
+            theme_mode = ''
+        cache_key = (shown_text, shown_title, theme_mode)
+        if cache_owner is not None:
+            dlg = getattr(cache_owner, '_help_dlg', None)
+            if dlg is not None and getattr(cache_owner, '_help_dlg_key', None) == cache_key:
+                dlg.exec()
+                return
+            if dlg is not None:
+                try:
+                    dlg.deleteLater()
+                except Exception:
+                    pass
+                cache_owner._help_dlg = None
+
         dlg = QDialog(parent_widget)
-        dlg.setWindowTitle(_ui_translate(parent_widget, title or _t(parent_widget, 'ui.help', 'Help')))
+        dlg.setWindowTitle(shown_title)
         lay = QVBoxLayout(dlg)
         try:
             lay.setContentsMargins(8, 8, 8, 8)
@@ -313,14 +396,8 @@ def show_help_dialog(parent_widget, text: str, title: str = ''):
         except Exception:
             pass
 
-        def _build_html(s: str) -> str:
-            try:
-                html_text = html.escape(s).replace('\n', '<br/>')
-                return f"<div style='font-size:12px; line-height:1.15'>{html_text}</div>"
-            except Exception:
-                return html.escape(s).replace('\n', '<br/>')
-
-        view.setHtml(_build_html(_ui_translate(parent_widget, raw)))
+        html_text = html.escape(shown_text).replace('\n', '<br/>')
+        view.setHtml(f"<div style='font-size:12px; line-height:1.15'>{html_text}</div>")
         lay.addWidget(view)
 
         from PySide6.QtWidgets import QDialogButtonBox
@@ -342,11 +419,26 @@ def show_help_dialog(parent_widget, text: str, title: str = ''):
                 doc.setTextWidth(inner_width)
             except Exception:
                 pass
-            try:
-                sizef = doc.documentLayout().documentSize()
-                content_h = int(sizef.height()) + 2
-            except Exception:
-                content_h = 320
+            content_h = 0
+            if len(shown_text) < 200 and shown_text.count('\n') < 4:
+                # Короткая справка: высота по метрикам шрифта, без полной раскладки документа
+                try:
+                    from PySide6.QtCore import QRect
+                    from PySide6.QtGui import QFont, QFontMetrics
+                    font = QFont(view.font())
+                    font.setPixelSize(12)
+                    wrap_w = int(inner_width - 2 * doc.documentMargin())
+                    rect = QFontMetrics(font).boundingRect(
+                        QRect(0, 0, wrap_w, 10000), int(Qt.TextWordWrap), shown_text)
+                    content_h = int(rect.height() * 1.15 + 2 * doc.documentMargin()) + 2
+                except Exception:
+                    content_h = 0
+            if not content_h:
+                try:
+                    sizef = doc.documentLayout().documentSize()
+                    content_h = int(sizef.height()) + 2
+                except Exception:
+                    content_h = 320
             try:
                 screen = QGuiApplication.primaryScreen()
                 avail_h = screen.availableGeometry().height() if screen else 900
@@ -362,12 +454,13 @@ def show_help_dialog(parent_widget, text: str, title: str = ''):
             dlg.resize(640, 360)
 
         try:
-            host = parent_widget.window() if parent_widget is not None else None
-            theme_mode = str(getattr(host, '_theme_mode', '')).lower()
             dark_title = theme_mode in ('teal', 'dark')
             _apply_windows_dialog_titlebar_theme(dlg, dark_title)
         except Exception:
             pass
+        if cache_owner is not None:
+            cache_owner._help_dlg = dlg
+            cache_owner._help_dlg_key = cache_key
         dlg.exec()
     except Exception:
         try:
@@ -409,7 +502,8 @@ def add_info_button(parent_widget, host_layout, text: str, inline: bool = False)
         pass
 
     btn.clicked.connect(
-        lambda _=None, t=text: show_help_dialog(parent_widget, t, _t(parent_widget, 'ui.help', 'Help'))
+        lambda _=None, t=text: show_help_dialog(
+            parent_widget, t, _t(parent_widget, 'ui.help', 'Help'), cache_owner=btn)
     )
 
     if isinstance(host_layout, QHBoxLayout):
@@ -431,6 +525,33 @@ def add_info_button(parent_widget, host_layout, text: str, inline: bool = False)
     return btn
 
 
+class _EmbedBtnFilter(QObject):
+    """Держит встроенную кнопку у правого края QLineEdit при изменении размера."""
+
+    def __init__(self, edit: QLineEdit, btn: QToolButton):
+        super().__init__(edit)
+        self._edit = edit
+        self._btn = btn
+
+    def reposition(self) -> None:
+        try:
+            edit, btn = self._edit, self._btn
+            # располагать кнопку справа, по центру по вертикали
+            hint = btn.sizeHint()
+            bw, bh = hint.width(), hint.height()
+            x = edit.rect().right() - bw - 4
+            y = (edit.rect().height() - bh) // 2
+            btn.move(x, y)
+            edit.setTextMargins(0, 0, bw + 8, 0)
+        except Exception:
+            pass
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Resize:
+            self.reposition()
+        return False
+
+
 def embed_button_in_lineedit(edit: QLineEdit, on_click):
     """Добавляет кнопку '…' внутрь правой части QLineEdit.
 
@@ -449,27 +570,10 @@ def embed_button_in_lineedit(edit: QLineEdit, on_click):
         btn.setFocusPolicy(Qt.NoFocus)
         btn.clicked.connect(on_click)
 
-        def _reposition():
-            try:
-                # располагать кнопку справа, по центру по вертикали
-                bw = btn.sizeHint().width()
-                bh = btn.sizeHint().height()
-                x = edit.rect().right() - bw - 4
-                y = (edit.rect().height() - bh) // 2
-                btn.move(x, y)
-                edit.setTextMargins(0, 0, bw + 8, 0)
-            except Exception:
-                pass
-
-        def _resize(ev):
-            try:
-                QLineEdit.resizeEvent(edit, ev)
-            except Exception:
-                pass
-            _reposition()
-
-        edit.resizeEvent = _resize
-        _reposition()
+        # Фильтр — дочерний объект edit, живёт вместе с ним
+        filt = _EmbedBtnFilter(edit, btn)
+        edit.installEventFilter(filt)
+        filt.reposition()
         return btn
     except Exception:
         return None
@@ -489,20 +593,42 @@ def pick_file(parent_widget, edit: QLineEdit, pattern: str):
         edit.setText(path)
 
 
-def pick_save(parent_widget, edit: QLineEdit, default_ext: str):
+def pick_save(parent_widget, edit: QLineEdit, default_ext: str, extra_exts: tuple[str, ...] = ()):
     """Open save file dialog and set selected path to QLineEdit.
 
     Args:
         parent_widget: Parent widget for the dialog
         edit: QLineEdit to set the selected path
         default_ext: Default file extension (e.g., 'tsv')
+        extra_exts: Additional accepted extensions (e.g., ('tsv.gz',))
     """
+    patterns = ' '.join(f'*.{ext.lstrip(".")}' for ext in (default_ext, *extra_exts))
     path, _ = QFileDialog.getSaveFileName(
-        parent_widget, _t(parent_widget, 'ui.save_to', 'Save to'), filter=f'*.{default_ext.lstrip(".")}')
+        parent_widget, _t(parent_widget, 'ui.save_to', 'Save to'), filter=patterns)
     if path:
         edit.setText(path)
 
 
+def open_path_detached(path: str) -> None:
+    """Открыть файл ассоциированным приложением, не дожидаясь запуска оболочки.
+
+    Args:
+        path: Path to the file to open
+    """
+    path = os.path.abspath(path)
+    if sys.platform == 'win32':
+        # explorer.exe, в отличие от «cmd /c start», не разбирает спецсимволы пути (&, ^)
+        subprocess.Popen(
+            ['explorer', path],
+            creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
+            close_fds=True,
+        )
+    elif sys.platform == 'darwin':
+        subprocess.Popen(['open', path], start_new_session=True)
+    else:
+        subprocess.Popen(['xdg-open', path], start_new_session=True)
+
+
 def open_from_edit(parent_widget, edit: QLineEdit):
     """Открыть файл из пути, указанного в QLineEdit. Для .tsv — создать пустой, если отсутствует.
 
@@ -519,18 +645,22 @@ def open_from_edit(parent_widget, edit: QLineEdit):
                 _t(parent_widget, 'ui.specify_file_path_first', 'First provide the path to the file.'),
             )
             return
+        # Один stat на оба случая: проверка наличия и создание пустого TSV
+        exists = os.path.exists(path)
         # Если это TSV и файла нет — создаём пустой файл (как с правилами замен)
-        try:
-            _, ext = os.path.splitext(path)
-            if ext.lower() == '.tsv' and not os.path.exists(path):
+        if not exists and os.path.splitext(path)[1].lower() == '.tsv':
+            try:
                 dir_name = os.path.dirname(path)
                 if dir_name:
                     os.makedirs(dir_name, exist_ok=True)
-                with open(path, 'w', encoding='utf-8') as f:
-                    f.write('')
-        except Exception:
-            pass
-        if not os.path.exists(path):
+                # 'x' не затрёт файл, появившийся между проверкой и созданием
+                open(path, 'x', encoding='utf-8').close()
+                exists = True
+            except FileExistsError:
+                exists = True
+            except Exception:
+                pass
+        if not exists:
             QMessageBox.warning(
                 parent_widget,
                 _t(parent_widget, 'ui.error', 'Error'),
@@ -546,6 +676,48 @@ def open_from_edit(parent_widget, edit: QLineEdit):
         )
 
 
+# Шаблоны разбора строк лога (log_message / pretty_format_msg): компилируются один раз
+# Группы позиционные (категория, заголовок, остаток): разбираются одним m.groups()
+_MSG_RE = re.compile(r'^(?:→|▪️)\s+([^:]+:.+?)\s*:\s*"([^"]+)"\s*—\s*(.+)')
+_MODULE_PREFIX_RE = re.compile(r'^\[(?P<mod>[^\]]+)\]\s*(?P<body>.*)$')
+_TIME_ONLY_RE = re.compile(r'^\d{2}:\d{2}:\d{2}$')
+_SECTION_LINE_RE = re.compile(r'^=+\s*(.*?)\s*=+$')
+_SYNC_KIND_RE = re.compile(
+    r'^\s*\((?P<kind>статья|статьи|подкатегория|подкатегории|article|articles|subcategory|subcategories)\)\s*(?P<rest>.*)$',
+    re.I,
+)
+_SYNC_SKIP_RE = re.compile(r'^(?P<status>пропуск|skip)\s+\'(?P<title>.*)\':\s*(?P<reason>.*)$', re.I)
+_SYNC_ALREADY_RE = re.compile(r'^(?P<status>уже в категории|already in category):\s*\'(?P<title>.*)\'\.?$', re.I)
+_SYNC_SUCCESS_RE = re.compile(r'^(?P<status>успех|success):\s*\'(?P<title>.*)\'\.?$', re.I)
+_SYNC_ERROR_RE = re.compile(r'^(?P<status>ошибка для|error for)\s+\'(?P<title>.*)\':\s*(?P<reason>.*)$', re.I)
+_LINES_COUNT_RE = re.compile(r':\s*\d+\s*(?:строк\(и\)|line\(s\))\s*$')
+_COUNTER_RE = re.compile(r'\b\d+\s*/\s*\d+\b')
+_NS_PREFIX_RE = re.compile(r'^[^\W\d_]+:')
+
+
+# Эмодзи статуса в pretty_format_msg; порядок задаёт приоритет при нескольких совпадениях
+_STATUS_EMOJI_KEYS = (
+    ('ui.log.keyword.error', ('error', 'failed'), '❌'),
+    ('ui.log.keyword.skipped', ('skipped', 'skip'), '⏭️'),
+    ('ui.log.keyword.transferred', ('transferred', 'moved'), '✅'),
+    ('ui.log.keyword.renamed', ('renamed',), '🔁'),
+    ('ui.log.keyword.created', ('created',), '🆕'),
+    ('ui.log.keyword.written', ('written', 'saved'), '💾'),
+    ('ui.log.keyword.not_exists', ('does not exist',), '⚠️'),
+    ('ui.log.keyword.already_exists', ('already exists',), 'ℹ️'),
+    ('ui.log.keyword.done', ('done', 'completed'), '✅'),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _status_emoji_patterns() -> tuple[tuple[re.Pattern, str], ...]:
+    """Одна альтернация на статус вместо перебора ключевых слов в Python."""
+    return tuple(
+        (re.compile(_locale_pattern(key, *defaults)), emoji)
+        for key, defaults, emoji in _STATUS_EMOJI_KEYS
+    )
+
+
 def pretty_format_msg(raw: str) -> tuple[str, bool]:
     """Преобразует типичные сообщения о переносе в формат с эмодзи и разделителями.
 
@@ -558,12 +730,9 @@ def pretty_format_msg(raw: str) -> tuple[str, bool]:
     try:
         s = (raw or '').strip()
         # Шаблон: "→ Категория:Имя : "Статья" — тип/статус"
-        m = re.match(
-            r'^(?:→|▪️)\s+(?P<cat>[^:]+:.+?)\s*:\s*"(?P<title>[^"]+)"\s*—\s*(?P<rest>.+)', s)
+        m = _MSG_RE.match(s)
         if m:
-            cat = (m.group('cat') or '').strip()
-            title = (m.group('title') or '').strip()
-            rest = (m.group('rest') or '').strip()
+            cat, title, rest = (part.strip() for part in m.groups())
 
             typ = None
             tail = rest
@@ -591,33 +760,15 @@ def pretty_format_msg(raw: str) -> tuple[str, bool]:
                 item_emoji = '🖼️'
 
             low_tail = tail.lower()
-            status_emoji = ''
-            if any(token in low_tail for token in _locale_tokens('ui.log.keyword.error', 'error', 'failed')):
-                status_emoji = '❌'
-            elif any(token in low_tail for token in _locale_tokens('ui.log.keyword.skipped', 'skipped', 'skip')):
-                status_emoji = '⏭️'
-            elif any(token in low_tail for token in _locale_tokens('ui.log.keyword.transferred', 'transferred', 'moved')):
-                status_emoji = '✅'
-            elif any(token in low_tail for token in _locale_tokens('ui.log.keyword.renamed', 'renamed')):
-                status_emoji = '🔁'
-            elif any(token in low_tail for token in _locale_tokens('ui.log.keyword.created', 'created')):
-                status_emoji = '🆕'
-            elif any(token in low_tail for token in _locale_tokens('ui.log.keyword.written', 'written', 'saved')):
-                status_emoji = '💾'
-            elif any(token in low_tail for token in _locale_tokens('ui.log.keyword.not_exists', 'does not exist')):
-                status_emoji = '⚠️'
-            elif any(token in low_tail for token in _locale_tokens('ui.log.keyword.already_exists', 'already exists')):
-                status_emoji = 'ℹ️'
-            elif any(token in low_tail for token in _locale_tokens('ui.log.keyword.done', 'done', 'completed')):
-                status_emoji = '✅'
+            status_emoji = next(
+                (emoji for pattern, emoji in _status_emoji_patterns() if pattern.search(low_tail)),
+                '',
+            )
 
             sep1 = ' • '
             sep2 = ' — '
             pretty = f"{folder_emoji} {cat}{sep1}{item_emoji} {title}{sep2}{status_emoji} {tail}".strip()
-            try:
-                return html.escape(pretty), True
-            except Exception:
-                return pretty, False
+            return html.escape(pretty), True
     except Exception:
         pass
     return raw, False
@@ -682,6 +833,12 @@ def _log_palette(widget: QTextEdit) -> dict[str, str]:
     }
 
 
+# Предел строк в QTextEdit-логах (log_message)
+LOG_MAX_BLOCKS = 5000
+# Предел строк в древовидном логе: при превышении старейшие 10% удаляются разом
+LOG_TREE_MAX_ROWS = 5000
+
+
 def _init_log_widget_style(widget: QTextEdit):
     try:
         if bool(widget.property('_wct_log_compact_css')):
@@ -694,6 +851,13 @@ def _init_log_widget_style(widget: QTextEdit):
         widget.document().setDefaultStyleSheet('p { margin: 0; }')
     except Exception:
         pass
+    try:
+        # Старые строки Qt выбрасывает сам: память и цена вставки не растут
+        doc = widget.document()
+        if doc.maximumBlockCount() <= 0:
+            doc.setMaximumBlockCount(LOG_MAX_BLOCKS)
+    except Exception:
+        pass
     try:
         widget.setProperty('_wct_log_compact_css', True)
     except Exception:
@@ -702,20 +866,20 @@ def _init_log_widget_style(widget: QTextEdit):
 
 def _extract_module_prefix(msg: str) -> tuple[str, str]:
     text = (msg or '').strip()
-    m = re.match(r'^\[(?P<mod>[^\]]+)\]\s*(?P<body>.*)$', text)
+    m = _MODULE_PREFIX_RE.match(text)
     if not m:
         return '', text
     module = (m.group('mod') or '').strip()
     body = (m.group('body') or '').strip()
     # Игнорируем случай, если в квадратных скобках только время.
-    if re.match(r'^\d{2}:\d{2}:\d{2}$', module):
+    if _TIME_ONLY_RE.match(module):
         return '', text
     return module, body
 
 
 def _is_section_line(msg: str) -> tuple[bool, str]:
     text = (msg or '').strip()
-    m = re.match(r'^=+\s*(.*?)\s*=+$', text)
+    m = _SECTION_LINE_RE.match(text)
     if not m:
         return False, text
     return True, (m.group(1) or '').strip()
@@ -723,11 +887,7 @@ def _is_section_line(msg: str) -> tuple[bool, str]:
 
 def _parse_sync_log_message(msg: str) -> dict[str, str] | None:
     text = (msg or '').strip()
-    m = re.match(
-        r'^\s*\((?P<kind>статья|статьи|подкатегория|подкатегории|article|articles|subcategory|subcategories)\)\s*(?P<rest>.*)$',
-        text,
-        re.I,
-    )
+    m = _SYNC_KIND_RE.match(text)
     if not m:
         return None
 
@@ -744,11 +904,7 @@ def _parse_sync_log_message(msg: str) -> dict[str, str] | None:
             'reason': (reason or '').strip(),
         }
 
-    skip_match = re.match(
-        r'^(?P<status>пропуск|skip)\s+\'(?P<title>.*)\':\s*(?P<reason>.*)$',
-        rest,
-        re.I,
-    )
+    skip_match = _SYNC_SKIP_RE.match(rest)
     if skip_match:
         reason = (skip_match.group('reason') or '').strip()
         reason_low = reason.lower()
@@ -763,11 +919,7 @@ def _parse_sync_log_message(msg: str) -> dict[str, str] | None:
             reason,
         )
 
-    already_match = re.match(
-        r'^(?P<status>уже в категории|already in category):\s*\'(?P<title>.*)\'\.?$',
-        rest,
-        re.I,
-    )
+    already_match = _SYNC_ALREADY_RE.match(rest)
     if already_match:
         return _result(
             'already',
@@ -776,11 +928,7 @@ def _parse_sync_log_message(msg: str) -> dict[str, str] | None:
             '',
         )
 
-    success_match = re.match(
-        r'^(?P<status>успех|success):\s*\'(?P<title>.*)\'\.?$',
-        rest,
-        re.I,
-    )
+    success_match = _SYNC_SUCCESS_RE.match(rest)
     if success_match:
         return _result(
             'success',
@@ -789,11 +937,7 @@ def _parse_sync_log_message(msg: str) -> dict[str, str] | None:
             '',
         )
 
-    error_match = re.match(
-        r'^(?P<status>ошибка для|error for)\s+\'(?P<title>.*)\':\s*(?P<reason>.*)$',
-        rest,
-        re.I,
-    )
+    error_match = _SYNC_ERROR_RE.match(rest)
     if error_match:
         return _result(
             'error',
@@ -833,6 +977,30 @@ def _format_sync_log_html(parsed: dict[str, str], palette: dict[str, str], level
     return body
 
 
+# Уровень строки лога по ключевым словам; порядок задаёт приоритет при нескольких совпадениях
+_LOG_LEVEL_KEYS = (
+    ('ui.log.level.stop', ('stopped', 'cancelled', 'aborted'), 'stop'),
+    ('ui.log.level.error', ('error', 'failed', 'traceback', 'exception'), 'error'),
+    ('ui.log.level.warning', ('skip', 'not found', 'missing', 'does not exist'), 'warning'),
+    ('ui.log.level.action', ('starting', 'starting preview', 'started'), 'action'),
+    ('ui.log.level.progress', ('processed', 'progress'), 'progress'),
+    ('ui.log.level.success', ('completed', 'done', 'created', 'written', 'saved', 'success'), 'success'),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _log_level_patterns() -> tuple[tuple[re.Pattern, str], ...]:
+    """Одна альтернация на уровень вместо перебора ключевых слов в Python."""
+    patterns = []
+    for key, defaults, level in _LOG_LEVEL_KEYS:
+        alternation = _locale_pattern(key, *defaults)
+        if level == 'progress':
+            # Счётчики вида «12/40» тоже считаются прогрессом
+            alternation = f'{alternation}|{_COUNTER_RE.pattern}'
+        patterns.append((re.compile(alternation), level))
+    return tuple(patterns)
+
+
 def _detect_log_level(msg: str) -> str:
     low = (msg or '').strip().lower()
     if not low:
@@ -842,44 +1010,12 @@ def _detect_log_level(msg: str) -> str:
         return sync_message.get('level') or 'info'
     # Строки считывания вида "Title: 3 строк(и)" / "Title: 3 line(s)"
     # не должны менять уровень из-за слов внутри самого заголовка.
-    if re.search(r':\s*\d+\s*(?:строк\(и\)|line\(s\))\s*$', low):
+    if _LINES_COUNT_RE.search(low):
         return 'info'
-    if any(k in low for k in _locale_tokens('ui.log.level.stop', 'stopped', 'cancelled', 'aborted')):
-        return 'stop'
-    if any(
-        k in low
-        for k in _locale_tokens(
-            'ui.log.level.error',
-            'error',
-            'failed',
-            'traceback',
-            'exception',
-        )
-    ):
-        return 'error'
-    if any(k in low for k in _locale_tokens('ui.log.level.warning', 'skip', 'not found', 'missing', 'does not exist')):
-        return 'warning'
-    if any(
-        k in low
-        for k in _locale_tokens('ui.log.level.action', 'starting', 'starting preview', 'started')
-    ):
-        return 'action'
-    if re.search(r'\b\d+\s*/\s*\d+\b', low) or any(k in low for k in _locale_tokens('ui.log.level.progress', 'processed', 'progress')):
-        return 'progress'
-    if any(
-        k in low
-        for k in _locale_tokens(
-            'ui.log.level.success',
-            'completed',
-            'done',
-            'created',
-            'written',
-            'saved',
-            'success',
-        )
-    ):
-        return 'success'
-    return 'info'
+    return next(
+        (level for pattern, level in _log_level_patterns() if pattern.search(low)),
+        'info',
+    )
 
 
 def _level_icon(level: str) -> str:
@@ -897,6 +1033,34 @@ def _level_icon(level: str) -> str:
     }.get(level, 'ℹ️')
 
 
+def _flush_log_html(widget: QTextEdit) -> None:
+    """Дописывает накопленные строки лога одной перерисовкой."""
+    pending = getattr(widget, '_wct_log_pending', None)
+    if not pending:
+        return
+    widget._wct_log_pending = []
+    widget.setUpdatesEnabled(False)
+    try:
+        for text in pending:
+            widget.append(text)
+    finally:
+        widget.setUpdatesEnabled(True)
+
+
+def _append_log_html(widget: QTextEdit, text: str) -> None:
+    """Ставит строку лога в очередь виджета; сброс — на ближайшем проходе цикла событий.
+
+    Серия сообщений из одного обработчика даёт одну перекладку и перерисовку
+    вместо N.
+    """
+    pending = getattr(widget, '_wct_log_pending', None)
+    if pending:
+        pending.append(text)
+        return
+    widget._wct_log_pending = [text]
+    QTimer.singleShot(0, widget, lambda: _flush_log_html(widget))
+
+
 def log_message(widget: QTextEdit, msg: str, debug_func=None):
     """Единый формат логов для QTextEdit: компактно, структурно, с темой.
 
@@ -912,65 +1076,66 @@ def log_message(widget: QTextEdit, msg: str, debug_func=None):
         msg = _ui_translate(widget, msg)
     _init_log_widget_style(widget)
 
+    palette = _log_palette(widget)
     try:
-        ts = datetime.now().strftime('%H:%M:%S')
-        time_html = f"<span style='color:{_log_palette(widget)['timestamp']}'>[{html.escape(ts)}]</span>"
+        ts = log_timestamp()
+        time_html = f"<span style='color:{palette['timestamp']}'>[{html.escape(ts)}]</span>"
     except Exception:
         time_html = ''
 
-    palette = _log_palette(widget)
+    # Каждая ветка только собирает строку; в буфер лога она уходит одним вызовом в конце
     is_section, section_text = _is_section_line(msg)
     if is_section:
         body = html.escape(section_text).replace('\n', '<br/>')
-        widget.append(
-            (
-                f"<div style='background:{palette['section_bg']}; "
-                f"border-left:3px solid {palette['section_border']}; "
-                f"border-radius:4px; padding:2px 7px;'>"
-                f"{time_html} "
-                f"<span style='color:{palette['action']}; font-weight:600;'>"
-                f"▸ {body}"
-                f"</span></div>"
-            )
+        html_line = (
+            f"<div style='background:{palette['section_bg']}; "
+            f"border-left:3px solid {palette['section_border']}; "
+            f"border-radius:4px; padding:2px 7px;'>"
+            f"{time_html} "
+            f"<span style='color:{palette['action']}; font-weight:600;'>"
+            f"▸ {body}"
+            f"</span></div>"
         )
-        return
-
-    module, body_raw = _extract_module_prefix(msg)
-    sync_message = _parse_sync_log_message(body_raw)
-    level = (sync_message or {}).get('level') or _detect_log_level(f"{module} {body_raw}".strip())
-    icon = _level_icon(level)
-    level_color = palette.get(level, palette['info'])
-    icon_style = f"color:{level_color};"
-    if level in {'skipped'}:
-        icon_style += "font-family:Arial,'Segoe UI Symbol',sans-serif;font-weight:900;"
-
-    if sync_message:
-        body_html = _format_sync_log_html(sync_message, palette, level_color)
     else:
-        pretty_body, pretty_escaped = pretty_format_msg(body_raw)
-        if pretty_escaped:
-            body_html = pretty_body
+        module, body_raw = _extract_module_prefix(msg)
+        sync_message = _parse_sync_log_message(body_raw)
+        level = (sync_message or {}).get('level') or _detect_log_level(f"{module} {body_raw}".strip())
+        icon = _level_icon(level)
+        level_color = palette.get(level, palette['info'])
+        icon_style = f"color:{level_color};"
+        if level in {'skipped'}:
+            icon_style += "font-family:Arial,'Segoe UI Symbol',sans-serif;font-weight:900;"
+
+        if sync_message:
+            body_html = _format_sync_log_html(sync_message, palette, level_color)
+        elif '"' not in body_raw or not body_raw.lstrip().startswith(('→', '▪️')):
+            # Быстрый путь: строка заведомо не подходит под шаблон pretty_format_msg
+            body_html = html.escape(body_raw).replace('\n', '<br/>')
         else:
-            body_html = html.escape(pretty_body).replace('\n', '<br/>')
-
-    badge_html = ''
-    if module:
-        badge_html = (
-            f"<span style='background:{palette['badge_bg']}; "
-            f"color:{palette['badge_text']}; "
-            f"border:1px solid {palette['badge_border']}; "
-            "border-radius:8px; padding:0 6px; margin-right:4px;'>"
-            f"{html.escape(module)}"
-            "</span>"
-        )
+            pretty_body, pretty_escaped = pretty_format_msg(body_raw)
+            if pretty_escaped:
+                body_html = pretty_body
+            else:
+                body_html = html.escape(pretty_body).replace('\n', '<br/>')
+
+        badge_html = ''
+        if module:
+            badge_html = (
+                f"<span style='background:{palette['badge_bg']}; "
+                f"color:{palette['badge_text']}; "
+                f"border:1px solid {palette['badge_border']}; "
+                "border-radius:8px; padding:0 6px; margin-right:4px;'>"
+                f"{html.escape(module)}"
+                "</span>"
+            )
 
-    widget.append(
-        (
+        html_line = (
             f"{time_html} {badge_html}"
             f"<span style=\"{icon_style}\">{icon}</span> "
             f"<span style='color:{palette['text']};'>{body_html}</span>"
         ).strip()
-    )
+
+    _append_log_html(widget, html_line)
 
 
 def set_start_stop_ratio(start_btn: QPushButton, stop_btn: QPushButton, ratio: int = 3):
@@ -1017,8 +1182,11 @@ def apply_cred_style(user_edit: QLineEdit, pass_edit: QLineEdit, lang_combo,
     """
     css_ok = 'background-color:#d4edda'
     css_def = ''
+    css = css_ok if ok else css_def
     for w in (user_edit, pass_edit):
-        w.setStyleSheet(css_ok if ok else css_def)
+        # Повторная установка того же CSS заставляет Qt заново разбирать и применять стиль
+        if w.styleSheet() != css:
+            w.setStyleSheet(css)
     user_edit.setReadOnly(ok)
     pass_edit.setReadOnly(ok)
     lang_combo.setEnabled(not ok)
@@ -1055,7 +1223,7 @@ def force_on_top(window, enable: bool, delay_ms: int = 0) -> None:
         # Check if we have the _stay_on_top_active attribute
         if hasattr(window, '_stay_on_top_active'):
             if enable == window._stay_on_top_active:
-                if enable:
+                if enable and not window.isActiveWindow():
                     window.raise_()
                     window.activateWindow()
                 return
@@ -1064,6 +1232,12 @@ def force_on_top(window, enable: bool, delay_ms: int = 0) -> None:
             window._stay_on_top_active = bool(enable)
 
         was_visible = window.isVisible()
+        # Флаг уже в нужном состоянии: setWindowFlag + show() лишь пересоздали бы окно (мерцание)
+        if bool(window.windowFlags() & Qt.WindowStaysOnTopHint) == window._stay_on_top_active:
+            if was_visible and window._stay_on_top_active and not window.isActiveWindow():
+                window.raise_()
+                window.activateWindow()
+            return
         window.setWindowFlag(Qt.WindowStaysOnTopHint,
                              window._stay_on_top_active)
         if was_visible:
@@ -1075,9 +1249,37 @@ def force_on_top(window, enable: bool, delay_ms: int = 0) -> None:
         pass
 
 
+@functools.lru_cache(maxsize=1)
+def _win_user32_fns():
+    """Прототипы user32 для вывода окна на передний план (Windows), один раз на процесс.
+
+    Отдельный экземпляр WinDLL, чтобы argtypes не влияли на общий ctypes.windll.user32.
+    Возвращает (ShowWindow, SetWindowPos, SetForegroundWindow) или None.
+    """
+    if not sys.platform.startswith('win'):
+        return None
+    try:
+        user32 = ctypes.WinDLL('user32')
+        show_window = user32.ShowWindow
+        show_window.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        show_window.restype = ctypes.c_int
+        set_window_pos = user32.SetWindowPos
+        set_window_pos.argtypes = [
+            ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int, ctypes.c_int,
+            ctypes.c_int, ctypes.c_int, ctypes.c_uint,
+        ]
+        set_window_pos.restype = ctypes.c_int
+        set_foreground = user32.SetForegroundWindow
+        set_foreground.argtypes = [ctypes.c_void_p]
+        set_foreground.restype = ctypes.c_int
+        return show_window, set_window_pos, set_foreground
+    except Exception:
+        return None
+
+
 def bring_to_front_sequence(window) -> None:
-    """Многократное восстановление окна на передний план с задержками,
-    чтобы перекрыть возможные асинхронные кражи фокуса.
+    """Восстанавливает окно на передний план и повторяет попытку с задержками,
+    пока окно не станет активным (перекрывает асинхронные кражи фокуса).
 
     Args:
         window: Window widget to bring to front
@@ -1089,31 +1291,42 @@ def bring_to_front_sequence(window) -> None:
                     window.showNormal()
                 window.raise_()
                 window.activateWindow()
-                # Дополнительно — WinAPI на Windows
-                if sys.platform.startswith('win'):
+                # Дополнительно — WinAPI на Windows, если Qt не удалось активировать окно
+                if sys.platform.startswith('win') and not window.isActiveWindow():
                     try:
-                        hwnd = int(window.winId())
-                        user32 = ctypes.windll.user32
-                        SW_SHOWNORMAL = 1
-                        SWP_NOSIZE = 0x0001
-                        SWP_NOMOVE = 0x0002
-                        HWND_TOPMOST = -1
-                        HWND_NOTOPMOST = -2
-                        # показать и вывести на передний план
-                        user32.ShowWindow(hwnd, SW_SHOWNORMAL)
-                        # быстрый цикл topmost -> notopmost для всплытия над другими окнами
-                        user32.SetWindowPos(
-                            hwnd, HWND_TOPMOST, 0, 0, 0, 0, SWP_NOMOVE | SWP_NOSIZE)
-                        user32.SetWindowPos(
-                            hwnd, HWND_NOTOPMOST, 0, 0, 0, 0, SWP_NOMOVE | SWP_NOSIZE)
-                        user32.SetForegroundWindow(hwnd)
+                        fns = _win_user32_fns()
+                        if fns is not None:
+                            show_window, set_window_pos, set_foreground = fns
+                            hwnd = int(window.winId())
+                            SW_SHOWNORMAL = 1
+                            SWP_NOSIZE = 0x0001
+                            SWP_NOMOVE = 0x0002
+                            HWND_TOPMOST = -1
+                            HWND_NOTOPMOST = -2
+                            # показать и вывести на передний план
+                            show_window(hwnd, SW_SHOWNORMAL)
+                            # быстрый цикл topmost -> notopmost для всплытия над другими окнами
+                            set_window_pos(
+                                hwnd, HWND_TOPMOST, 0, 0, 0, 0, SWP_NOMOVE | SWP_NOSIZE)
+                            set_window_pos(
+                                hwnd, HWND_NOTOPMOST, 0, 0, 0, 0, SWP_NOMOVE | SWP_NOSIZE)
+                            set_foreground(hwnd)
                     except Exception:
                         pass
             except Exception:
                 pass
-        # несколько попыток
-        for delay in (0, 80, 200, 400, 800, 1500):
-            QTimer.singleShot(delay, bring)
+        def retry(left: int, delay: int):
+            try:
+                if left <= 0 or window.isActiveWindow():
+                    return
+            except Exception:
+                return
+            bring()
+            QTimer.singleShot(delay, window, lambda: retry(left - 1, delay * 2))
+
+        bring()
+        # Повторы только пока окно не активно: ~100, 300, 700, 1500 мс от старта
+        QTimer.singleShot(100, window, lambda: retry(4, 200))
     except Exception:
         pass
 
@@ -1151,23 +1364,27 @@ def _resolve_ns_context_from_tree(tree: QTreeWidget):
     """
     try:
         parent = tree.parent()
-        # Вкладки хранят ссылку на главное окно в поле parent_window
-        mw = getattr(parent, 'parent_window', None) or getattr(
-            parent, 'window', lambda: None)()
-        ns_manager = getattr(mw, 'namespace_manager', None)
+        # Главное окно и его NamespaceManager не меняются за жизнь дерева — кэшируем на нём;
+        # family/lang читаем каждый раз: они меняются при смене проекта
+        cached = getattr(tree, '_wct_ns_ctx', None)
+        if cached is not None:
+            mw, ns_manager = cached
+        else:
+            # Вкладки хранят ссылку на главное окно в поле parent_window
+            mw = getattr(parent, 'parent_window', None) or getattr(
+                parent, 'window', lambda: None)()
+            ns_manager = getattr(mw, 'namespace_manager', None)
+            if ns_manager is not None:
+                tree._wct_ns_ctx = (mw, ns_manager)
         family = getattr(mw, 'current_family', None)
         lang = getattr(mw, 'current_lang', None)
 
         # Пытаемся получить выбранное пространство имён из комбобокса вкладки
         selected_ns = None
         try:
-            # parent это вкладка (RenameTab, CreateTab, ParseTab, ReplaceTab)
-            # Ищем комбобокс с именем, содержащим 'ns_combo'
-            ns_combo = (getattr(parent, 'rename_ns_combo', None) or
-                        getattr(parent, 'create_ns_combo', None) or
-                        getattr(parent, 'parse_ns_combo', None) or
-                        getattr(parent, 'rep_ns_combo', None) or
-                        getattr(parent, 'replace_ns_combo', None))
+            # parent — вкладка с древовидным логом (сейчас только RenameTab);
+            # свой комбобокс NS она публикует под общим именем _ns_combo
+            ns_combo = getattr(parent, '_ns_combo', None)
             if ns_combo and hasattr(ns_combo, 'currentData'):
                 selected_ns = ns_combo.currentData()
                 # Нормализуем: если строка 'auto', оставляем как есть; если int - оставляем
@@ -1195,20 +1412,26 @@ def _detect_object_type_by_ns(tree: QTreeWidget, title: str) -> str:
     try:
         ns_manager, family, lang, _ = _resolve_ns_context_from_tree(tree)
         if ns_manager and family and lang:
-            txt = (title or '').strip()
+            lt = (title or '').strip().lstrip('\ufeff').casefold()
+            # Кортежи префиксов кэшируются менеджером: один startswith на тип
             # Template (10) и Module (828)
-            if ns_manager.has_prefix_by_policy(family, lang, txt, {10, 828}):
+            if lt.startswith(ns_manager.policy_prefixes(family, lang, {10, 828})):
                 return 'template'
             # File (6)
-            if ns_manager.has_prefix_by_policy(family, lang, txt, {6}):
+            if lt.startswith(ns_manager.policy_prefixes(family, lang, {6})):
                 return 'file'
             # Category (14)
-            if ns_manager.has_prefix_by_policy(family, lang, txt, {14}):
+            if lt.startswith(ns_manager.policy_prefixes(family, lang, {14})):
                 return 'category'
     except Exception:
         pass
-    # Фолбэк: простая эвристика (языконезависимые части и английские слова)
-    lt = (title or '').lower()
+    return _fallback_object_type(title or '')
+
+
+@functools.lru_cache(maxsize=4096)
+def _fallback_object_type(title: str) -> str:
+    """Тип объекта без данных NS: простая эвристика (языконезависимые части и английские слова)."""
+    lt = title.lower()
     pref = lt.split(':', 1)[0].strip() if ':' in lt else ''
     if any(k in lt for k in ('template:', 'module:')) or any(k in pref for k in _locale_tokens('ui.log.object.template_prefixes', 'template', 'module', 'sablon', 'modul')):
         return 'template'
@@ -1244,7 +1467,7 @@ def _fmt_cat_with_ns(tree: QTreeWidget, cat_name: str) -> str:
     cl = cat.lower()
     if any(cl.startswith(prefix) for prefix in _locale_tokens('ui.log.object.category_prefixes', 'category:', 'kategori:')):
         return cat
-    if re.match(r'^[^\W\d_]+:', cat, re.UNICODE):
+    if _NS_PREFIX_RE.match(cat):
         return cat
     return f"{_t(tree, 'ui.log.object.category_prefix_default', 'Category:')}{cat}"
 
@@ -1260,7 +1483,7 @@ def _is_template_like_source(tree: QTreeWidget, source: str) -> bool:
     except Exception:
         pass
     sl = (source or '').lower()
-    return any(k in sl for k in ('template:', 'module:'))
+    return 'template:' in sl or 'module:' in sl
 
 
 def _strip_template_source_prefix(widget, value: str) -> str:
@@ -1300,38 +1523,38 @@ def _build_status_tooltip(tree: QTreeWidget, status: str, title: str, source: st
 
         reason = ''
         if status == 'skipped':
-            if any(token in low_title for token in _locale_tokens('ui.log.keyword.user_cancelled', 'user', 'cancel')):
+            if _low_has_token(low_title, 'ui.log.keyword.user_cancelled', 'user', 'cancel'):
                 reason = _t(tree, 'ui.log.reason.skipped_user', 'Skipped manually by the user in the confirmation dialog.')
-            elif any(token in low_title for token in _locale_tokens('ui.log.keyword.automatic', 'automatic', 'auto')):
+            elif _low_has_token(low_title, 'ui.log.keyword.automatic', 'automatic', 'auto'):
                 reason = _t(tree, 'ui.log.reason.skipped_auto', 'Skipped automatically by a saved rule.')
-            elif any(token in low_title for token in _locale_tokens('ui.log.keyword.no_changes', 'without changes', 'no changes')):
+            elif _low_has_token(low_title, 'ui.log.keyword.no_changes', 'without changes', 'no changes'):
                 reason = _t(tree, 'ui.log.reason.skipped_no_changes', 'No matching replacements were found.')
-            elif any(token in low_title for token in _locale_tokens('ui.log.keyword.empty', 'empty')):
+            elif _low_has_token(low_title, 'ui.log.keyword.empty', 'empty'):
                 reason = _t(tree, 'ui.log.reason.skipped_empty', 'The source category is empty, there is nothing to process.')
             else:
                 reason = _t(tree, 'ui.log.reason.skipped_generic', 'The change was not applied.')
         elif status == 'success':
-            if any(token in low_title for token in _locale_tokens('ui.log.keyword.renamed_success', 'renamed successfully')):
+            if _low_has_token(low_title, 'ui.log.keyword.renamed_success', 'renamed successfully'):
                 reason = _t(tree, 'ui.log.reason.success_rename', 'Renaming completed successfully.')
-            elif any(token in low_title for token in _locale_tokens('ui.log.keyword.transferred', 'transferred', 'moved')):
+            elif _low_has_token(low_title, 'ui.log.keyword.transferred', 'transferred', 'moved'):
                 reason = _t(tree, 'ui.log.reason.success_transfer', 'Changes were applied and saved.')
             else:
                 reason = _t(tree, 'ui.log.reason.success_generic', 'The operation completed successfully.')
         elif status == 'error':
             reason = _t(tree, 'ui.log.reason.error', 'The operation ended with an error; see the "Action or title" column for details.')
         elif status == 'not_found':
-            if any(token in low_title for token in _locale_tokens('ui.log.keyword.not_exists_no_pages', 'does not exist and has no pages')):
+            if _low_has_token(low_title, 'ui.log.keyword.not_exists_no_pages', 'does not exist and has no pages'):
                 reason = _t(tree, 'ui.log.reason.not_found_no_pages', 'The object does not exist and contains no pages.')
-            elif any(token in low_title for token in _locale_tokens('ui.log.keyword.not_exists', 'does not exist')):
+            elif _low_has_token(low_title, 'ui.log.keyword.not_exists', 'does not exist'):
                 reason = _t(tree, 'ui.log.reason.not_found_not_exists', 'The object does not exist.')
             else:
                 reason = _t(tree, 'ui.log.reason.not_found_generic', 'The requested object was not found.')
         else:
-            if any(token in low_title for token in _locale_tokens('ui.log.keyword.stopped', 'stopped')):
+            if _low_has_token(low_title, 'ui.log.keyword.stopped', 'stopped'):
                 reason = _t(tree, 'ui.log.reason.info_stopped', 'The process was stopped by the user.')
-            elif any(token in low_title for token in _locale_tokens('ui.log.keyword.category_transfer_start', 'category content transfer')):
+            elif _low_has_token(low_title, 'ui.log.keyword.category_transfer_start', 'category content transfer'):
                 reason = _t(tree, 'ui.log.reason.info_transfer', 'Service message about the start or progress of category content transfer.')
-            elif any(token in low_title for token in _locale_tokens('ui.log.keyword.already_exists', 'already exists')):
+            elif _low_has_token(low_title, 'ui.log.keyword.already_exists', 'already exists'):
                 reason = _t(tree, 'ui.log.reason.info_already_exists', 'The target page already exists.')
             else:
                 reason = _t(tree, 'ui.log.reason.info_generic', 'Informational message about operation progress.')
@@ -1366,6 +1589,61 @@ def _build_status_tooltip(tree: QTreeWidget, status: str, title: str, source: st
         return _t(tree, 'ui.log.detail.unavailable', 'Status details are unavailable.')
 
 
+# Роль данных строки лога с аргументами подсказок колонок «Тип» и «Статус»
+LOG_TOOLTIP_ROLE = Qt.UserRole + 41
+
+
+class _LogTooltipFilter(QObject):
+    """Строит подсказки «Тип»/«Статус» лога по требованию, а не для каждой строки."""
+
+    def __init__(self, tree: QTreeWidget):
+        super().__init__(tree)
+        self._tree = tree
+
+    def eventFilter(self, obj, event):
+        if event.type() != QEvent.ToolTip:
+            return False
+        try:
+            tree = self._tree
+            pos = event.pos()
+            item = tree.itemAt(pos)
+            col = tree.columnAt(pos.x())
+            if item is None or col not in (1, 2):
+                return False
+            args = item.data(1, LOG_TOOLTIP_ROLE)
+            if not args:
+                return False
+            status, title, source, mode, object_type, system = args
+            if col == 1:
+                tip = _build_mode_tooltip(tree, system, mode, object_type)
+            else:
+                tip = _build_status_tooltip(tree, status, title, source, mode, object_type, system)
+            QToolTip.showText(event.globalPos(), _ui_translate(tree, tip), obj)
+            return True
+        except Exception:
+            return False
+
+
+# Ширина эмодзи колонки «Тип» по ключу шрифта: одинакова для всех деревьев лога
+_TYPE_EMOJI_WIDTH_CACHE: dict[str, int] = {}
+
+
+def _type_emoji_width(fm) -> int:
+    try:
+        key = fm.font().toString()
+    except Exception:
+        key = ''
+    width = _TYPE_EMOJI_WIDTH_CACHE.get(key)
+    if width is None:
+        try:
+            width = max(fm.horizontalAdvance(e) for e in ('⚡', '✍️', '📝', '⚙️'))
+        except Exception:
+            width = 16
+        if key:
+            _TYPE_EMOJI_WIDTH_CACHE[key] = width
+    return width
+
+
 def init_log_tree(parent_widget) -> QTreeWidget:
     """Создаёт QTreeWidget для древовидного лога.
 
@@ -1413,68 +1691,65 @@ def init_log_tree(parent_widget) -> QTreeWidget:
                 hdr.setSectionResizeMode(i, QHeaderView.Interactive)
         except Exception:
             pass
+        # Одни метрики шрифта на все расчёты ширин ниже
+        fm = tree.fontMetrics()
+        header_item = tree.headerItem()
+        col_count = _log_tree_column_count(tree)
         # Базовые ширины: все колонки можно двигать, кроме «Тип».
         try:
             from PySide6.QtCore import Qt as _Qt
-            fm0 = tree.fontMetrics()
-            fmh = hdr.fontMetrics() if hasattr(hdr, 'fontMetrics') else fm0
+            fmh = hdr.fontMetrics() if hasattr(hdr, 'fontMetrics') else fm
 
             hdr.setSectionResizeMode(0, QHeaderView.Interactive)
             time_w = max(
                 72,
-                fm0.horizontalAdvance('00:00:00') + 12,
-                fmh.horizontalAdvance(tree.headerItem().text(0) or '') + 14,
+                fm.horizontalAdvance('00:00:00') + 12,
+                fmh.horizontalAdvance(header_item.text(0) or '') + 14,
             )
             tree.setColumnWidth(0, time_w)
 
             hdr.setSectionResizeMode(1, QHeaderView.Fixed)
-            try:
-                emoji_samples = ['⚡', '✍️', '📝', '⚙️']
-                emoji_w = max(fm0.horizontalAdvance(e) for e in emoji_samples)
-            except Exception:
-                emoji_w = 16
-            header_txt = tree.headerItem().text(1) or ''
+            emoji_w = _type_emoji_width(fm)
+            header_txt = header_item.text(1) or ''
             head_w = fmh.horizontalAdvance(header_txt)
             t_w = max(emoji_w + 14, head_w + 12)
             t_w = max(46, t_w)
             tree.setColumnWidth(1, t_w)
-            tree.headerItem().setTextAlignment(1, _Qt.AlignHCenter | _Qt.AlignVCenter)
+            header_item.setTextAlignment(1, _Qt.AlignHCenter | _Qt.AlignVCenter)
 
             hdr.setSectionResizeMode(2, QHeaderView.Interactive)
             try:
-                fm2 = tree.fontMetrics()
                 status_meta = _status_meta(parent_widget)
                 status_sample = f"{status_meta['skipped']['emoji']} {status_meta['skipped']['label']}"
-                header_w = fmh.horizontalAdvance(tree.headerItem().text(2) or '') + 18
-                status_w = fm2.horizontalAdvance(status_sample) + 22
+                header_w = fmh.horizontalAdvance(header_item.text(2) or '') + 18
+                status_w = fm.horizontalAdvance(status_sample) + 22
                 tree.setColumnWidth(2, max(118, status_w, header_w))
             except Exception:
                 pass
-            tree.setColumnWidth(3, max(280, fmh.horizontalAdvance(tree.headerItem().text(3) or '') + 28))
-            tree.setColumnWidth(4, max(220, fmh.horizontalAdvance(tree.headerItem().text(4) or '') + 28))
-            tree.setColumnWidth(5, max(160, fmh.horizontalAdvance(tree.headerItem().text(5) or '') + 28))
+            tree.setColumnWidth(3, max(280, fmh.horizontalAdvance(header_item.text(3) or '') + 28))
+            tree.setColumnWidth(4, max(220, fmh.horizontalAdvance(header_item.text(4) or '') + 28))
+            tree.setColumnWidth(5, max(160, fmh.horizontalAdvance(header_item.text(5) or '') + 28))
         except Exception:
             pass
         # Явно выравниваем заголовки по вертикальному центру.
         try:
             from PySide6.QtCore import Qt as _Qt
-            for col in range(tree.columnCount()):
+            for col in range(col_count):
                 align = _Qt.AlignLeft | _Qt.AlignVCenter
                 if col == 1:
                     align = _Qt.AlignHCenter | _Qt.AlignVCenter
-                tree.headerItem().setTextAlignment(col, align)
+                header_item.setTextAlignment(col, align)
         except Exception:
             pass
         # Инициально подгоним ширины по заголовкам
         try:
-            fm = tree.fontMetrics()
             extras = 16
-            for i in range(tree.columnCount()):
+            for i in range(col_count):
                 if i in (0, 1, 2):
                     continue
                 try:
                     header_w = fm.horizontalAdvance(
-                        tree.headerItem().text(i) or '') + extras
+                        header_item.text(i) or '') + extras
                     cur_w = tree.columnWidth(i)
                     if header_w > cur_w:
                         tree.setColumnWidth(i, header_w)
@@ -1486,11 +1761,76 @@ def init_log_tree(parent_widget) -> QTreeWidget:
         # Разрешаем множественное копирование и контекстное меню «Открыть» по правому клику
         enable_tree_copy_shortcut(tree)
         _enable_open_on_title_right_click(tree)
+        viewport = tree.viewport()
+        viewport.installEventFilter(_LogTooltipFilter(tree))
     except Exception:
         pass
     return tree
 
 
+# Кисти цвета статуса по строке цвета (см. _log_meta_for_lang)
+_STATUS_BRUSHES: dict[str, QBrush] = {}
+
+
+def log_tree_begin_batch(tree: QTreeWidget) -> None:
+    """Начать пакетное добавление строк: без перерисовки и автопрокрутки на каждую строку.
+
+    Вызовы могут быть вложенными; каждый должен завершаться log_tree_end_batch.
+    """
+    depth = getattr(tree, '_wct_batch_depth', 0)
+    if depth == 0:
+        tree.setUpdatesEnabled(False)
+        tree._wct_batch_rows = []
+    tree._wct_batch_depth = depth + 1
+
+
+def _log_tree_evict_oldest(tree: QTreeWidget) -> None:
+    """Срезать лог до 90% от LOG_TREE_MAX_ROWS (одна перерисовка на всё удаление)."""
+    count = tree.topLevelItemCount()
+    if count <= LOG_TREE_MAX_ROWS:
+        return
+    evict = count - LOG_TREE_MAX_ROWS * 9 // 10
+    updates = tree.updatesEnabled()
+    tree.setUpdatesEnabled(False)
+    try:
+        for _ in range(evict):
+            tree.takeTopLevelItem(0)
+    finally:
+        tree.setUpdatesEnabled(updates)
+
+
+def log_tree_end_batch(tree: QTreeWidget) -> None:
+    """Завершить пакет: вставка накопленных строк одним вызовом, одна подгонка
+    столбцов, одна перерисовка и прокрутка к последней строке."""
+    depth = getattr(tree, '_wct_batch_depth', 0) - 1
+    tree._wct_batch_depth = max(0, depth)
+    if depth > 0:
+        return
+    rows = getattr(tree, '_wct_batch_rows', None) or []
+    tree._wct_batch_rows = []
+    if rows:
+        try:
+            tree.setSortingEnabled(False)
+            tree.addTopLevelItems(rows)
+            _log_tree_evict_oldest(tree)
+            _auto_expand_columns_for_rows(tree, rows)
+        except Exception:
+            pass
+    tree.setUpdatesEnabled(True)
+    if rows:
+        try:
+            tree.scrollToItem(rows[-1])
+        except Exception:
+            try:
+                tree.scrollToBottom()
+            except Exception:
+                pass
+    try:
+        tree.viewport().update()
+    except Exception:
+        pass
+
+
 def log_tree_add(tree: QTreeWidget, timestamp: str, page: str | None, title: str,
                  mode: str, status: str, source: str | None = None,
                  object_type: str | None = None, system: bool = False) -> None:
@@ -1508,9 +1848,8 @@ def log_tree_add(tree: QTreeWidget, timestamp: str, page: str | None, title: str
         system: True для служебных записей вне группировки
     """
     try:
-        status_info = _status_meta(tree)
-        mode_info = _mode_meta(tree)
-        obj_info = _obj_meta(tree)
+        # Все справочники лога — одним обращением (язык UI определяется один раз)
+        status_info, mode_info, obj_info = _log_meta_for_lang(_ui_lang(tree))
         st = status_info.get(status, status_info['success'])
         # Тип для колонки «Тип» (режим/прямой перенос) берём из object_type аргумента,
         # а иконку в заголовке определяем ТОЛЬКО по префиксу самого title
@@ -1532,11 +1871,11 @@ def log_tree_add(tree: QTreeWidget, timestamp: str, page: str | None, title: str
         # Значок объекта переносим в начало заголовка.
         if status == 'info':
             low_title = (title or '').lower()
-            if any(token in low_title for token in _locale_tokens('ui.log.keyword.skipped', 'skipped', 'skip')):
+            if _low_has_token(low_title, 'ui.log.keyword.skipped', 'skipped', 'skip'):
                 title_cell = f"⏭️ {title or ''}"
-            elif any(token in low_title for token in _locale_tokens('ui.log.keyword.stopped', 'stopped')):
+            elif _low_has_token(low_title, 'ui.log.keyword.stopped', 'stopped'):
                 title_cell = f"⏹️ {title or ''}"
-            elif any(token in low_title for token in _locale_tokens('ui.log.keyword.already_exists', 'already exists')):
+            elif _low_has_token(low_title, 'ui.log.keyword.already_exists', 'already exists'):
                 title_cell = f"ℹ️ {title or ''}"
             else:
                 title_cell = f"{title or ''}"
@@ -1548,47 +1887,34 @@ def log_tree_add(tree: QTreeWidget, timestamp: str, page: str | None, title: str
             src_tooltip = ''
             if _is_template_like_source(tree, source) and src_cell:
                 # Показываем префикс «Ш:» и базовое имя без префикса
-                try:
-                    base = src_cell.split(
-                        ':', 1)[-1] if ':' in src_cell else src_cell
-                except Exception:
-                    base = src_cell
+                base = src_cell.split(':', 1)[-1]
                 # Особая пометка для частичных совпадений: другой значок в «Источник»
-                try:
-                    low_base = (base or '').lower()
-                except Exception:
-                    low_base = str(base or '')
+                low_base = base.lower()
                 is_partial_src = ('[partial]' in low_base) or any(token in low_base for token in _locale_tokens('ui.log.keyword.partial_tag', '[partial]'))
                 is_loc_src = ('[locative]' in low_base) or any(token in low_base for token in _locale_tokens('ui.log.keyword.locative_tag', '[locative]'))
                 # Уберём текстовые пометки из отображаемого имени
-                try:
-                    base_disp = (
-                        base.replace('[partial]', '')
-                        .replace('[locative]', '')
-                        .strip()
-                    )
-                    for token in _locale_tokens('ui.log.keyword.partial_tag', '[partial]'):
-                        base_disp = base_disp.replace(token, '').replace(token.title(), '')
-                    for token in _locale_tokens('ui.log.keyword.locative_tag', '[locative]'):
-                        base_disp = base_disp.replace(token, '').replace(token.title(), '')
-                    base_disp = base_disp.strip()
-                except Exception:
-                    base_disp = base
+                base_disp = (
+                    base.replace('[partial]', '')
+                    .replace('[locative]', '')
+                    .strip()
+                )
+                for token in _locale_tokens('ui.log.keyword.partial_tag', '[partial]'):
+                    base_disp = base_disp.replace(token, '').replace(token.title(), '')
+                for token in _locale_tokens('ui.log.keyword.locative_tag', '[locative]'):
+                    base_disp = base_disp.replace(token, '').replace(token.title(), '')
+                base_disp = base_disp.strip()
                 # Для частичных совпадений и локативов используем отдельные символы источника
                 # Полные совпадения: ⚛️ Ш:Имя; Частичные: #️⃣ Ш:Имя; Локативы: 🌐 Ш:Имя
                 src_emoji = '🌐' if is_loc_src else (
                     '#️⃣' if is_partial_src else obj_info['template']['emoji'])
                 src_cell = f"{src_emoji} {_t(tree, 'ui.log.template_source_prefix', 'T:')}{base_disp}"
                 # ToolTip для источника
-                try:
-                    if is_loc_src:
-                        src_tooltip = _t(tree, 'ui.log.source_tooltip.locative', 'Locative heuristic replacement in template parameters.')
-                    elif is_partial_src:
-                        src_tooltip = _t(tree, 'ui.log.source_tooltip.partial', 'Partial-name replacement in template parameters.')
-                    else:
-                        src_tooltip = _t(tree, 'ui.log.source_tooltip.full', 'Full category-name replacement in a template parameter.')
-                except Exception:
-                    src_tooltip = ''
+                if is_loc_src:
+                    src_tooltip = _t(tree, 'ui.log.source_tooltip.locative', 'Locative heuristic replacement in template parameters.')
+                elif is_partial_src:
+                    src_tooltip = _t(tree, 'ui.log.source_tooltip.partial', 'Partial-name replacement in template parameters.')
+                else:
+                    src_tooltip = _t(tree, 'ui.log.source_tooltip.full', 'Full category-name replacement in a template parameter.')
         except Exception:
             src_cell = source or ''
             src_tooltip = ''
@@ -1599,11 +1925,7 @@ def log_tree_add(tree: QTreeWidget, timestamp: str, page: str | None, title: str
             if not page_txt:
                 page_cell = ''
             else:
-                page_obj_type = None
-                try:
-                    page_obj_type = _detect_object_type_by_ns(tree, page_txt)
-                except Exception:
-                    page_obj_type = None
+                page_obj_type = _detect_object_type_by_ns(tree, page_txt)
                 if page_obj_type not in ('article', 'template', 'file', 'category'):
                     page_obj_type = None
                 # Для строк переноса: если тип страницы не распознан, но тип операции известен
@@ -1615,72 +1937,64 @@ def log_tree_add(tree: QTreeWidget, timestamp: str, page: str | None, title: str
 
                 # В колонке «Страница» показываем исходный заголовок как есть:
                 # полный исходный префикс без подмены (например, Kategori:, Category: и т.д.).
-                page_disp = page_txt
-                if page_obj_type == 'category':
-                    page_cell = f"{obj_info['category']['emoji']} {page_disp}"
-                elif page_obj_type == 'template':
-                    page_cell = f"{obj_info['template']['emoji']} {page_disp}"
-                elif page_obj_type == 'file':
-                    page_cell = f"{obj_info['file']['emoji']} {page_disp}"
-                else:  # article
-                    page_cell = f"{obj_info['article']['emoji']} {page_disp}"
+                page_cell = f"{obj_info[page_obj_type]['emoji']} {page_txt}"
         except Exception:
             page_cell = page or ''
-        row = QTreeWidgetItem(
-            [timestamp, action_cell, status_text, title_cell, page_cell, src_cell])
+        cells = (timestamp, action_cell, status_text, title_cell, page_cell, src_cell)
+        try:
+            cells = tuple(_ui_translate(tree, c) for c in cells)
+        except Exception:
+            pass
+        # Плоский режим, подряд-дубликаты: сравниваем с кортежем последней строки
+        # без чтения text() из Qt (дерево могли очистить — тогда сравнение не действует)
+        # и вместо новой строки дописываем счётчик повторов «(×N)» к заголовку последней
+        pending = getattr(tree, '_wct_batch_rows', None) if getattr(tree, '_wct_batch_depth', 0) else None
+        if cells == getattr(tree, '_wct_last_row_cells', None) and (pending or tree.topLevelItemCount()):
+            try:
+                tree._wct_last_row_count += 1
+                tree._wct_last_row_item.setText(3, f'{cells[3]} (×{tree._wct_last_row_count})')
+            except Exception:
+                pass
+            return
+        row = QTreeWidgetItem(list(cells))
         try:
             for col in range(6):
-                row.setText(col, _ui_translate(tree, row.text(col)))
                 if col == 1:
                     row.setTextAlignment(col, Qt.AlignHCenter | Qt.AlignVCenter)
                 else:
                     row.setTextAlignment(col, Qt.AlignLeft | Qt.AlignVCenter)
         except Exception:
             pass
-        # Цвет статуса
+        # Цвет статуса: кисти на небольшой фиксированный набор цветов создаются один раз
         try:
-            from PySide6.QtGui import QBrush, QColor
-            row.setForeground(2, QBrush(QColor(st['color'])))
+            color = st['color']
+            brush = _STATUS_BRUSHES.get(color)
+            if brush is None:
+                brush = _STATUS_BRUSHES[color] = QBrush(QColor(color))
+            row.setForeground(2, brush)
         except Exception:
             pass
-        # Tooltips для колонок с эмодзи
+        # Подсказки «Тип»/«Статус» строятся при наведении (см. _LogTooltipFilter):
+        # в строке хранится только компактный кортеж аргументов
         try:
-            row.setToolTip(1, _build_mode_tooltip(
-                tree,
-                system, mode, object_type))
-            row.setToolTip(2, _build_status_tooltip(
-                tree, status, title or '', source, mode, object_type, system))
-            # Отключаем подсказки для 3 и 4 колонок
-            row.setToolTip(3, '')
-            row.setToolTip(4, '')
+            row.setData(1, LOG_TOOLTIP_ROLE, (status, title or '', source, mode, object_type, system))
             # Подсказка для «Источник»: различаем полное/частичное исправление
-            try:
-                if src_tooltip:
-                    row.setToolTip(5, src_tooltip)
-            except Exception:
-                pass
-            try:
-                for col in range(6):
-                    row.setToolTip(col, _ui_translate(tree, row.toolTip(col)))
-            except Exception:
-                pass
+            if src_tooltip:
+                row.setToolTip(5, _ui_translate(tree, src_tooltip))
         except Exception:
             pass
-        # Плоский режим: всегда добавляем как верхнеуровневую строку (с защитой от подряд-дубликатов)
+        tree._wct_last_row_cells = cells
+        tree._wct_last_row_item = row
+        tree._wct_last_row_count = 1
+        if pending is not None:
+            # В пакете: вставка, подгонка столбцов и прокрутка — один раз в log_tree_end_batch
+            pending.append(row)
+            return
+        tree.addTopLevelItem(row)
         try:
-            root = tree.invisibleRootItem()
-            if root and root.childCount() > 0:
-                last = root.child(root.childCount() - 1)
-                same = True
-                for i in range(tree.columnCount()):
-                    if (last.text(i) or '') != (row.text(i) or ''):
-                        same = False
-                        break
-                if same:
-                    return
+            _log_tree_evict_oldest(tree)
         except Exception:
             pass
-        tree.addTopLevelItem(row)
         # Авторасширение столбцов под содержимое новой строки (без сужения и без влияния на «Тип»)
         try:
             _auto_expand_columns_for_row(tree, row)
@@ -1698,6 +2012,63 @@ def log_tree_add(tree: QTreeWidget, timestamp: str, page: str | None, title: str
         pass
 
 
+# Разбор строк лога переименования: шаблоны компилируются один раз на модуль
+_LOG_TAG_RE = re.compile(r'<[^>]+>')
+_LOG_RENAME_BEGIN_RE = re.compile(r"(?P<prefix>[^:]+):\s*(?P<old>.+?)\s*→\s*(?P<new>.+)$")
+_LOG_EMOJI_LINE_RE = re.compile(
+    r"📁\s*(?P<cat>[^•]+)\s*•\s*📄\s*(?P<title>[^—]+)\s*—\s*(?P<status>[^()]+?)(?:\s*\((?P<src>[^)]+)\))?\s*$")
+_LOG_BOLD_MESSAGE_RE = re.compile(r"<b>(?P<title>[^<]+)</b>\s*(?P<tail>[^<]+)", re.I)
+_LOG_TRAILING_SOURCE_RE = re.compile(r'\(([^)]+)\)\s*$')
+_LOG_ARROW_CAT_TITLE_RE = re.compile(r"→\s*(?P<cat>[^:]+:.+?)\s*:\s*\"(?P<title>[^\"]+)\"")
+# «Источник» с одним числом страниц: такие ячейки не открываются из контекстного меню
+_LOG_SOURCE_COUNT_RE = re.compile(r'^\s*\d+(?:\s+\w+)?\s*$', re.I)
+# Суффикс подряд-повторов, который log_tree_add дописывает к заголовку
+_LOG_REPEAT_SUFFIX_RE = re.compile(r'\s\(×\d+\)$')
+# Значки объектов/источников в начале ячеек (вместе с пробелом; часть из них — с VS16)
+_TITLE_EMOJI_PREFIXES = ('📄 ', '⚛️ ', '🖼️ ', '📁 ')
+_SOURCE_EMOJI_PREFIXES = ('🌐 ', '#️⃣ ')
+# Тип объекта → NS для ссылок «Открыть» (article — без префикса)
+_NS_BY_TYPE = {'template': 10, 'file': 6, 'category': 14}
+# Значок в колонке «Страница» → NS
+_NS_BY_PAGE_EMOJI = {'📁 ': 14, '⚛️ ': 10, '🖼️ ': 6}
+
+
+@functools.lru_cache(maxsize=512)
+def _normalize_log_line(s: str) -> tuple[str, re.Match | None]:
+    """Раскодированная строка лога и совпадение _LOG_EMOJI_LINE_RE (или None).
+
+    Не зависит от дерева/языка UI — повторяющиеся сообщения воркеров берутся из кэша.
+    """
+    # 1) Попытка распарсить сообщения нашего нового формата с эмодзи
+    # (без обоих значков строка заведомо не подходит — регулярку не запускаем)
+    m = _LOG_EMOJI_LINE_RE.search(s) if ('📁' in s and '📄' in s) else None
+    if m:
+        return s, m
+    # 2) Попытка разобрать старый формат через pretty_format_msg
+    # (он меняет только строки «→/▪️ … "Заголовок" — …»; остальные лишь раскодируем)
+    if '"' in s and s.startswith(('→', '▪️')):
+        pretty, _ = pretty_format_msg(s)
+        s = html.unescape(pretty)
+        return s, _LOG_EMOJI_LINE_RE.search(s)
+    return html.unescape(s), None
+
+
+def _strip_emoji_prefix(text: str, prefixes: tuple = _TITLE_EMOJI_PREFIXES) -> str:
+    """Убрать ведущий значок из ``prefixes`` (если есть)."""
+    if text.startswith(prefixes):
+        for p in prefixes:
+            if text.startswith(p):
+                return text[len(p):].strip()
+    return text
+
+
+@functools.lru_cache(maxsize=1)
+def _log_category_line_re() -> re.Pattern:
+    """Строка «Категория <b>Имя</b> хвост»; слово «категория» берётся из локалей."""
+    category_pat = _locale_pattern('ui.log.parse.category_word', 'category')
+    return re.compile(rf"(?:{category_pat})\s*<b>(?P<cat>[^<]+)</b>\s*(?P<tail>[^<]+)", re.I)
+
+
 def log_tree_parse_and_add(tree: QTreeWidget, raw_msg: str) -> None:
     """Разобрать текст сообщения и добавить в древовидный лог.
     Реагирует на формат вида: "📁 Категория … • 📄 Заголовок — … (Источник)".
@@ -1705,23 +2076,16 @@ def log_tree_parse_and_add(tree: QTreeWidget, raw_msg: str) -> None:
     try:
         s = (raw_msg or '').strip()
         # Время — текущее
-        ts = datetime.now().strftime('%H:%M:%S')
+        ts = log_timestamp()
         # 0) Спец-обработка системных сообщений переименования
         try:
-            import re as _re0
             # Приводим к plain‑тексту для устойчивого парсинга
-            plain = html.unescape(_re0.sub(r'<[^>]+>', '', s))
-            m_begin = _re0.search(
-                r"(?P<prefix>[^:]+):\s*(?P<old>.+?)\s*→\s*(?P<new>.+)$",
-                plain,
-            )
+            plain = html.unescape(_LOG_TAG_RE.sub('', s))
+            m_begin = _LOG_RENAME_BEGIN_RE.search(plain)
             if m_begin and any((m_begin.group('prefix') or '').strip().lower().startswith(token) for token in _locale_tokens('ui.log.keyword.rename_started', 'starting rename')):
-                try:
-                    global _LAST_RENAME_OLD, _LAST_RENAME_NEW
-                    _LAST_RENAME_OLD = (m_begin.group('old') or '').strip()
-                    _LAST_RENAME_NEW = (m_begin.group('new') or '').strip()
-                except Exception:
-                    pass
+                global _LAST_RENAME_OLD, _LAST_RENAME_NEW
+                _LAST_RENAME_OLD = (m_begin.group('old') or '').strip()
+                _LAST_RENAME_NEW = (m_begin.group('new') or '').strip()
                 # Определяем тип объекта для правильного отображения
                 obj_type = _detect_object_type_by_ns(tree, _LAST_RENAME_OLD)
                 # В колонку «Страница» помещаем старое имя (независимо от типа)
@@ -1736,12 +2100,8 @@ def log_tree_parse_and_add(tree: QTreeWidget, raw_msg: str) -> None:
                              'manual', 'success', None, obj_type, True)
                 return
             if _has_locale_token(plain, 'ui.log.keyword.renamed_success', 'renamed successfully'):
-                try:
-                    new_name = _LAST_RENAME_NEW or ''
-                    old_name = _LAST_RENAME_OLD or ''
-                except Exception:
-                    new_name = ''
-                    old_name = ''
+                new_name = _LAST_RENAME_NEW or ''
+                old_name = _LAST_RENAME_OLD or ''
                 # Определяем тип по старому имени (которое мы запомнили при начале переименования)
                 obj_type = _detect_object_type_by_ns(
                     tree, old_name) if old_name else 'article'
@@ -1752,15 +2112,8 @@ def log_tree_parse_and_add(tree: QTreeWidget, raw_msg: str) -> None:
         except Exception:
             pass
 
-        # 1) Попытка распарсить сообщения нашего нового формата с эмодзи
-        m = re.search(
-            r"📁\s*(?P<cat>[^•]+)\s*•\s*📄\s*(?P<title>[^—]+)\s*—\s*(?P<status>[^()]+?)(?:\s*\((?P<src>[^)]+)\))?\s*$", s)
-        if not m:
-            # 2) Попытка разобрать старый формат через pretty_format_msg
-            pretty, _ = pretty_format_msg(s)
-            s = html.unescape(pretty)
-            m = re.search(
-                r"📁\s*(?P<cat>[^•]+)\s*•\s*📄\s*(?P<title>[^—]+)\s*—\s*(?P<status>[^()]+?)(?:\s*\((?P<src>[^)]+)\))?\s*$", s)
+        # 1–2) Формат с эмодзи (в т.ч. после pretty_format_msg)
+        s, m = _normalize_log_line(s)
         if m:
             cat = html.unescape((m.group('cat') or '').strip())
             title = html.unescape((m.group('title') or '').strip())
@@ -1788,12 +2141,7 @@ def log_tree_parse_and_add(tree: QTreeWidget, raw_msg: str) -> None:
                          status, source, object_type)
             return
 
-        category_pat = _locale_pattern('ui.log.parse.category_word', 'category')
-        category_line = re.search(
-            rf"(?:{category_pat})\s*<b>(?P<cat>[^<]+)</b>\s*(?P<tail>[^<]+)",
-            s,
-            re.I,
-        )
+        category_line = _log_category_line_re().search(s)
         if category_line:
             cat = html.unescape((category_line.group('cat') or '').strip())
             tail = html.unescape((category_line.group('tail') or '').strip()).lower()
@@ -1827,11 +2175,7 @@ def log_tree_parse_and_add(tree: QTreeWidget, raw_msg: str) -> None:
                 log_tree_add(tree, ts, None, title, 'manual',
                              'skipped', 'API', 'category', True)
                 return
-        bold_message = re.search(
-            r"<b>(?P<title>[^<]+)</b>\s*(?P<tail>[^<]+)",
-            s,
-            re.I,
-        )
+        bold_message = _LOG_BOLD_MESSAGE_RE.search(s)
         if bold_message:
             title0 = html.unescape((bold_message.group('title') or '').strip())
             tail = html.unescape((bold_message.group('tail') or '').strip()).lower()
@@ -1855,29 +2199,27 @@ def log_tree_parse_and_add(tree: QTreeWidget, raw_msg: str) -> None:
             # Сообщения с префиксом ℹ️ считаем информационными
             if s.strip().startswith('ℹ️'):
                 status = 'info'
-            if _has_locale_token(s_lower, 'ui.log.keyword.stopped', 'stopped'):
+            if _low_has_token(s_lower, 'ui.log.keyword.stopped', 'stopped'):
                 status = 'info'
-            if _has_locale_token(s_lower, 'ui.log.keyword.error', 'error', 'failed', 'traceback'):
+            if _low_has_token(s_lower, 'ui.log.keyword.error', 'error', 'failed', 'traceback'):
                 status = 'error'
-            elif _has_locale_token(s_lower, 'ui.log.keyword.not_found', 'not found', 'does not exist'):
+            elif _low_has_token(s_lower, 'ui.log.keyword.not_found', 'not found', 'does not exist'):
                 status = 'not_found'
-            elif _has_locale_token(s_lower, 'ui.log.keyword.skipped', 'skipped', 'skip'):
+            elif _low_has_token(s_lower, 'ui.log.keyword.skipped', 'skipped', 'skip'):
                 status = 'skipped'
-            elif _has_locale_token(s_lower, 'ui.log.keyword.already_exists', 'already exists'):
+            elif _low_has_token(s_lower, 'ui.log.keyword.already_exists', 'already exists'):
                 status = 'info'
-            if _has_locale_token(s_lower, 'ui.log.keyword.category_rename_skipped_transfer', 'category rename skipped while transferring contents'):
+            if _low_has_token(s_lower, 'ui.log.keyword.category_rename_skipped_transfer', 'category rename skipped while transferring contents'):
                 status = 'info'
-            mode = 'auto' if _has_locale_token(s_lower, 'ui.log.keyword.automatic', 'automatic', 'auto') else 'manual'
+            mode = 'auto' if _low_has_token(s_lower, 'ui.log.keyword.automatic', 'automatic', 'auto') else 'manual'
             # Удалим HTML-теги, но сохраним текст
-            import re as _re
-            plain = html.unescape(_re.sub(r'<[^>]+>', '', s))
+            plain = html.unescape(_LOG_TAG_RE.sub('', s))
             # Попробуем выделить источник из скобок в конце
-            msrc = _re.search(r'\(([^)]+)\)\s*$', plain)
+            msrc = _LOG_TRAILING_SOURCE_RE.search(plain)
             src = msrc.group(1) if msrc else ''
             title = plain if not msrc else plain[:msrc.start()].rstrip()
             # Попробуем выделить «→ Категория:… : "Заголовок" …»
-            mcat = _re.search(
-                r"→\s*(?P<cat>[^:]+:.+?)\s*:\s*\"(?P<title>[^\"]+)\"", title)
+            mcat = _LOG_ARROW_CAT_TITLE_RE.search(title)
             if mcat:
                 cat_guess = (mcat.group('cat') or '').strip()
                 title_guess = (mcat.group('title') or '').strip()
@@ -1903,66 +2245,73 @@ def log_tree_parse_and_add(tree: QTreeWidget, raw_msg: str) -> None:
 def log_tree_help_html(widget=None) -> str:
     """Возвращает HTML-справку по обозначениям лога (эмодзи и цвета)."""
     try:
-        status_info = _status_meta(widget)
-        mode_info = _mode_meta(widget)
-        rows = [
-            status_info['success'],
-            status_info['skipped'],
-            status_info['error'],
-            status_info['not_found'],
-        ]
-
-        def _row(s):
-            return (f"<tr>"
-                    f"<td style='padding:4px 8px'>{s['emoji']}</td>"
-                    f"<td style='padding:4px 8px'><span style='color:{s['color']}'><b>{s['label']}</b></span></td>"
-                    f"</tr>")
-        status_table = "".join(_row(s) for s in rows)
-        mode_rows = (
-            f"<tr><td style='padding:4px 8px'>{mode_info['auto']['emoji']}</td><td style='padding:4px 8px'><b>{mode_info['auto']['label']}</b> - {_t(widget, 'ui.log.help.mode.auto', 'automatic mode')}</td></tr>"
-            f"<tr><td style='padding:4px 8px'>{mode_info['manual']['emoji']}</td><td style='padding:4px 8px'><b>{mode_info['manual']['label']}</b> - {_t(widget, 'ui.log.help.mode.manual', 'manual mode')}</td></tr>"
-        )
-        html_text = (
-            "<div style='font-size:12px;line-height:1.35'>"
-            f"<h3 style='margin:6px 0'>{_t(widget, 'ui.log.help.title', 'Log legend')}</h3>"
-            f"<p>{_t(widget, 'ui.log.help.description', 'Time is always shown in the first column. Entries are grouped by categories as root tree nodes. Columns: Time, Action or title, Status.')}</p>"
-            f"<h4 style='margin:6px 0'>{_t(widget, 'ui.log.help.statuses', 'Statuses')}</h4>"
-            f"<table style='border-collapse:collapse'>{status_table}</table>"
-            f"<h4 style='margin:6px 8px 4px 0'>{_t(widget, 'ui.log.help.modes', 'Modes')}</h4>"
-            f"<table style='border-collapse:collapse'>{mode_rows}</table>"
-            f"<p>{_t(widget, 'ui.log.help.example', 'Example entry:')} <code>⚡ Title ({_t(widget, 'ui.log.object.template', 'Template')}:Categories)</code></p>"
-            "</div>"
-        )
-        return html_text
+        return _log_help_html_for_lang(_ui_lang(widget))
     except Exception:
         return _t(widget, 'ui.log.help.unavailable', 'Legend is unavailable')
 
 
+@functools.lru_cache(maxsize=4)
+def _log_help_html_for_lang(lang: str) -> str:
+    """HTML легенды лога для языка UI; зависит только от статичных словарей — собирается один раз."""
+    def tr(key: str, default: str) -> str:
+        return translate_key(key, lang, default)
+
+    status_info, mode_info, _ = _log_meta_for_lang(lang)
+    rows = [
+        status_info['success'],
+        status_info['skipped'],
+        status_info['error'],
+        status_info['not_found'],
+    ]
+
+    def _row(s):
+        return (f"<tr>"
+                f"<td style='padding:4px 8px'>{s['emoji']}</td>"
+                f"<td style='padding:4px 8px'><span style='color:{s['color']}'><b>{s['label']}</b></span></td>"
+                f"</tr>")
+    status_table = "".join(_row(s) for s in rows)
+    mode_rows = (
+        f"<tr><td style='padding:4px 8px'>{mode_info['auto']['emoji']}</td><td style='padding:4px 8px'><b>{mode_info['auto']['label']}</b> - {tr('ui.log.help.mode.auto', 'automatic mode')}</td></tr>"
+        f"<tr><td style='padding:4px 8px'>{mode_info['manual']['emoji']}</td><td style='padding:4px 8px'><b>{mode_info['manual']['label']}</b> - {tr('ui.log.help.mode.manual', 'manual mode')}</td></tr>"
+    )
+    html_text = (
+        "<div style='font-size:12px;line-height:1.35'>"
+        f"<h3 style='margin:6px 0'>{tr('ui.log.help.title', 'Log legend')}</h3>"
+        f"<p>{tr('ui.log.help.description', 'Time is always shown in the first column. Entries are grouped by categories as root tree nodes. Columns: Time, Action or title, Status.')}</p>"
+        f"<h4 style='margin:6px 0'>{tr('ui.log.help.statuses', 'Statuses')}</h4>"
+        f"<table style='border-collapse:collapse'>{status_table}</table>"
+        f"<h4 style='margin:6px 8px 4px 0'>{tr('ui.log.help.modes', 'Modes')}</h4>"
+        f"<table style='border-collapse:collapse'>{mode_rows}</table>"
+        f"<p>{tr('ui.log.help.example', 'Example entry:')} <code>⚡ Title ({tr('ui.log.object.template', 'Template')}:Categories)</code></p>"
+        "</div>"
+    )
+    return html_text
+
+
+def _log_tree_column_count(tree: QTreeWidget) -> int:
+    """Число столбцов дерева; задаётся один раз при создании, поэтому кэшируется на дереве."""
+    count = getattr(tree, '_wct_column_count', None)
+    if count is None:
+        count = tree._wct_column_count = tree.columnCount()
+    return count
+
+
 def enable_tree_copy_shortcut(tree: QTreeWidget) -> None:
     """Включает копирование в буфер обмена выделенных строк таблицы (все столбцы, TSV).
     Работает с Ctrl+C и Shift+Insert.
     """
+    # Повторный вызов не должен добавлять вторую пару QShortcut (двойное копирование)
+    if getattr(tree, '_wct_copy_shortcut_installed', False):
+        return
+    tree._wct_copy_shortcut_installed = True
     try:
         def _collect_selected_rows() -> list[QTreeWidgetItem]:
-            # Возвращаем строки в визуальном порядке обхода дерева
-            selected = set(tree.selectedItems())
+            # Возвращаем строки в визуальном порядке обхода дерева; обход — на стороне Qt
             result: list[QTreeWidgetItem] = []
-            root = tree.invisibleRootItem()
-
-            def walk(parent):
-                for i in range(parent.childCount()):
-                    it = parent.child(i)
-                    if it in selected:
-                        result.append(it)
-                    if it.childCount() > 0:
-                        walk(it)
-            # top-level
-            for i in range(root.childCount()):
-                it = root.child(i)
-                if it in selected:
-                    result.append(it)
-                if it.childCount() > 0:
-                    walk(it)
+            it = QTreeWidgetItemIterator(tree, QTreeWidgetItemIterator.Selected)
+            while it.value():
+                result.append(it.value())
+                it += 1
             return result
 
         def _copy():
@@ -1970,24 +2319,23 @@ def enable_tree_copy_shortcut(tree: QTreeWidget) -> None:
                 rows = _collect_selected_rows()
                 if not rows:
                     return
-                # Заголовок
-                hdr = [tree.headerItem().text(i)
-                       for i in range(tree.columnCount())]
-                lines = ['\t'.join(hdr)]
-                for it in rows:
-                    cols = [it.text(i) for i in range(tree.columnCount())]
-                    lines.append('\t'.join(cols))
-                txt = '\n'.join(lines)
-                QGuiApplication.clipboard().setText(txt)
+                # Заголовок: тексты читаем каждый раз — главное окно переводит их при смене языка
+                columns = range(_log_tree_column_count(tree))
+                header = tree.headerItem()
+                hdr = '\t'.join(header.text(i) for i in columns)
+                body = '\n'.join('\t'.join(it.text(i) for i in columns) for it in rows)
+                QGuiApplication.clipboard().setText(f'{hdr}\n{body}')
             except Exception:
                 pass
 
-        for seq in (QKeySequence.Copy, QKeySequence(Qt.SHIFT | Qt.Key_Insert)):
-            try:
-                sc = QShortcut(seq, tree)
-                sc.activated.connect(_copy)
-            except Exception:
-                pass
+        # Один QShortcut на все сочетания: системные «Копировать» + Shift+Insert
+        keys = list(QKeySequence.keyBindings(QKeySequence.Copy))
+        extra = QKeySequence(Qt.SHIFT | Qt.Key_Insert)
+        if extra not in keys:
+            keys.append(extra)
+        sc = QShortcut(tree)
+        sc.setKeys(keys)
+        sc.activated.connect(_copy)
     except Exception:
         pass
 
@@ -2000,8 +2348,16 @@ def _enable_open_on_title_right_click(tree: QTreeWidget) -> None:
     - Для «Страница» используем тип из эмодзи (📄/⚛️/🖼️/📁) и открываем исходный заголовок.
     - Для «Источник» открываем как шаблон (удалив эмодзи и префикс «Ш:»).
     """
+    if getattr(tree, '_wct_open_menu_installed', False):
+        return
+    tree._wct_open_menu_installed = True
     try:
         from PySide6.QtWidgets import QMenu
+        # Импорт один раз на дерево, а не на каждый клик «Открыть»
+        try:
+            from ..dialogs.template_review_dialog import TemplateReviewDialog
+        except Exception:
+            TemplateReviewDialog = None
 
         def _show_menu(pos):
             try:
@@ -2022,20 +2378,21 @@ def _enable_open_on_title_right_click(tree: QTreeWidget) -> None:
                 # Дополнительно блокируем текстовые «служебные» строки — только для колонки 3
                 if col == 3:
                     raw_all = ' '.join([(item.text(i) or '') for i in range(
-                        tree.columnCount())]).strip().lower()
+                        _log_tree_column_count(tree))]).strip().lower()
                     if _has_locale_token(raw_all, 'ui.log.keyword.category_rename_skipped_transfer', 'category rename skipped while transferring contents'):
                         return
                 raw_text = (item.text(col) or '').strip()
+                if col == 3:
+                    # Счётчик повторов «(×N)» — не часть заголовка
+                    raw_text = _LOG_REPEAT_SUFFIX_RE.sub('', raw_text)
                 if not raw_text:
                     return
                 # Для колонки «Источник»: не показываем меню, если это просто количество страниц
                 if col == 5:
                     try:
-                        import re as _re
-                        txt_plain = raw_text
-                        if txt_plain[:2] in ('⚛️ ', '#️⃣ ', '📁 ', '📄 ', '🖼️ '):
-                            txt_plain = txt_plain[2:].strip()
-                        if _re.match(r'^\s*\d+(?:\s+\w+)?\s*$', txt_plain, _re.I | _re.UNICODE):
+                        txt_plain = _strip_emoji_prefix(
+                            raw_text, _TITLE_EMOJI_PREFIXES + _SOURCE_EMOJI_PREFIXES)
+                        if _LOG_SOURCE_COUNT_RE.match(txt_plain):
                             return
                     except Exception:
                         pass
@@ -2049,9 +2406,7 @@ def _enable_open_on_title_right_click(tree: QTreeWidget) -> None:
                         pass
                     # Дополнительная эвристика: исключаем строки с явными действиями/стрелками/длинными подписями
                     try:
-                        ttxt = raw_text
-                        if ttxt[:2] in ('📄 ', '🧩 ', '🖼️ ', '📁 '):
-                            ttxt = ttxt[2:].strip()
+                        ttxt = _strip_emoji_prefix(raw_text, _TITLE_EMOJI_PREFIXES + ('🧩 ',))
                         low_t = ttxt.lower()
                         if (
                             ('→' in ttxt)
@@ -2073,13 +2428,9 @@ def _enable_open_on_title_right_click(tree: QTreeWidget) -> None:
                             tree)
                         if not (ns_manager and family and lang):
                             return
-                        try:
-                            from ..dialogs.template_review_dialog import TemplateReviewDialog
-                            host = TemplateReviewDialog.build_host(
-                                family, lang)
-                        except Exception:
+                        if TemplateReviewDialog is None:
                             return
-                        import urllib.parse as _up
+                        host = TemplateReviewDialog.build_host(family, lang)
 
                         def _add_prefix(title_base: str, ns_id: int | None) -> str:
                             if not ns_id:
@@ -2091,25 +2442,21 @@ def _enable_open_on_title_right_click(tree: QTreeWidget) -> None:
                             except Exception:
                                 pass
                             try:
-                                from ...constants import DEFAULT_EN_NS as _DEN
                                 pref = ns_manager.get_policy_prefix(
-                                    family, lang, ns_id, _DEN.get(ns_id, '')) if ns_manager else ''
+                                    family, lang, ns_id, DEFAULT_EN_NS.get(ns_id, '')) if ns_manager else ''
                             except Exception:
-                                from ...constants import DEFAULT_EN_NS as _DEN
-                                pref = _DEN.get(ns_id, '')
+                                pref = DEFAULT_EN_NS.get(ns_id, '')
                             return (pref + title_base) if pref else title_base
 
-                        txt = raw_text
                         # Сначала удалим возможные эмодзи
-                        if txt[:2] in ('📄 ', '⚛️ ', '🖼️ ', '📁 '):
-                            txt = txt[2:].strip()
+                        txt = _strip_emoji_prefix(raw_text)
                         # Для «Источник»: уберём ведущие эмодзи и любой префикс до «Ш:»
                         if col == 5:
                             stripped = _strip_template_source_prefix(tree, txt)
                             if stripped != txt:
                                 txt = stripped
-                            elif txt[:2] in ('🌐 ', '#️⃣ '):
-                                txt = txt[2:].strip()
+                            else:
+                                txt = _strip_emoji_prefix(txt, _SOURCE_EMOJI_PREFIXES)
 
                         # Колонка 3: заголовок — определяем ns с учетом приоритета выбранного пространства имён
                         if col == 3:
@@ -2120,40 +2467,22 @@ def _enable_open_on_title_right_click(tree: QTreeWidget) -> None:
                             # Приоритет 2: Если "Авто" или не определено - автоматически по содержимому
                             elif not selected_ns or (isinstance(selected_ns, str) and selected_ns in ('auto', '')):
                                 # Определяем тип объекта по самому заголовку через NamespaceManager
-                                obj_type_detected = _detect_object_type_by_ns(
-                                    tree, txt)
-                                if obj_type_detected == 'template':
-                                    ns_id = 10
-                                elif obj_type_detected == 'file':
-                                    ns_id = 6
-                                elif obj_type_detected == 'category':
-                                    ns_id = 14
                                 # 'article' — обычная статья (ns_id None)
+                                ns_id = _NS_BY_TYPE.get(
+                                    _detect_object_type_by_ns(tree, txt))
                             full_title = _add_prefix(txt, ns_id)
                         elif col == 4:
                             # Страница (колонка 4): определяем тип по эмодзи,
                             # но оставляем исходный заголовок (полный префикс).
                             txt_base = txt
-                            detected_ns = None
-                            # Тип берём из исходного текста с эмодзи (до среза).
-                            if raw_text.startswith('📁 '):
-                                detected_ns = 14  # категория
-                            elif raw_text.startswith('⚛️ '):
-                                detected_ns = 10  # шаблон/модуль
-                            elif raw_text.startswith('🖼️ '):
-                                detected_ns = 6   # файл
-                            else:
-                                detected_ns = None  # статья/прочее
+                            # Тип берём из исходного текста с эмодзи (до среза); статья/прочее — None.
+                            detected_ns = next(
+                                (ns for emo, ns in _NS_BY_PAGE_EMOJI.items() if raw_text.startswith(emo)), None)
 
                             # Фолбэк на определение по префиксу (на случай нестандартного формата строки).
                             if detected_ns is None:
-                                obj_type_detected = _detect_object_type_by_ns(tree, txt_base)
-                                if obj_type_detected == 'template':
-                                    detected_ns = 10
-                                elif obj_type_detected == 'file':
-                                    detected_ns = 6
-                                elif obj_type_detected == 'category':
-                                    detected_ns = 14
+                                detected_ns = _NS_BY_TYPE.get(
+                                    _detect_object_type_by_ns(tree, txt_base))
 
                             # Применяем логику приоритета
                             ns_id = None
@@ -2177,7 +2506,7 @@ def _enable_open_on_title_right_click(tree: QTreeWidget) -> None:
                         if not full_title:
                             return
                         url = f"https://{host}/wiki/" + \
-                            _up.quote(full_title.replace(' ', '_'))
+                            urllib.parse.quote(full_title.replace(' ', '_'))
                         QDesktopServices.openUrl(QUrl(url))
                     except Exception:
                         pass
@@ -2193,7 +2522,12 @@ def _enable_open_on_title_right_click(tree: QTreeWidget) -> None:
 
 
 def _auto_expand_columns_for_row(tree: QTreeWidget, row: QTreeWidgetItem) -> None:
-    """Расширяет столбцы при необходимости под содержимое добавленной строки.
+    """Расширяет столбцы при необходимости под содержимое добавленной строки."""
+    _auto_expand_columns_for_rows(tree, (row,))
+
+
+def _auto_expand_columns_for_rows(tree: QTreeWidget, rows) -> None:
+    """Расширяет столбцы при необходимости под содержимое добавленных строк.
 
     Не сужает уже выставленную пользователем ширину и не трогает колонку «Тип».
     """
@@ -2213,44 +2547,51 @@ def _auto_expand_columns_for_row(tree: QTreeWidget, row: QTreeWidgetItem) -> Non
                 vp_w = tree.width()
             except Exception:
                 vp_w = 0
-        for col in range(tree.columnCount()):
+        # Верхняя оценка ширины строки: символов × самый широкий глиф шрифта
+        try:
+            max_cw = fm.maxWidth()
+        except Exception:
+            max_cw = 0
+        for col in range(_log_tree_column_count(tree)):
             if col in (0, 1, 2):
                 continue  # не трогаем «Время», «Тип», «Статус»
             try:
-                txt = row.text(col) or ''
-                # Учитываем метрику текста и особенности эмодзи/иконок
-                try:
-                    w1 = fm.horizontalAdvance(txt)
-                except Exception:
-                    w1 = 0
-                try:
-                    w2 = fm.boundingRect(txt).width()
-                except Exception:
-                    w2 = 0
-                width_needed = max(w1, w2) + padding
-                # Небольшой запас на внутренние отступы и возможные отличия метрик эмодзи
-                extra = 5
-                if col == 3:
-                    extra = 6
-                try:
-                    if txt and (txt[0:2] in ('📄 ', '⚛️ ', '🖼️ ', '📁 ', 'ℹ️ ')):
-                        extra += 6
-                except Exception:
-                    pass
-                width_needed += extra
                 # Ограничиваем максимальную ширину для широких текстов
+                max_w = 0
                 if vp_w:
                     if col == 3:
                         # «Действие или заголовок»: не шире 50% видимой области, но не меньше 380
                         max_w = max(380, int(vp_w * 0.5))
-                        if width_needed > max_w:
-                            width_needed = max_w
                     elif col == 5:
                         # «Источник»: не шире 35% видимой области
-                        max_w2 = max(240, int(vp_w * 0.35))
-                        if width_needed > max_w2:
-                            width_needed = max_w2
+                        max_w = max(240, int(vp_w * 0.35))
                 cur = tree.columnWidth(col)
+                if max_w and cur >= max_w:
+                    continue  # столбец уже на пределе — мерить нечего
+                width_needed = 0
+                for row in rows:
+                    txt = row.text(col) or ''
+                    # Заведомо короткий текст не расширит столбец — без замеров шрифта
+                    if max_cw and len(txt) * max_cw + padding + 12 <= cur:
+                        continue
+                    # Учитываем метрику текста и особенности эмодзи/иконок
+                    try:
+                        w1 = fm.horizontalAdvance(txt)
+                    except Exception:
+                        w1 = 0
+                    try:
+                        w2 = fm.boundingRect(txt).width()
+                    except Exception:
+                        w2 = 0
+                    # Небольшой запас на внутренние отступы и возможные отличия метрик эмодзи
+                    extra = 5
+                    if col == 3:
+                        extra = 6
+                    if txt.startswith(_TITLE_EMOJI_PREFIXES + ('ℹ️ ',)):
+                        extra += 6
+                    width_needed = max(width_needed, max(w1, w2) + padding + extra)
+                if max_w and width_needed > max_w:
+                    width_needed = max_w
                 if width_needed > cur:
                     tree.setColumnWidth(col, width_needed)
             except Exception:
@@ -2343,33 +2684,53 @@ def create_tree_log_wrap(parent_widget, tree_widget: QTreeWidget, with_header: b
 
 
 # ====== TSV HELPERS ======
-def tsv_preview_from_path(path: str) -> tuple[list[str], list[str], int]:
-    """Читает TSV-файл и формирует данные для предпросмотра.
+# Предел строк, которые показываются в предпросмотре больших TSV
+TSV_PREVIEW_MAX_ROWS = 5000
 
-    Возвращает кортеж (left, right, count), где:
-    - left: список заголовков (первая колонка, без BOM)
-    - right: список склеенных хвостов (остальные колонки соединены через «\t»)
-    - count: количество валидных строк
-    """
-    try:
-        with open(path, newline='', encoding='utf-8-sig') as f:
-            rows = list(csv.reader(f, delimiter='\t'))
-    except Exception as e:
-        raise e
 
+def _tsv_file_key(path: str) -> tuple[str, float, int]:
+    """Ключ кэша по файлу: изменение mtime или размера сбрасывает кэш."""
+    st = os.stat(path)
+    return os.path.abspath(path), st.st_mtime, st.st_size
+
+
+def _read_tsv_preview(abs_path: str, max_rows: int | None) -> tuple[tuple[str, ...], tuple[str, ...], int]:
     left: list[str] = []
     right: list[str] = []
     count = 0
-    for r in rows:
-        if not r:
-            continue
-        title = (r[0] or '').lstrip('\ufeff')
-        tail = '\t'.join((c or '') for c in r[1:])
-        left.append(title)
-        right.append(tail)
-        count += 1
+    with open(abs_path, newline='', encoding='utf-8-sig') as f:
+        for r in csv.reader(f, delimiter='\t'):
+            if not r:
+                continue
+            count += 1
+            if max_rows is not None and count > max_rows:
+                continue
+            left.append((r[0] or '').lstrip('\ufeff'))
+            right.append('\t'.join((c or '') for c in r[1:]))
+    return tuple(left), tuple(right), count
+
+
+@functools.lru_cache(maxsize=4)
+def _read_tsv_preview_cached(abs_path: str, _mtime: float, _size: int, max_rows: int):
+    return _read_tsv_preview(abs_path, max_rows)
+
+
+def tsv_preview_from_path(path: str, max_rows: int | None = None) -> tuple[tuple[str, ...], tuple[str, ...], int]:
+    """Читает TSV-файл и формирует данные для предпросмотра.
 
-    return left, right, count
+    Возвращает кортеж (left, right, count), где:
+    - left: заголовки (первая колонка, без BOM)
+    - right: склеенные хвосты (остальные колонки соединены через «\t»)
+    - count: количество валидных строк
+
+    Файл читается потоково; при ``max_rows`` в кортежи попадают только первые
+    строки, а count по-прежнему считается по всему файлу. Кэшируется только
+    ограниченный предпросмотр (повторный показ неизменённого файла): полные
+    выборки без ``max_rows`` в памяти не задерживаются.
+    """
+    if max_rows is None:
+        return _read_tsv_preview(os.path.abspath(path), None)
+    return _read_tsv_preview_cached(*_tsv_file_key(path), max_rows)
 
 
 # ====== TSV VALIDATION & COUNT HELPERS ======
@@ -2438,11 +2799,15 @@ def check_tsv_format(file_path: str, allow_single_column: bool = False, widget=N
         return False, _fmt(widget, 'ui.tsv.read_error', 'File read error: {error}', error=e)
 
 
+@functools.lru_cache(maxsize=4)
+def _count_non_empty_titles(abs_path: str, _mtime: float, _size: int) -> int:
+    with open(abs_path, newline='', encoding='utf-8-sig') as f:
+        return sum(1 for r in csv.reader(f, delimiter='\t') if r and (r[0] or '').strip())
+
+
 def count_non_empty_titles(file_path: str) -> int:
-    """Считает количество строк, где первый столбец непустой."""
-    with open(file_path, newline='', encoding='utf-8-sig') as f:
-        rows = list(csv.reader(f, delimiter='\t'))
-    return sum(1 for r in rows if r and (r[0] or '').strip())
+    """Считает количество строк, где первый столбец непустой (с кэшем по mtime/размеру)."""
+    return _count_non_empty_titles(*_tsv_file_key(file_path))
 
 
 # ====== SUMMARY HELPERS ======
@@ -2466,6 +2831,52 @@ def _localized_progress_label(widget, fallback: str = 'Processed') -> str:
         return fallback
 
 
+class ProgressCoalescer:
+    """Сводит частые инкременты прогресс-бара к перерисовке не чаще раза в interval_ms.
+
+    render(value, maximum) вызывается после setValue для обновления текста.
+    Хвост серии догоняется одиночным таймером, последний шаг рисуется сразу.
+    """
+
+    def __init__(self, bar, render, interval_ms: int = 100):
+        self._bar = bar
+        self._render = render
+        self._interval = interval_ms / 1000.0
+        self._pending = 0
+        self._last_ts = 0.0
+        self._timer = QTimer(bar)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+
+    def inc(self, n: int = 1) -> None:
+        self._pending += n
+        bar = self._bar
+        if (time.monotonic() - self._last_ts >= self._interval
+                or bar.value() + self._pending >= bar.maximum()):
+            self.flush()
+        elif not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self) -> None:
+        self._timer.stop()
+        if not self._pending:
+            return
+        bar = self._bar
+        maximum = bar.maximum()
+        val = min(maximum, bar.value() + self._pending)
+        self._pending = 0
+        self._last_ts = time.monotonic()
+        bar.setValue(val)
+        self._render(val, maximum)
+
+    def reset(self) -> None:
+        """Сбросить накопленное (при новой инициализации бара)."""
+        self._timer.stop()
+        self._pending = 0
+        self._last_ts = 0.0
+
+
 def init_progress(label_widget, bar_widget, total: int, processed_label: str | None = None) -> None:
     try:
         if processed_label is None:
@@ -2473,8 +2884,13 @@ def init_progress(label_widget, bar_widget, total: int, processed_label: str | N
         total_val = int(total or 0)
         try:
             bar_widget.setProperty('progress_total', total_val)
+            bar_widget.setProperty('progress_label', processed_label)
+            bar_widget.setProperty('progress_format', f'{processed_label} {{}}/{total_val}')
         except Exception:
             pass
+        coalescer = getattr(bar_widget, '_wct_progress', None)
+        if coalescer is not None:
+            coalescer.reset()
         if total_val > 0:
             bar_widget.setMaximum(total_val)
         else:
@@ -2497,27 +2913,34 @@ def init_progress(label_widget, bar_widget, total: int, processed_label: str | N
 def inc_progress(label_widget, bar_widget, processed_label: str | None = None) -> None:
     try:
         if processed_label is None:
-            processed_label = _localized_progress_label(label_widget or bar_widget)
+            # Подпись переведена в init_progress; не переводим её на каждом шаге
+            processed_label = bar_widget.property('progress_label') or _localized_progress_label(label_widget or bar_widget)
         try:
             total_val = int(bar_widget.property('progress_total') or 0)
         except Exception:
             total_val = 0
         if total_val <= 0:
-            val = 0
-            display_total = 0
-        else:
-            display_total = total_val
-            val = min(int(bar_widget.maximum() or 0), bar_widget.value() + 1)
-        bar_widget.setValue(val)
-        try:
+            bar_widget.setValue(0)
             bar_widget.setTextVisible(True)
-            bar_widget.setFormat(f'{processed_label} {val}/{display_total}')
-        except Exception:
-            pass
-        if label_widget is not None:
-            try:
-                label_widget.setText(f'{processed_label} {val}/{display_total}')
-            except Exception:
-                pass
+            bar_widget.setFormat(f'{processed_label} 0/0')
+            if label_widget is not None:
+                label_widget.setText(f'{processed_label} 0/0')
+            return
+        # Частые инкременты сводятся к одной перерисовке раз в ~100 мс
+        coalescer = getattr(bar_widget, '_wct_progress', None)
+        if coalescer is None:
+            def _render(val, _maximum):
+                fmt = bar_widget.property('progress_format') or '{}'
+                text = fmt.format(val)
+                bar_widget.setTextVisible(True)
+                bar_widget.setFormat(text)
+                if label_widget is not None:
+                    label_widget.setText(text)
+            coalescer = ProgressCoalescer(bar_widget, _render)
+            bar_widget._wct_progress = coalescer
+        if processed_label != bar_widget.property('progress_label'):
+            bar_widget.setProperty('progress_label', processed_label)
+            bar_widget.setProperty('progress_format', f'{processed_label} {{}}/{total_val}')
+        coalescer.inc()
     except Exception:
         pass
@@ -19,7 +19,12 @@ from wiki_cat_tool.core.api_client import APIRequestError, WikimediaAPIClient
 from wiki_cat_tool.core.namespace_manager import NamespaceManager
 import wiki_cat_tool.core.redundant_category_logic as redundant_logic
 from wiki_cat_tool.core.template_manager import TemplateManager
+from wiki_cat_tool.gui.tabs.replace_tab import ReplaceTab
+import wiki_cat_tool.gui.tabs.replace_tab as replace_tab_module
+from wiki_cat_tool.gui.widgets.shared_panels import CategorySourcePanel, _parse_titles
+import wiki_cat_tool.gui.widgets.ui_helpers as ui_helpers_module
 from wiki_cat_tool.workers.base_worker import BaseWorker
+from wiki_cat_tool.workers.category_fetch_worker import CategoryFetchWorker
 from wiki_cat_tool.workers.category_content_sync_worker import (
     CategoryContentSyncWorker,
 )
@@ -27,6 +32,7 @@ import wiki_cat_tool.workers.create_worker as create_worker_module
 from wiki_cat_tool.workers.create_worker import _format_summary as format_create_summary
 from wiki_cat_tool.workers.parse_worker import ParseWorker
 import wiki_cat_tool.workers.rename_worker as rename_worker_module
+from wiki_cat_tool.workers.replace_worker import ReplaceWorker
 from wiki_cat_tool.workers.replace_worker import _format_summary as format_replace_summary
 
 
@@ -172,6 +178,65 @@ class RegressionTests(unittest.TestCase):
             )
         )
 
+    def test_multiple_root_categories_are_fetched_and_merged(self):
+        worker = CategoryFetchWorker(
+            category="Category:A | Category:B|Category:A",
+            lang="en",
+            family="wikipedia",
+            depth=0,
+            mode="both",
+        )
+        self.assertEqual(["Category:A", "Category:B"], worker.categories)
+        per_root = {
+            "Category:A": (["Category:Sub"], ["Page b", "Page a"]),
+            "Category:B": (["Category:Sub", "Category:Other"], ["Page a"]),
+        }
+        worker._fetch_split_titles_for_mode = Mock(
+            side_effect=lambda *, category, **_kwargs: per_root[category]
+        )
+        results = []
+        worker.result_ready.connect(lambda titles, stats: results.append((titles, stats)))
+
+        worker.run()
+
+        self.assertEqual(2, worker._fetch_split_titles_for_mode.call_count)
+        self.assertEqual(
+            [
+                (
+                    ["Category:Other", "Category:Sub", "Page a", "Page b"],
+                    {"categories": 2, "non_categories": 2},
+                )
+            ],
+            results,
+        )
+
+    def test_failed_root_category_keeps_other_roots(self):
+        worker = CategoryFetchWorker(
+            category="Category:A|Category:Missing",
+            lang="en",
+            family="wikipedia",
+            depth=0,
+            mode="both",
+        )
+
+        def fetch(*, category, **_kwargs):
+            if category == "Category:Missing":
+                raise RuntimeError("boom")
+            return ([], ["Page a"])
+
+        worker._fetch_split_titles_for_mode = Mock(side_effect=fetch)
+        results, failures, messages = [], [], []
+        worker.result_ready.connect(lambda titles, stats: results.append(titles))
+        worker.failed.connect(failures.append)
+        worker.progress.connect(messages.append)
+
+        worker.run()
+
+        self.assertEqual([["Page a"]], results)
+        self.assertEqual([], failures)
+        self.assertTrue(any("Category:Missing" in m and "boom" in m for m in messages))
+        self.assertTrue(any("Category:A" in m and "/2)" in m for m in messages))
+
     def test_stop_request_prevents_next_save(self):
         worker = BaseWorker("", "", "en", "wikipedia")
         page = Mock()
@@ -218,6 +283,29 @@ class RegressionTests(unittest.TestCase):
             self.assertEqual("", worker._move_page.call_args.args[3])
             worker._move_category_members.assert_not_called()
 
+    def test_rename_worker_sends_log_in_ordered_batches(self):
+        with patch.object(
+            rename_worker_module, "TemplateManager", return_value=Mock()
+        ):
+            worker = rename_worker_module.RenameWorker(
+                "unused.tsv", "", "", "en", "wikipedia", 14,
+                True, True, True, False, True,
+            )
+        batches = []
+        worker.logs_batch.connect(batches.append)
+
+        for i in range(rename_worker_module.LOG_BATCH_SIZE + 3):
+            worker._queue_log("progress", f"line {i}")
+        worker._queue_log("event", {"type": "destination_exists"})
+        worker._flush_logs()
+
+        self.assertEqual(
+            [rename_worker_module.LOG_BATCH_SIZE, 4], [len(b) for b in batches]
+        )
+        flat = [entry for batch in batches for entry in batch]
+        self.assertEqual(("progress", "line 0"), flat[0])
+        self.assertEqual(("event", {"type": "destination_exists"}), flat[-1])
+
     def test_empty_existing_page_is_written_to_tsv(self):
         worker = ParseWorker(["Empty"], "unused.tsv", "auto", "en", "wikipedia")
         worker.writer = Mock()
@@ -242,6 +330,97 @@ class RegressionTests(unittest.TestCase):
         self.assertEqual("site unavailable", worker.failure_message)
         self.assertEqual(1, worker.stats["failed"])
 
+    def test_manual_titles_split_on_rich_text_line_separators(self):
+        # QTextDocument.toRawText(): U+2029 between blocks, U+2028 for <br>/Shift+Enter
+        self.assertEqual(
+            ["A", "B", "C", "D"], _parse_titles("A\u2028B\u2028 C \u2029\u2029D")
+        )
+
+    def test_empty_tsv_replace_does_not_log_finished_run(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "empty.tsv"
+            path.write_text("\t\n\n", encoding="utf-8")
+            worker = ReplaceWorker(
+                str(path), "", "", "en", "wikipedia", "auto", "", False
+            )
+            counted = []
+            worker.pages_counted.connect(counted.append)
+            worker.run()
+
+        self.assertEqual([0], counted)
+        self.assertEqual(0, worker.page_count)
+
+        tab = Mock(rworker=worker)
+        with patch.object(replace_tab_module, "log_message") as log_message, patch.object(
+            replace_tab_module, "QMessageBox"
+        ) as message_box:
+            ReplaceTab._on_replace_finished(tab)
+
+        log_message.assert_not_called()
+        message_box.warning.assert_called_once()
+        tab._restore_replace_controls.assert_called_once_with()
+        tab.parent_window.record_operation.assert_not_called()
+
+    def test_unreadable_tsv_replace_shows_read_error_dialog(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "broken.tsv"
+            path.write_bytes(b"Title\t\xff\xfe\n")
+            worker = ReplaceWorker(
+                str(path), "", "", "en", "wikipedia", "auto", "", False
+            )
+            counted = []
+            worker.pages_counted.connect(counted.append)
+            worker.run()
+
+        self.assertEqual([], counted)
+        self.assertIsNone(worker.page_count)
+        self.assertTrue(worker.failed)
+
+        tab = Mock(rworker=worker)
+        tab._fmt.side_effect = lambda _key, **kwargs: kwargs["error"]
+        with patch.object(replace_tab_module, "log_message") as log_message, patch.object(
+            replace_tab_module, "QMessageBox"
+        ) as message_box:
+            ReplaceTab._on_replace_finished(tab)
+
+        log_message.assert_not_called()
+        message_box.critical.assert_called_once()
+        self.assertIn("decode", message_box.critical.call_args.args[2])
+        tab._restore_replace_controls.assert_called_once_with()
+
+    def test_petscan_url_unions_multiple_root_categories(self):
+        with patch(
+            "wiki_cat_tool.core.namespace_manager.strip_ns_prefix",
+            side_effect=lambda _f, _l, title, _ns: title.split(":", 1)[-1],
+        ):
+            single = CategorySourcePanel._build_petscan_url(
+                None, "wikipedia", "en", "Category:A"
+            )
+            multi = CategorySourcePanel._build_petscan_url(
+                None, "wikipedia", "en", "Category:A | B", depth=2
+            )
+
+        self.assertIn("combination=subset&", single)
+        self.assertIn("categories=A&", single)
+        self.assertIn("combination=union&", multi)
+        self.assertIn("categories=A%0AB&", multi)
+        self.assertTrue(multi.endswith("&depth=2"))
+
+    def test_tsv_preview_caches_only_capped_reads_as_tuples(self):
+        cached = ui_helpers_module._read_tsv_preview_cached
+        cached.cache_clear()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "pages.tsv"
+            path.write_text("A\tx\nB\ty\tz\nC\n", encoding="utf-8")
+
+            full = ui_helpers_module.tsv_preview_from_path(str(path))
+            self.assertEqual(0, cached.cache_info().currsize)
+            capped = ui_helpers_module.tsv_preview_from_path(str(path), 2)
+
+        self.assertEqual((("A", "B", "C"), ("x", "y\tz", ""), 3), full)
+        self.assertEqual((("A", "B"), ("x", "y\tz"), 3), capped)
+        self.assertEqual(1, cached.cache_info().currsize)
+
 
 if __name__ == "__main__":
     unittest.main()
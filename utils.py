@@ -99,6 +99,26 @@ def resolve_project_language(parent_window=None, fallback: str = 'ru') -> str:
     return value or 'ru'
 
 
+def resolve_project_family(parent_window=None, fallback: str = 'wikipedia') -> str:
+    """Вернуть семейство выбранного wiki-проекта (см. resolve_project_language)."""
+    try:
+        value = str(getattr(parent_window, 'current_family', '') or '').strip()
+        if value:
+            return value
+    except Exception:
+        pass
+    try:
+        auth_tab = getattr(parent_window, 'auth_tab', None)
+        family_combo = getattr(auth_tab, 'family_combo', None)
+        if family_combo is not None:
+            value = str(family_combo.currentText() or '').strip()
+            if value:
+                return value
+    except Exception:
+        pass
+    return fallback or 'wikipedia'
+
+
 def _plural_variant(n: int, lang: str) -> str:
     try:
         value = abs(int(n))
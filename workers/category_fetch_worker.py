@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import time
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from PySide6.QtCore import QThread, Signal
 
@@ -27,10 +28,19 @@ class CategoryFetchWorker(QThread):
     PARTIAL_SNAPSHOT_LIMIT = 50000
     MEMBER_PROGRESS_BATCH_INTERVAL = 10
     MEMBER_PROGRESS_SECONDS_INTERVAL = 5.0
+    ROOT_FETCH_MAX_WORKERS = 4
 
     def __init__(self, *, category: str, lang: str, family: str, depth: int, mode: str):
         super().__init__()
         self.category = str(category or "").strip()
+        # Несколько корневых категорий перечисляются через «|» (символ
+        # недопустим в названиях страниц MediaWiki).
+        self.categories = list(
+            dict.fromkeys(
+                part.strip() for part in self.category.split("|") if part.strip()
+            )
+        ) or [self.category]
+        self._multi_root = len(self.categories) > 1
         self.lang = str(lang or "ru").strip() or "ru"
         self.family = str(family or "wikipedia").strip() or "wikipedia"
         self.depth = max(0, int(depth or 0))
@@ -54,7 +64,7 @@ class CategoryFetchWorker(QThread):
         self._stop = True
 
     def _emit_partial_snapshot(self, *, categories: list[str], pages: list[str]) -> None:
-        if self._stop:
+        if self._stop or self._multi_root:
             return
         categories_count = len(categories or [])
         pages_count = len(pages or [])
@@ -245,13 +255,22 @@ class CategoryFetchWorker(QThread):
 
     def run(self) -> None:
         try:
-            titles, stats = self._fetch_titles_for_mode(
-                category=self.category,
-                lang=self.lang,
-                fam=self.family,
-                depth=self.depth,
-                mode=self.mode,
-            )
+            if self._multi_root:
+                titles, stats = self._fetch_titles_for_roots(
+                    categories=self.categories,
+                    lang=self.lang,
+                    fam=self.family,
+                    depth=self.depth,
+                    mode=self.mode,
+                )
+            else:
+                titles, stats = self._fetch_titles_for_mode(
+                    category=self.categories[0],
+                    lang=self.lang,
+                    fam=self.family,
+                    depth=self.depth,
+                    mode=self.mode,
+                )
             if self._stop:
                 return
             self.result_ready.emit(titles, stats)
@@ -260,6 +279,84 @@ class CategoryFetchWorker(QThread):
                 self._fmt("ui.source.api_error", "API error: {error}", error=exc)
             )
 
+    def _fetch_titles_for_roots(
+        self,
+        *,
+        categories: list[str],
+        lang: str,
+        fam: str,
+        depth: int,
+        mode: str,
+    ) -> tuple[list[str], dict[str, int]]:
+        """Обходит независимые корневые категории параллельно и объединяет результат.
+
+        Ошибка одного корня не отменяет остальные: она пишется в лог, а если не
+        удалось считать ни одного корня — пробрасывается первая ошибка.
+        """
+
+        def fetch_one(root: str) -> tuple[list[str], list[str]]:
+            return self._fetch_split_titles_for_mode(
+                category=root,
+                lang=lang,
+                fam=fam,
+                depth=depth,
+                mode=mode,
+            )
+
+        workers = max(1, min(self.ROOT_FETCH_MAX_WORKERS, len(categories)))
+        by_root: dict[str, tuple[list[str], list[str]]] = {}
+        first_error: Exception | None = None
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(fetch_one, root): root for root in categories}
+            for done, future in enumerate(as_completed(futures), 1):
+                root = futures[future]
+                try:
+                    root_categories, root_pages = future.result()
+                except Exception as exc:
+                    first_error = first_error or exc
+                    self.progress.emit(
+                        self._fmt(
+                            "ui.source.fetch_root_error",
+                            "Failed to read root category {category}: {error}",
+                            category=root,
+                            error=exc,
+                        )
+                    )
+                    continue
+                by_root[root] = (root_categories, root_pages)
+                if not self._stop:
+                    self.progress.emit(
+                        self._fmt(
+                            "ui.source.fetch_root_done",
+                            "Root category {category} read ({done}/{total}): pages {pages}, subcategories {subcategories}.",
+                            category=root,
+                            done=done,
+                            total=len(categories),
+                            pages=len(root_pages),
+                            subcategories=len(root_categories),
+                        )
+                    )
+        if self._stop:
+            return [], {}
+        if not by_root and first_error is not None:
+            raise first_error
+        # Порядок корней — как во вводе, независимо от порядка завершения потоков
+        results = [by_root[root] for root in categories if root in by_root]
+
+        categories_only = sorted(
+            dict.fromkeys(
+                title for root_categories, _pages in results for title in root_categories
+            ),
+            key=str.casefold,
+        )
+        non_categories_only = sorted(
+            dict.fromkeys(
+                title for _categories, root_pages in results for title in root_pages
+            ),
+            key=str.casefold,
+        )
+        return self._combine_titles(categories_only, non_categories_only)
+
     def _fetch_titles_for_mode(
         self,
         *,
@@ -269,11 +366,47 @@ class CategoryFetchWorker(QThread):
         depth: int,
         mode: str,
     ) -> tuple[list[str], dict[str, int]]:
-        self._expected_read_total = None
+        categories_only, non_categories_only = self._fetch_split_titles_for_mode(
+            category=category,
+            lang=lang,
+            fam=fam,
+            depth=depth,
+            mode=mode,
+        )
+        return self._combine_titles(categories_only, non_categories_only)
+
+    @staticmethod
+    def _combine_titles(
+        categories_only: list[str], non_categories_only: list[str]
+    ) -> tuple[list[str], dict[str, int]]:
+        combined_titles = list(categories_only)
+        existing_keys = {value.casefold() for value in combined_titles}
+        for title in non_categories_only:
+            title_key = title.casefold()
+            if title_key in existing_keys:
+                continue
+            combined_titles.append(title)
+            existing_keys.add(title_key)
+
+        return combined_titles, {
+            "categories": len(categories_only),
+            "non_categories": len(non_categories_only),
+        }
+
+    def _fetch_split_titles_for_mode(
+        self,
+        *,
+        category: str,
+        lang: str,
+        fam: str,
+        depth: int,
+        mode: str,
+    ) -> tuple[list[str], list[str]]:
         categories_only: list[str] = []
         non_categories_only: list[str] = []
 
-        if depth == 0:
+        if depth == 0 and not self._multi_root:
+            self._expected_read_total = None
             self._announce_expected_read_total(
                 category=category,
                 lang=lang,
@@ -290,8 +423,8 @@ class CategoryFetchWorker(QThread):
                 max_depth=depth,
             )
             categories_only = sorted(
-                set(subcat_titles),
-                key=lambda value: value.casefold(),
+                dict.fromkeys(subcat_titles),
+                key=str.casefold,
             )
         else:
             page_depth = depth if mode in {"non_categories_only", "both"} else -1
@@ -307,28 +440,16 @@ class CategoryFetchWorker(QThread):
 
             if mode == "both":
                 categories_only = sorted(
-                    set(subcat_titles),
-                    key=lambda value: value.casefold(),
+                    dict.fromkeys(subcat_titles),
+                    key=str.casefold,
                 )
             if mode in {"non_categories_only", "both"}:
                 non_categories_only = sorted(
-                    set(page_titles),
-                    key=lambda value: value.casefold(),
+                    dict.fromkeys(page_titles),
+                    key=str.casefold,
                 )
 
-        combined_titles = list(categories_only)
-        existing_keys = {value.casefold() for value in combined_titles}
-        for title in non_categories_only:
-            title_key = title.casefold()
-            if title_key in existing_keys:
-                continue
-            combined_titles.append(title)
-            existing_keys.add(title_key)
-
-        return combined_titles, {
-            "categories": len(categories_only),
-            "non_categories": len(non_categories_only),
-        }
+        return categories_only, non_categories_only
 
     def _walk_category_tree_combined(
         self,
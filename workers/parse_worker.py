@@ -3,10 +3,12 @@ Parse worker for reading pages from Wikimedia projects.
 """
 
 import csv
+import gzip
 from PySide6.QtCore import Signal
 
 from .base_worker import BaseWorker
 from ..core.api_client import APIRequestError, WikimediaAPIClient
+from ..core.namespace_manager import resolve_ns_selection
 
 
 class ParseWorker(BaseWorker):
@@ -19,7 +21,7 @@ class ParseWorker(BaseWorker):
 
     item_processed = Signal()
     
-    def __init__(self, titles, out_path, ns_sel, lang, family):
+    def __init__(self, titles, out_path, ns_sel, lang, family, compress=None):
         """
         Инициализация ParseWorker.
         
@@ -29,12 +31,17 @@ class ParseWorker(BaseWorker):
             ns_sel: Выбор пространства имен ('auto' или ID)
             lang: Код языка
             family: Семейство проекта
+            compress: Писать TSV через gzip (по умолчанию — по расширению .gz)
         """
         # ParseWorker не требует авторизации, поэтому передаем пустые значения
         super().__init__('', '', lang, family)
         self.titles = titles
         self.out_path = out_path
         self.ns_sel = ns_sel
+        self._ns_id = resolve_ns_selection(ns_sel)
+        if compress is None:
+            compress = str(out_path or '').lower().endswith('.gz')
+        self.compress = bool(compress)
         self.api_client = WikimediaAPIClient()
         self.output_file = None
         self.writer = None
@@ -46,7 +53,12 @@ class ParseWorker(BaseWorker):
         """Основной метод выполнения чтения страниц."""
         # Открываем файл для живой записи результатов
         try:
-            self.output_file = open(self.out_path, 'w', newline='', encoding='utf-8-sig')
+            if self.compress:
+                # Низкий уровень сжатия: выигрыш в объёме записи при минимальной нагрузке на CPU
+                self.output_file = gzip.open(
+                    self.out_path, 'wt', compresslevel=1, newline='', encoding='utf-8-sig')
+            else:
+                self.output_file = open(self.out_path, 'w', newline='', encoding='utf-8-sig')
             self.writer = csv.writer(self.output_file, delimiter='\t')
         except Exception as e:
             self.failed = True
@@ -58,7 +70,8 @@ class ParseWorker(BaseWorker):
 
         # Батчим запросы по 50 заголовков (ограничение MediaWiki API)
         batch_size = 50
-        titles = list(self.titles)
+        # Список из вкладки передаётся по ссылке, без повторного копирования
+        titles = self.titles if isinstance(self.titles, list) else list(self.titles)
         i = 0
         while i < len(titles) and not self._stop and not self.failed:
             batch = titles[i:i + batch_size]
@@ -108,8 +121,7 @@ class ParseWorker(BaseWorker):
                 if lines is None:
                     try:
                         # Проверяем, что NS не 'auto'
-                        is_auto = isinstance(self.ns_sel, str) and self.ns_sel.strip().lower() == 'auto'
-                        if not is_auto:
+                        if self._ns_id is not None:
                             from ..core.namespace_manager import normalize_title_by_selection
                             norm = normalize_title_by_selection(original, self.family, self.lang, self.ns_sel)
                             if norm in title_to_lines:
@@ -170,7 +182,9 @@ class ParseWorker(BaseWorker):
             # Empty pages are valid data too; preserve them as ``Title<TAB>``.
             row = [title, *lines] if lines else [title, '']
             self.writer.writerow(row)
-            self.output_file.flush()  # Принудительная запись на диск
+            if not self.compress:
+                # Для gzip построчный flush ломает сжатие; поток закрывается в run()
+                self.output_file.flush()  # Принудительная запись на диск
             return True
         except Exception as e:
             self.failed = True
@@ -2,15 +2,18 @@
 Rename worker for renaming pages and moving category members in Wikimedia projects.
 """
 
-import csv
 import html
+import re
+import threading
 from threading import Event
 from PySide6.QtCore import Signal
 import pywikibot
 
 from .base_worker import BaseWorker
-from ..core.namespace_manager import normalize_title_by_selection, title_has_ns_prefix, _ensure_title_with_ns
-
+from ..core.namespace_manager import (
+    normalize_title_by_selection, title_has_ns_prefix, _ensure_title_with_ns, resolve_ns_selection,
+)
+from ..core.pywikibot_config import apply_pwb_config
 from ..core.template_manager import TemplateManager
 from ..core.localization import translate_runtime
 from ..constants import DEFAULT_EN_NS
@@ -49,6 +52,22 @@ _CYR_OY = _chars(1086, 1081)
 _CYR_AYA = _chars(1072, 1103)
 _CYR_VOWELS = _chars(1072, 1077, 1105, 1080, 1086, 1091, 1099, 1101, 1102, 1103) + 'AEIOUY' + _chars(1040, 1054, 1069, 1048, 1059, 1067, 1045, 1025, 1070, 1071)
 _CYR_WORD_PATTERN = '[' + _chars(1072) + '-' + _chars(1103) + _chars(1105) + _chars(1040) + '-' + _chars(1071) + _chars(1025) + 'a-zA-Z\\-]+'
+# Фрагменты {{...}} для поиска изменённых шаблонов; компилируется один раз
+_TEMPLATE_CHUNK_RE = re.compile(r'\{\{([^{}]+?)\}\}', re.DOTALL)
+
+def _normalize_tsv_row(row: list[str]) -> tuple[str, str, str] | None:
+    """Очищенные (старое, новое, комментарий) строки TSV или None, если колонок меньше двух."""
+    if len(row) < 2:
+        return None
+    old = (row[0] or '').strip().lstrip('\ufeff')
+    new = (row[1] or '').strip().lstrip('\ufeff')
+    reason = (row[2] or '').strip().lstrip('\ufeff') if len(row) >= 3 else ''
+    return old, new, reason
+
+
+# Записи лога уходят в UI пачками: по размеру или по таймеру фонового сброса
+LOG_BATCH_SIZE = 64
+LOG_BATCH_INTERVAL = 0.05
 
 
 class RenameWorker(BaseWorker):
@@ -64,8 +83,9 @@ class RenameWorker(BaseWorker):
     
     template_review_request = Signal(object)
     review_response = Signal(object)
-    # Структурированные события для UI
-    log_event = Signal(object)
+    # Пачка записей лога (и структурированных событий для UI): список пар
+    # ('progress', str) | ('event', dict) в порядке появления
+    logs_batch = Signal(list)
     # Прогресс по TSV: инициализация общего количества и инкремент по строкам
     tsv_progress_init = Signal(int)
     tsv_progress_inc = Signal()
@@ -77,7 +97,7 @@ class RenameWorker(BaseWorker):
     def __init__(self, tsv_path, username, password, lang, family, ns_selection: str | int, 
                  leave_cat_redirect: bool, leave_other_redirect: bool, move_members: bool, 
                  find_in_templates: bool, phase1_enabled: bool, move_category: bool = True,
-                 override_comment: str = '', title_regex: str = '', use_locatives: bool = False):
+                 override_comment: str = '', title_regex: str | re.Pattern = '', use_locatives: bool = False):
         """
         Инициализация RenameWorker.
         
@@ -94,10 +114,13 @@ class RenameWorker(BaseWorker):
             find_in_templates: Искать в шаблонах
             phase1_enabled: Включить фазу 1 (прямые ссылки)
             move_category: Переименовывать саму категорию
+            title_regex: Фильтр заголовков — строка или уже скомпилированный re.Pattern
         """
         super().__init__(username, password, lang, family)
         self.tsv_path = tsv_path
         self.ns_sel = ns_selection
+        # Выбор NS разбирается один раз: None — «Авто», иначе ID пространства имён
+        self._ns_id = resolve_ns_selection(ns_selection)
         self.leave_cat_redirect = leave_cat_redirect
         self.leave_other_redirect = leave_other_redirect
         self.move_members = move_members
@@ -105,12 +128,16 @@ class RenameWorker(BaseWorker):
         self.find_in_templates = find_in_templates
         self.phase1_enabled = phase1_enabled
         # Фильтр заголовков (регулярное выражение Python)
-        self.title_regex = (title_regex or '').strip()
-        try:
-            import re as _re
-            self._title_regex_compiled = _re.compile(self.title_regex) if self.title_regex else None
-        except Exception:
-            self._title_regex_compiled = None
+        if isinstance(title_regex, re.Pattern):
+            # Вкладка передаёт уже проверенный скомпилированный шаблон
+            self.title_regex = title_regex.pattern
+            self._title_regex_compiled = title_regex
+        else:
+            self.title_regex = (title_regex or '').strip()
+            try:
+                self._title_regex_compiled = re.compile(self.title_regex) if self.title_regex else None
+            except Exception:
+                self._title_regex_compiled = None
         
         # Пользовательский комментарий, который переопределяет комментарий из TSV
         self.override_comment = (override_comment or '').strip()
@@ -123,6 +150,10 @@ class RenameWorker(BaseWorker):
         # Включение эвристики локативов
         self.use_locatives = bool(use_locatives)
         
+        # Буфер записей лога, отправляется в UI пачками (см. _flush_logs)
+        self._log_buf: list[tuple[str, object]] = []
+        self._log_lock = threading.Lock()
+        
         # Dialog communication
         self._prompt_events: dict[int, Event] = {}
         self._prompt_results: dict[int, str] = {}
@@ -153,7 +184,7 @@ class RenameWorker(BaseWorker):
             return text
 
     def _emitf(self, key: str, default: str = '', **kwargs) -> None:
-        self.progress.emit(self._tf(key, default, **kwargs))
+        self._queue_log('progress', self._tf(key, default, **kwargs))
 
     def _debugf(self, key: str, default: str = '', **kwargs) -> None:
         debug(self._tf(key, default, **kwargs))
@@ -243,14 +274,8 @@ class RenameWorker(BaseWorker):
         названия шаблонов, нормализуя их к локальному префиксу пространства 10.
         """
         try:
-            import re as _re
-        except Exception:
-            _re = None
-        if not _re:
-            return []
-        try:
-            before_chunks = set(_re.findall(r'\{\{([^{}]+?)\}\}', before_text or '', _re.DOTALL))
-            after_chunks = set(_re.findall(r'\{\{([^{}]+?)\}\}', after_text or '', _re.DOTALL))
+            before_chunks = set(_TEMPLATE_CHUNK_RE.findall(before_text or ''))
+            after_chunks = set(_TEMPLATE_CHUNK_RE.findall(after_text or ''))
             changed = [c for c in after_chunks if c not in before_chunks]
         except Exception:
             changed = []
@@ -312,11 +337,56 @@ class RenameWorker(BaseWorker):
         except Exception as e:
             self._debugf('log.rename_worker.dialog.response_error', 'Error in _on_review_response: {error}', error=e)
 
+    def _queue_log(self, kind: str, payload) -> None:
+        """Поставить запись лога в буфер; при переполнении — отправить сразу."""
+        with self._log_lock:
+            self._log_buf.append((kind, payload))
+            if len(self._log_buf) >= LOG_BATCH_SIZE:
+                self._flush_logs_locked()
+
+    def _flush_logs(self) -> None:
+        """Отправить накопленные записи лога одним сигналом."""
+        with self._log_lock:
+            self._flush_logs_locked()
+
+    def _flush_logs_locked(self) -> None:
+        if not self._log_buf:
+            return
+        batch = self._log_buf
+        self._log_buf = []
+        # Эмит под блокировкой сохраняет порядок пачек между потоками
+        self.logs_batch.emit(batch)
+
+    def _log_flush_loop(self, stop: Event) -> None:
+        """Фоновый сброс буфера, пока основной поток ждёт сеть или диалог."""
+        while not stop.wait(LOG_BATCH_INTERVAL):
+            self._flush_logs()
+
+    def _save_with_retry(self, *args, **kwargs) -> bool:
+        # BaseWorker пишет в progress напрямую — сначала выгружаем буфер, чтобы не нарушить порядок
+        self._flush_logs()
+        return super()._save_with_retry(*args, **kwargs)
+
     def run(self):
+        """Запуск переименования с фоновой отправкой лога пачками."""
+        stop = Event()
+        flusher = threading.Thread(
+            target=self._log_flush_loop, args=(stop,), name='rename-log-flush', daemon=True)
+        flusher.start()
+        try:
+            self._run_rename()
+        finally:
+            stop.set()
+            flusher.join()
+            self._flush_logs()
+
+    def _run_rename(self):
         """Основной метод выполнения переименования."""
         debug(f'Login attempt rename lang={self.lang}')
 
         try:
+            # Конфиг pywikibot пишет файлы — делаем это в потоке worker'а, а не в GUI
+            apply_pwb_config(self.lang, self.family)
             site = pywikibot.Site(self.lang, self.family)
         except Exception as e:
             self._set_failure(e)
@@ -343,18 +413,20 @@ class RenameWorker(BaseWorker):
 
         try:
             # Читаем как utf-8-sig и очищаем BOM/пробелы
+            # Формат строго Old<TAB>New[<TAB>Comment]: кавычки не экранируются, хватает str.split
             with open(self.tsv_path, newline='', encoding='utf-8-sig') as f:
-                reader = csv.reader(f, delimiter='\t')
-                rows = list(reader)
+                rows = [line.rstrip('\r\n').split('\t') for line in f]
                 # Инициализируем общий прогресс по числу строк файла
                 try:
                     self.tsv_progress_init.emit(len(rows))
                 except Exception:
                     pass
-                for row in rows:
+                # Очистка ячеек одним проходом до сетевого цикла
+                prepared = [(row, _normalize_tsv_row(row)) for row in rows]
+                for row, cells in prepared:
                     if self._stop:
                         break
-                    if len(row) < 2:
+                    if cells is None:
                         self._emitf(
                             'log.rename_worker.invalid_row',
                             'Invalid row (at least 2 columns required): {row}',
@@ -365,13 +437,7 @@ class RenameWorker(BaseWorker):
                         except Exception:
                             pass
                         continue
-                    old_name_raw = (row[0] or '').strip().lstrip('\ufeff')
-                    new_name_raw = (row[1] or '').strip().lstrip('\ufeff')
-                    reason = (
-                        (row[2] or '').strip().lstrip('\ufeff')
-                        if len(row) >= 3
-                        else ''
-                    )
+                    old_name_raw, new_name_raw, reason = cells
                     if not old_name_raw or not new_name_raw:
                         self._emitf(
                             'log.rename_worker.invalid_row',
@@ -387,16 +453,15 @@ class RenameWorker(BaseWorker):
                     self._current_row_reason = reason
 
                     # Нормализация имён по выбору пользователя
-                    sel = self.ns_sel
+                    ns_id = self._ns_id
                     is_category = False
                     try:
-                        if isinstance(sel, str) and sel.strip().lower() == 'auto':
+                        if ns_id is None:
                             old_name = old_name_raw
                             new_name = new_name_raw
                             # Определяем категорию по фактическому префиксу
                             is_category = title_has_ns_prefix(self.family, self.lang, old_name, {14})
                         else:
-                            ns_id = int(sel)
                             old_name = normalize_title_by_selection(old_name_raw, self.family, self.lang, ns_id)
                             new_name = normalize_title_by_selection(new_name_raw, self.family, self.lang, ns_id)
                             is_category = (ns_id == 14)
@@ -541,7 +606,7 @@ class RenameWorker(BaseWorker):
             if new_page.exists():
                 # Структурированное событие; текстовый лог используем только как фолбэк
                 try:
-                    self.log_event.emit({'type': 'destination_exists', 'title': new_name, 'status': 'info'})
+                    self._queue_log('event', {'type': 'destination_exists', 'title': new_name, 'status': 'info'})
                 except Exception:
                     try:
                         self._emitf(
@@ -599,7 +664,7 @@ class RenameWorker(BaseWorker):
                             redirect_left = False
                         if redirect_left:
                             try:
-                                self.log_event.emit({
+                                self._queue_log('event', {
                                     'type': 'redirect_retained',
                                     'old_title': old_name,
                                     'new_title': new_name,
@@ -633,9 +698,9 @@ class RenameWorker(BaseWorker):
                             if tail
                             else self._tr('log.rename_worker.rename_success', 'Renamed successfully')
                         )
-                        self.progress.emit(msg)
+                        self._queue_log('progress', msg)
                     except Exception:
-                        self.progress.emit(self._tr('log.rename_worker.rename_success', 'Renamed successfully'))
+                        self._queue_log('progress', self._tr('log.rename_worker.rename_success', 'Renamed successfully'))
                     return True
                 except Exception as e:
                     if self._is_rate_error(e) and attempt < 3:
@@ -775,7 +840,7 @@ class RenameWorker(BaseWorker):
                     try:
                         cnt = len(members_titles)
                         cnt_str = format_russian_pages_nominative(cnt)
-                        self.log_event.emit({'type': 'category_move_start', 'old_category': old_cat_full, 'new_category': new_cat_full, 'count': cnt, 'count_str': cnt_str, 'status': 'info'})
+                        self._queue_log('event', {'type': 'category_move_start', 'old_category': old_cat_full, 'new_category': new_cat_full, 'count': cnt, 'count_str': cnt_str, 'status': 'info'})
                     except Exception:
                         try:
                             self._emitf(
@@ -2584,7 +2649,8 @@ class RenameWorker(BaseWorker):
             self._prompt_events[req_id] = ev
             self._prompt_results[req_id] = {}
             
-            # Отправляем запрос на показ диалога
+            # Отправляем запрос на показ диалога (лог до него должен уже быть в UI)
+            self._flush_logs()
             self.template_review_request.emit({
                 'request_id': req_id,
                 'page_title': page_title,
@@ -5,9 +5,11 @@ Replace worker for updating existing pages in Wikimedia projects.
 import csv
 import re
 import pywikibot
+from PySide6.QtCore import Signal
 
 from .base_worker import BaseWorker
 from ..core.namespace_manager import normalize_title_by_selection
+from ..core.pywikibot_config import apply_pwb_config
 
 
 def _escape_wikitext_for_summary(text: str) -> str:
@@ -71,6 +73,9 @@ class ReplaceWorker(BaseWorker):
     Использует базовый класс для rate limiting и retry логики.
     """
 
+    # Число строк с непустым заголовком; считается в потоке worker'а до входа
+    pages_counted = Signal(int)
+
     def __init__(self, tsv_path, username, password, lang, family, ns_selection: str, summary, minor: bool):
         """
         Инициализация ReplaceWorker.
@@ -97,13 +102,34 @@ class ReplaceWorker(BaseWorker):
             'failed': 0,
             'invalid': 0,
         }
+        # Число страниц в TSV; None — ещё не подсчитано (0 — запускать нечего)
+        self.page_count = None
+
+    def _count_pages(self) -> int:
+        """Считает строки TSV с непустым заголовком, не держа файл в памяти."""
+        with open(self.tsv_path, newline='', encoding='utf-8-sig') as f:
+            return sum(1 for r in csv.reader(f, delimiter='\t') if r and (r[0] or '').strip())
 
     def run(self):
         """Основной метод выполнения замены страниц."""
         from ..utils import debug
+
+        try:
+            page_count = self._count_pages()
+        except Exception as e:
+            self._set_failure(e)
+            self.progress.emit(self._fmt('log.replace.tsv_error', error=e))
+            return
+        self.page_count = page_count
+        self.pages_counted.emit(page_count)
+        if page_count == 0:
+            return
+
         debug(f'Login attempt replace lang={self.lang}')
 
         try:
+            # Конфиг pywikibot пишет файлы — делаем это в потоке worker'а, а не в GUI
+            apply_pwb_config(self.lang, self.family)
             site = pywikibot.Site(self.lang, self.family)
         except Exception as e:
             self._set_failure(e)